@@ -0,0 +1,53 @@
+"""
+Bootstrap confidence intervals of the evaluation results on synthetic records:
+
+    python -m benchmarks.confidence_benchmark --games 1000000
+
+All intervals of a three-seat lineup over 1M games take about 0.75 s on a
+single core. The resampling itself is cheap, most of the time goes into
+counting the values of the roughly 140 per-game metrics, one bincount per
+metric group.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.evaluation_records import EvaluationRecords
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.wizard_environment import WizardEnvironment
+
+
+def random_records(num_games: int, num_seats: int, seed: int) -> EvaluationRecords:
+    rng = np.random.default_rng(seed)
+    records = EvaluationRecords.empty(num_games, num_seats)
+    # Wizard scores are multiples of ten
+    records.scores[:] = rng.integers(-30, 40, records.scores.shape) * 10
+    records.positions[:] = np.argsort(np.argsort(-records.scores, axis=1), axis=1) + 1
+    records.bets[:] = rng.integers(0, 4, records.bets.shape)
+    records.diffs[:] = rng.integers(-2, 3, records.diffs.shape)
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Confidence interval benchmark')
+    parser.add_argument('--games', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    lineup = [WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot]
+    env = WizardEnvironment()
+    env.records = random_records(args.games, len(lineup), 0)
+    env.stats = {p_class.__name__: {} for p_class in lineup}
+
+    start = time.perf_counter()
+    env._calculate_confidence_intervals(lineup)
+    elapsed = time.perf_counter() - start
+
+    print(f'{args.games} games, {env.ci_resamples} resamples: {elapsed:.3f} s')
+    for name, stats in env.stats.items():
+        print(f"  {name:<20} win rate CI {stats['win_rate_ci'][0]:.4f}-{stats['win_rate_ci'][1]:.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Engine throughput and memory benchmark.
+
+Plays games between simple bots and reports games/sec, best of ``--repeat``
+runs, and the peak RSS of the process. Every mode runs in its own subprocess
+so the peak RSS of one mode does not hide the other:
+
+    python -m benchmarks.engine_benchmark --games 300 --repeat 5
+"""
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import time
+
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.simple_agent import WizardSimpleBot
+from src.game.wizard_game import WizardGame
+
+LINEUP = [WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot, WizardDebugPlayer]
+MODES = ('fresh', 'reuse')
+
+
+def play(mode: str, num_games: int, seed: int) -> float:
+    """Play ``num_games`` games, creating a new game per game ('fresh') or resetting one ('reuse')."""
+    game = None
+    start = time.perf_counter()
+    for i in range(num_games):
+        random.seed(seed + i)
+        if mode == 'reuse' and game is not None:
+            game.reset()
+        else:
+            game = WizardGame()
+        for seat, p_class in enumerate(LINEUP):
+            game.add_player(p_class(f'{p_class.__name__}_{seat}'))
+        game.start_game()
+    return time.perf_counter() - start
+
+
+def run_mode(mode: str, num_games: int, seed: int, repeat: int) -> dict:
+    elapsed = min(play(mode, num_games, seed) for _ in range(repeat))
+    return {
+        'mode': mode,
+        'games': num_games,
+        'games_per_second': num_games / elapsed,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Wizard engine benchmark')
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--mode', choices=MODES, help='Run a single mode in this process')
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.games, args.seed, args.repeat)))
+        return
+
+    print(f'{"mode":<8} {"games":>8} {"games/s":>10} {"peak RSS (MB)":>14}')
+    for mode in MODES:
+        output = subprocess.run(
+            [
+                sys.executable, '-m', 'benchmarks.engine_benchmark', '--mode', mode, '--games', str(args.games),
+                '--seed', str(args.seed), '--repeat', str(args.repeat)
+            ],
+            check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output.splitlines()[-1])
+        print(f'{result["mode"]:<8} {result["games"]:>8} {result["games_per_second"]:>10.1f} {result["peak_rss_mb"]:>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
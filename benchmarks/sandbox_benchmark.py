@@ -0,0 +1,51 @@
+"""
+Cost of hosting agents in sandbox workers.
+
+Plays the same seeded games with simple bots in-process and sandboxed and
+reports the added time per sandboxed decision, best of ``--repeat`` runs:
+
+    python -m benchmarks.sandbox_benchmark --games 20
+"""
+import argparse
+import random
+import time
+
+from src.ai.sandbox import sandbox_stats, sandboxed, shutdown_sandboxes
+from src.ai.simple_agent import WizardSimpleBot
+from src.game.wizard_game import WizardGame
+
+
+def play(lineup, num_games: int, seed: int) -> float:
+    start = time.perf_counter()
+    for i in range(num_games):
+        random.seed(seed + i)
+        game = WizardGame()
+        for seat, p_class in enumerate(lineup):
+            game.add_player(p_class(f'{p_class.__name__}_{seat}'))
+        game.start_game()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sandbox overhead benchmark')
+    parser.add_argument('--games', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    boxed_class = sandboxed(WizardSimpleBot)
+    # Start the worker outside of the measurement
+    play([boxed_class, WizardSimpleBot, WizardSimpleBot], 1, args.seed)
+
+    plain = min(play([WizardSimpleBot] * 3, args.games, args.seed) for _ in range(args.repeat))
+    decisions = sandbox_stats()['WizardSimpleBot'].decisions
+    boxed = min(play([boxed_class] * 3, args.games, args.seed) for _ in range(args.repeat))
+    decisions = (sandbox_stats()['WizardSimpleBot'].decisions - decisions) // args.repeat
+    shutdown_sandboxes()
+
+    print(f'in-process {plain:.3f} s, sandboxed {boxed:.3f} s for {args.games} games')
+    print(f'{(boxed - plain) / decisions * 1e6:.1f} us added per sandboxed decision')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Batched trick resolution against Trick.determine_winner:
+
+    python -m benchmarks.trick_kernel_benchmark --tricks 100000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.core.player import WizardBasePlayer
+from src.core.trick import Trick
+from src.core.trick_kernel import NO_TRUMP, trick_winners
+from src.game.wizard_card import CardSuit, SUIT_INDEX, card_from_id, card_to_id
+from src.game.wizard_card_factory import create_wizard_cards
+
+
+class _Seat(WizardBasePlayer):
+    pass
+
+
+def random_tricks(num_tricks: int, num_seats: int, seed: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    deck = np.array([card_to_id(card) for card in create_wizard_cards()])
+    cards = np.stack([rng.choice(deck, num_seats, replace=False) for _ in range(num_tricks)])
+    trump = rng.integers(NO_TRUMP, len(CardSuit), num_tricks)
+    lead = rng.integers(0, num_seats, num_tricks)
+    return cards, trump, lead
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Trick resolution benchmark')
+    parser.add_argument('--tricks', type=int, default=100_000)
+    parser.add_argument('--seats', type=int, default=4)
+    args = parser.parse_args()
+
+    cards, trump, lead = random_tricks(args.tricks, args.seats, 0)
+    suits = {index: suit for suit, index in SUIT_INDEX.items()}
+    seats = [_Seat(f'seat_{i}') for i in range(args.seats)]
+
+    start = time.perf_counter()
+    for row, trump_index, leader in zip(cards.tolist(), trump.tolist(), lead.tolist()):
+        order = [(leader + i) % args.seats for i in range(args.seats)]
+        trick = Trick([seats[s] for s in order], {}, suits.get(trump_index), lambda player: None)
+        for s in order:
+            trick.trick_cards[seats[s]] = card_from_id(row[s])
+        trick.determine_winner()
+    python_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    trick_winners(cards, trump, lead)
+    kernel_time = time.perf_counter() - start
+
+    print(f'determine_winner: {args.tricks / python_time:12.0f} tricks/s')
+    print(f'trick_winners:    {args.tricks / kernel_time:12.0f} tricks/s')
+
+
+if __name__ == '__main__':
+    main()
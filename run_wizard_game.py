@@ -4,8 +4,10 @@ import matplotlib.pyplot as plt
 from src.ai.debug_agent import WizardDebugPlayer
 from src.ai.simple_agent import WizardSimpleBot
 from src.ai.terminal_player import ConsoleHumanPlayer
+from src.ai.telemetry import Telemetry
 from src.ai.wizard_environment import WizardEnvironment
 from src.ai.adrian_agent import WizardAdrianPlayerV01
+from src.ai.pondering import pondering
 
 import logging
 
@@ -24,11 +26,14 @@ def setup_logging():
     logging.getLogger('src.core.trick').setLevel(logging.WARNING)
 
 def run_evaluation(player_classes: List[Type], num_games: int):
-    env = WizardEnvironment()
-    results = env.evaluate_players(
-        player_classes=player_classes,
-        num_games=num_games
-    )
+    # The telemetry feeds the worker utilization of the live view
+    with Telemetry() as telemetry:
+        env = WizardEnvironment(telemetry=telemetry)
+        results = env.evaluate_players(
+            player_classes=player_classes,
+            num_games=num_games,
+            live=True
+        )
     env.print_results()
 
     plot_bet_accuracy(results, 'bet_accuracy.png')
@@ -85,10 +90,11 @@ def run_single_game():
     logging.getLogger('src.core.trick').setLevel(logging.INFO)
 
     game = WizardGame()
-    game.add_player(WizardAdrianPlayerV01('Adrian'))
+    game.add_player(pondering(WizardAdrianPlayerV01)('Adrian'))
     game.add_player(WizardSimpleBot('Bot'))
     game.add_player(ConsoleHumanPlayer('Me'))
-    game.start_game()
+    # Adrian precomputes its answers while the console waits for input
+    game.start_game_pondering()
 
 def main():
     setup_logging()
@@ -3,11 +3,19 @@ from collections import Counter
 
 from src.core.turn import valid_cards
 from src.game.game_state import GameState
+from src.ai.win_probability import card_win_probability
 from src.game.wizard_card import CardSuit, CardType, WizardCard
 from src.core.player import WizardBasePlayer
 
 
 class WizardAdrianPlayerV01(WizardBasePlayer):
+    # Tunable constants, see src/ai/sweep.py
+    high_card_round = 20
+    high_card_value = 10
+    win_points = 30
+    lose_points = -10
+    ev_threshold = 0
+
     def __init__(self, name: str):
         super().__init__(name)
         self._tricks_won = None
@@ -17,15 +25,15 @@ class WizardAdrianPlayerV01(WizardBasePlayer):
         bid = 0
         hand = state.hand
 
-        if state.current_round_number == 1 and self.expected_value(state) > 0:
+        if state.current_round_number == 1 and self.expected_value(state) > self.ev_threshold:
             return 1
 
 
         bid += len([c for c in hand if c.card_type == CardType.WIZARD])
         bid += len([c for c in hand if state.trump_suit and c.card_suit == state.trump_suit])
 
-        if state.current_round_number == 20:
-            bid += len([c for c in hand if c.card_value and c.card_value >= 10])
+        if state.current_round_number == self.high_card_round:
+            bid += len([c for c in hand if c.card_value and c.card_value >= self.high_card_value])
         else:
             bid += len([c for c in hand if c.card_value == 13 and c.card_suit != state.trump_suit])
 
@@ -79,35 +87,18 @@ class WizardAdrianPlayerV01(WizardBasePlayer):
 
 
 
-    def expected_value(self, state):
-        card = state.hand[0]
-        remaining_cards = 60 - 2
-        players = len(state.players)
-        prob_win = 1.0
-        win_points = 30
-        lose_points = -10
-
-        if card.card_type == CardType.WIZARD:
-            winning_cards = state.players.index(self) - 1  # Only previous player can win with a Wizard
-        elif card.card_type == CardType.JESTER:
-            # winning_cards = 56                          # Every card beats Jester except Jester
-            return -1  # Chance too low
-        elif card.card_suit == state.trump_suit:
-            winning_cards = 4 + 13 - card.card_value    # Wizard and higher trump cards are better
-        else:
-            winning_cards = (4 + 13 - 1) # Wizards and Trump Cards - 1 that's been flipped
-            if state.players.index(self) == 0:
-                winning_cards += 13 - card.card_value
-            else:
-                return -1  # Chance too low
-
-        safe_cards = remaining_cards - winning_cards
-
-        for i in range(players-1):
-            prob_win *= (safe_cards - i) / (remaining_cards - i)
-
+    def expected_value(self, state, card: WizardCard | None = None):
+        """Expected score of bidding one trick on ``card`` (default: the first card in hand)."""
+        prob_win = card_win_probability(
+            card or state.hand[0],
+            state.hand,
+            state.trump_card,
+            state.played_cards,
+            state.players.index(self),
+            len(state.players),
+            trump_suit=state.trump_suit
+        )
         prob_lose = 1 - prob_win
-        expected = prob_win * win_points + prob_lose * lose_points
+        expected = prob_win * self.win_points + prob_lose * self.lose_points
 
         return expected
-
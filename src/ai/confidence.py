@@ -0,0 +1,155 @@
+from statistics import NormalDist
+
+import numpy as np
+
+# Two-sided 95% quantile of the standard normal distribution
+Z_95 = 1.959963984540054
+
+
+def wilson_interval(successes: np.ndarray | int, n: np.ndarray | int, z: float = Z_95) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Wilson score interval of a binomial proportion, element-wise.
+
+    Unlike the normal approximation it stays inside [0, 1] and is usable for
+    rates close to 0 or 1 and small ``n``. Empty counts give [0, 1].
+    """
+    successes = np.asarray(successes, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    safe_n = np.maximum(n, 1)
+    p = successes / safe_n
+    denominator = 1 + z ** 2 / safe_n
+    center = (p + z ** 2 / (2 * safe_n)) / denominator
+    half_width = z * np.sqrt(p * (1 - p) / safe_n + z ** 2 / (4 * safe_n ** 2)) / denominator
+    empty = n == 0
+    return np.where(empty, 0.0, center - half_width), np.where(empty, 1.0, center + half_width)
+
+
+def mean_interval(
+        total: np.ndarray | float,
+        total_squares: np.ndarray | float,
+        n: np.ndarray | int,
+        z: float = Z_95
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Mean and normal confidence interval from running sums, element-wise.
+
+    Uses the sample standard deviation; with fewer than two samples the
+    interval collapses to the mean.
+    """
+    total = np.asarray(total, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    safe_n = np.maximum(n, 1)
+    mean = total / safe_n
+    variance = np.maximum(np.asarray(total_squares, dtype=np.float64) - safe_n * mean ** 2, 0) / np.maximum(n - 1, 1)
+    half_width = z * np.sqrt(variance / safe_n)
+    return mean, mean - half_width, mean + half_width
+
+
+def _resampled_means(
+        samples: np.ndarray,
+        scale: float,
+        num_resamples: int,
+        rng: np.random.Generator | None
+) -> np.ndarray | None:
+    """
+    Means of ``samples / scale`` for every resample and column.
+
+    Resampling G games with replacement only changes how often every
+    distinct value occurs, so each resample is drawn as multinomial counts
+    over the distinct values. That is the same distribution; after one
+    counting pass over the games the draws cost O(num_resamples x columns x
+    distinct values), independent of the number of games. All columns are
+    drawn in one call, over the values present in any column.
+
+    :return: (num_resamples, K) array, None without games
+    """
+    rng = rng if rng is not None else np.random.default_rng(0)
+    num_games = len(samples)
+    if num_games == 0:
+        return None
+
+    counts, lowest = _value_counts(samples.reshape(num_games, -1))
+    present = np.flatnonzero(counts.any(axis=0))
+    values = (present + lowest) / scale
+    draws = rng.multinomial(num_games, counts[:, present] / num_games, size=(num_resamples, len(counts)))
+    return draws @ values / num_games
+
+
+def _value_counts(samples: np.ndarray, block_size: int = 1 << 16) -> tuple[np.ndarray, int]:
+    """
+    Occurrences of every value in every column of a (G, K) integer array.
+
+    All columns are counted by one bincount: column k is shifted into its own
+    range of bins, ``k * width`` above the smallest value. Blocks of games
+    keep the shifted copy small, the games never need to be transposed.
+
+    :return: (K, width) counts of the values ``lowest + i`` in column i, and lowest
+    """
+    num_columns = samples.shape[1]
+    lowest = int(samples.min())
+    width = int(samples.max()) - lowest + 1
+    offsets = np.arange(num_columns, dtype=np.intp) * width - lowest
+    counts = np.zeros(num_columns * width, dtype=np.intp)
+    for start in range(0, len(samples), block_size):
+        counts += np.bincount((samples[start:start + block_size] + offsets).ravel(), minlength=len(counts))
+    return counts.reshape(num_columns, width), lowest
+
+
+def bootstrap_mean_interval(
+        samples: np.ndarray,
+        scale: float = 1.0,
+        num_resamples: int = 1000,
+        confidence: float = 0.95,
+        rng: np.random.Generator | None = None
+) -> np.ndarray:
+    """
+    Percentile bootstrap interval of the mean of ``samples / scale`` for every column.
+
+    ``samples`` holds one integer per game, shape (G,) or (G, K) for K
+    metrics, see _resampled_means for how games are resampled.
+
+    :return: (2,) or (K, 2) array of lower and upper bounds, NaN without games
+    """
+    samples = np.asarray(samples)
+    return _percentiles(_resampled_means(samples, scale, num_resamples, rng), samples.shape[1:], confidence)
+
+
+def std_interval(samples: np.ndarray, confidence: float = 0.95) -> np.ndarray:
+    """
+    Normal confidence interval of the standard deviation (``ddof=0``, like np.std) of ``samples``.
+
+    ``samples`` holds one value per game, shape (G,), or S values per game,
+    shape (G, S), pooled like the seats of one agent. The standard error
+    follows from the delta method on the per-game means of the values and
+    of their squares, so games stay the unit of sampling. Counting distinct
+    values like bootstrap_mean_interval does not work for a bootstrap here,
+    pooled seats would need every distinct combination of their values.
+
+    :return: (2,) array of lower and upper bounds, NaN without games
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    num_games = len(samples)
+    if num_games == 0:
+        return np.full(2, np.nan)
+
+    values = samples.reshape(num_games, -1)
+    # Per-game means of the values and of their squares, one row each
+    moments = np.stack([values.sum(axis=1), np.square(values).sum(axis=1)]) / values.shape[1]
+    mean, mean_square = moments.mean(axis=1)
+    std = np.sqrt(max(mean_square - mean ** 2, 0))
+    if num_games < 2 or std == 0:
+        return np.full(2, std)
+
+    # Gradient of sqrt(m2 - m1^2) with respect to the two moments
+    gradient = np.array([-mean / std, 0.5 / std])
+    centered = moments - [[mean], [mean_square]]
+    covariance = centered @ centered.T / ((num_games - 1) * num_games)
+    half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * np.sqrt(gradient @ covariance @ gradient)
+    return np.array([max(std - half_width, 0), std + half_width])
+
+
+def _percentiles(statistics: np.ndarray | None, shape: tuple[int, ...], confidence: float) -> np.ndarray:
+    if statistics is None:
+        return np.full(shape + (2,), np.nan)
+    alpha = (1 - confidence) / 2
+    return np.quantile(statistics, [alpha, 1 - alpha], axis=0).T.reshape(shape + (2,))
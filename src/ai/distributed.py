@@ -0,0 +1,251 @@
+import argparse
+import ipaddress
+import itertools
+import logging
+import os
+import secrets
+import socket
+import threading
+from collections import deque
+from dataclasses import fields
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Sequence, Type
+
+import numpy as np
+
+from src.ai.evaluation_records import EvaluationRecords
+from src.core.player import WizardBasePlayer
+
+# Environment variable holding the key coordinator and workers authenticate each other with
+AUTHKEY_ENV = 'WIZARD_EVALUATION_AUTHKEY'
+
+
+def authkey_from_env() -> bytes | None:
+    value = os.environ.get(AUTHKEY_ENV)
+    return value.encode() if value else None
+
+
+def is_loopback(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(socket.gethostbyname(host)).is_loopback
+    except (OSError, ValueError):
+        return False
+
+
+class _Job:
+    """Seed chunks of one evaluation and the bookkeeping of who is working on them."""
+
+    def __init__(self, player_classes: Sequence[Type[WizardBasePlayer]], seeds: range, chunk_size: int):
+        self.player_classes = list(player_classes)
+        self.chunks = [range(start, min(start + chunk_size, seeds.stop)) for start in range(seeds.start, seeds.stop, chunk_size)]
+        self.queue: deque[range] = deque(self.chunks)
+        self.assigned: dict[range, set[int]] = {}
+        self.results: dict[range, EvaluationRecords] = {}
+
+    @property
+    def finished(self) -> bool:
+        return len(self.results) == len(self.chunks)
+
+    def take(self, worker_id: int) -> range | None:
+        if self.queue:
+            chunk = self.queue.popleft()
+        else:
+            # Work stealing: back up the least replicated unfinished chunk of another worker
+            candidates = [
+                chunk for chunk, workers in self.assigned.items()
+                if chunk not in self.results and worker_id not in workers
+            ]
+            if not candidates:
+                return None
+            chunk = min(candidates, key=lambda c: len(self.assigned[c]))
+
+        self.assigned.setdefault(chunk, set()).add(worker_id)
+        return chunk
+
+    def complete(self, chunk: range, worker_id: int, records: EvaluationRecords) -> bool:
+        self.assigned.get(chunk, set()).discard(worker_id)
+        if chunk in self.results:
+            return False
+        self.results[chunk] = records
+        return True
+
+    def release(self, worker_id: int):
+        """Return the unfinished chunks of a lost worker to the queue."""
+        for chunk, workers in self.assigned.items():
+            if worker_id in workers:
+                workers.discard(worker_id)
+                if not workers and chunk not in self.results and chunk not in self.queue:
+                    self.queue.appendleft(chunk)
+
+
+class EvaluationCoordinator:
+    """
+    Hand out seed ranges of an evaluation to worker processes on other hosts.
+
+    Workers connect with ``run_worker`` and stay connected across runs. Each
+    run is split into chunks of ``chunk_size`` seeds; an idle worker gets a
+    queued chunk or, once the queue is empty, a backup copy of a chunk still
+    running elsewhere (first result wins), so stragglers do not hold up the
+    run. Chunks of workers whose connection drops are queued again.
+
+    Connections unpickle what they receive, so the authkey is all that keeps
+    other hosts from running code on the coordinator. Without ``authkey`` the
+    key is read from the WIZARD_EVALUATION_AUTHKEY environment variable; if
+    that is not set either, a random key is generated and printed once, which
+    is only allowed when listening on a loopback address.
+    """
+
+    def __init__(
+            self,
+            address: tuple[str, int] = ('127.0.0.1', 0),
+            authkey: bytes | None = None,
+            chunk_size: int = 100
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.chunk_size = chunk_size
+
+        authkey = authkey if authkey is not None else authkey_from_env()
+        if authkey is None:
+            if not is_loopback(address[0]):
+                raise ValueError(f'Listening on {address[0]!r} requires an authkey or {AUTHKEY_ENV}')
+            authkey = secrets.token_hex(16).encode()
+            print(f'Evaluation coordinator authkey: {authkey.decode()}')
+        self.authkey = authkey
+        self._listener = Listener(address, authkey=authkey)
+        self._condition = threading.Condition()
+        self._job: _Job | None = None
+        self._closed = False
+        self._worker_ids = itertools.count()
+        self.workers: dict[int, str] = {}
+
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._listener.address
+
+    def run(self, player_classes: Sequence[Type[WizardBasePlayer]], seeds: range) -> EvaluationRecords:
+        """Evaluate the lineup for every seed on the connected workers, sorted by seed."""
+        job = _Job(player_classes, seeds, self.chunk_size)
+        with self._condition:
+            if self._job is not None:
+                raise RuntimeError('The coordinator is already running an evaluation')
+            self._job = job
+            self._condition.notify_all()
+
+            while not job.finished:
+                if self._closed:
+                    raise RuntimeError('The coordinator was closed during an evaluation')
+                self._condition.wait()
+            self._job = None
+
+        return EvaluationRecords.concatenate([job.results[chunk] for chunk in job.chunks])
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._listener.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _accept_loop(self):
+        while True:
+            try:
+                connection = self._listener.accept()
+            except AuthenticationError as e:
+                self.logger.warning(f'Rejected evaluation worker: {e}')
+                continue
+            except (OSError, EOFError):
+                if self._closed:
+                    return
+                continue
+            worker_id = next(self._worker_ids)
+            threading.Thread(target=self._serve, args=(connection, worker_id), daemon=True).start()
+
+    def _next_task(self, worker_id: int) -> tuple[_Job, range] | None:
+        with self._condition:
+            while not self._closed:
+                if self._job is not None and not self._job.finished:
+                    chunk = self._job.take(worker_id)
+                    if chunk is not None:
+                        return self._job, chunk
+                self._condition.wait()
+        return None
+
+    def _serve(self, connection: Connection, worker_id: int):
+        job = None
+        try:
+            _, host = connection.recv()
+            self.workers[worker_id] = host
+
+            while (task := self._next_task(worker_id)) is not None:
+                job, chunk = task
+                connection.send(('task', job.player_classes, chunk.start, chunk.stop))
+                _, arrays = connection.recv()
+
+                with self._condition:
+                    if job.complete(chunk, worker_id, EvaluationRecords(**arrays)):
+                        self.logger.debug(f'Worker {worker_id} completed seeds {chunk.start}-{chunk.stop - 1}')
+                    self._condition.notify_all()
+
+            connection.send(('close',))
+        except Exception as e:
+            # A dropped connection or a reply that cannot be loaded, either way its chunks go back to the queue
+            self.logger.warning(f'Lost evaluation worker {worker_id}: {e!r}')
+            with self._condition:
+                if job is not None:
+                    job.release(worker_id)
+                self._condition.notify_all()
+        finally:
+            self.workers.pop(worker_id, None)
+            connection.close()
+
+
+def run_worker(address: tuple[str, int], authkey: bytes | None = None, local_workers: int = 0, name: str = ''):
+    """
+    Connect to a coordinator and evaluate the seed ranges it hands out until it closes.
+
+    The authkey defaults to the WIZARD_EVALUATION_AUTHKEY environment variable.
+    """
+    from src.ai.wizard_environment import WizardEnvironment
+
+    authkey = authkey if authkey is not None else authkey_from_env()
+    if authkey is None:
+        raise ValueError(f'An authkey or {AUTHKEY_ENV} is required to connect to a coordinator')
+
+    environment = WizardEnvironment()
+    with Client(address, authkey=authkey) as connection:
+        connection.send(('hello', name))
+        while True:
+            message = connection.recv()
+            if message[0] == 'close':
+                return
+
+            _, player_classes, start, stop = message
+            records = environment.simulate(player_classes, range(start, stop), local_workers)
+            connection.send(('result', {f.name: np.ascontiguousarray(getattr(records, f.name)) for f in fields(records)}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Evaluation worker connecting to an EvaluationCoordinator')
+    parser.add_argument('host')
+    parser.add_argument('port', type=int)
+    parser.add_argument('--authkey', help=f'Key printed by the coordinator, defaults to ${AUTHKEY_ENV}')
+    parser.add_argument('--local-workers', type=int, default=0)
+    parser.add_argument('--name', default='')
+    args = parser.parse_args()
+
+    authkey = args.authkey.encode() if args.authkey else authkey_from_env()
+    if authkey is None:
+        parser.error(f'--authkey or {AUTHKEY_ENV} is required')
+    run_worker((args.host, args.port), authkey, args.local_workers, args.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, fields
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from src.core.player import WizardBasePlayer
+from src.game.wizard_game import WizardGame
+
+# Seed value stored for games that were played without seeding
+NO_SEED = -1
+
+
+def rank_players(scores: Mapping[WizardBasePlayer, int]) -> list[tuple[int, WizardBasePlayer, int]]:
+    """Final ranking of a game as (position, player, score), best first. Positions start at 1."""
+    sorted_players = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    return [(position, player, score) for position, (player, score) in enumerate(sorted_players, 1)]
+
+
+@dataclass
+class EvaluationRecords:
+    """
+    Per-game results of one evaluation lineup stored as arrays.
+
+    Seats are indexed in lineup order (the order of ``player_classes``) and
+    rounds from 0, so ``bets[g, s, r]`` is the bet of seat ``s`` in round
+    ``r + 1`` of game ``g``.
+    """
+    seeds: np.ndarray  # (G,) int64
+    scores: np.ndarray  # (G, S) int32
+    positions: np.ndarray  # (G, S) int8
+    bets: np.ndarray  # (G, S, R) int8
+    diffs: np.ndarray  # (G, S, R) int8
+    round_scores: np.ndarray  # (G, S, R) int16
+
+    @classmethod
+    def empty(cls, num_games: int, num_seats: int) -> EvaluationRecords:
+        num_rounds = 60 // num_seats
+        return cls(
+            seeds=np.full(num_games, NO_SEED, dtype=np.int64),
+            scores=np.zeros((num_games, num_seats), dtype=np.int32),
+            positions=np.zeros((num_games, num_seats), dtype=np.int8),
+            bets=np.zeros((num_games, num_seats, num_rounds), dtype=np.int8),
+            diffs=np.zeros((num_games, num_seats, num_rounds), dtype=np.int8),
+            round_scores=np.zeros((num_games, num_seats, num_rounds), dtype=np.int16),
+        )
+
+    @classmethod
+    def concatenate(cls, records: Sequence[EvaluationRecords]) -> EvaluationRecords:
+        return cls(**{
+            f.name: np.concatenate([getattr(r, f.name) for r in records])
+            for f in fields(cls)
+        })
+
+    @classmethod
+    def load(cls, path: str) -> EvaluationRecords:
+        with np.load(path) as data:
+            return cls(**{f.name: data[f.name] for f in fields(cls)})
+
+    def save(self, path: str):
+        # Write next to the target and rename, so readers never see partial files
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **{f.name: getattr(self, f.name) for f in fields(self)})
+        os.replace(tmp_path, path)
+
+    def copy(self) -> EvaluationRecords:
+        return EvaluationRecords(**{f.name: getattr(self, f.name).copy() for f in fields(self)})
+
+    def __len__(self) -> int:
+        return len(self.seeds)
+
+    def __getitem__(self, index) -> EvaluationRecords:
+        return EvaluationRecords(**{f.name: getattr(self, f.name)[index] for f in fields(self)})
+
+    @property
+    def num_seats(self) -> int:
+        return self.scores.shape[1]
+
+    def record_game(self, index: int, game: WizardGame, seats: Mapping[WizardBasePlayer, int], seed: int | None):
+        """Store the results of a finished game in row ``index``."""
+        self.seeds[index] = NO_SEED if seed is None else seed
+
+        for position, player, score in rank_players(game.current_scores):
+            seat = seats[player]
+            self.scores[index, seat] = score
+            self.positions[index, seat] = position
+
+        round_scores = game.round_scores
+        for round_num, bets in game.bets_history.items():
+            for player, bet_info in bets.items():
+                seat = seats[player]
+                self.bets[index, seat, round_num - 1] = bet_info['bet']
+                self.diffs[index, seat, round_num - 1] = bet_info['diff']
+                self.round_scores[index, seat, round_num - 1] = round_scores[round_num][player]
@@ -7,7 +7,7 @@ from src.game.wizard_card import WizardCard, CardSuit
 
 
 class HumanPlayer(WizardBasePlayer, ABC):
-
+    blocking = True
 
     def __init__(self, name: str):
         super().__init__(name)
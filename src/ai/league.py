@@ -0,0 +1,215 @@
+import math
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Mapping, Sequence, Type
+
+from src.ai.evaluation_records import rank_players
+from src.core.player import WizardBasePlayer
+from src.game.opponent_model import OpponentModel
+from src.game.wizard_game import WizardGame
+
+DEFAULT_MU = 25.0
+DEFAULT_SIGMA = DEFAULT_MU / 3
+DEFAULT_BETA = DEFAULT_SIGMA / 2
+# Lower bound for the variance shrink factor, keeps sigma from collapsing
+KAPPA = 1e-4
+
+
+@dataclass
+class Rating:
+    mu: float = DEFAULT_MU
+    sigma: float = DEFAULT_SIGMA
+    games: int = 0
+
+    @property
+    def conservative(self) -> float:
+        return self.mu - 3 * self.sigma
+
+
+def update_ratings(ratings: Sequence[Rating], ranks: Sequence[int], beta: float = DEFAULT_BETA):
+    """
+    Update the ratings of one game in place from the final ranks (1 is best, ties share a rank).
+
+    Uses the Bradley-Terry full-pairing update of Weng & Lin (2011): every
+    player is compared with every other player at the table.
+    """
+    deltas = []
+    for i, rating_i in enumerate(ratings):
+        omega = 0.0
+        delta = 0.0
+        for q, rating_q in enumerate(ratings):
+            if q == i:
+                continue
+            c = math.sqrt(rating_i.sigma ** 2 + rating_q.sigma ** 2 + 2 * beta ** 2)
+            p_iq = 1 / (1 + math.exp((rating_q.mu - rating_i.mu) / c))
+            s = 1.0 if ranks[i] < ranks[q] else 0.5 if ranks[i] == ranks[q] else 0.0
+            gamma = rating_i.sigma / c
+            omega += rating_i.sigma ** 2 / c * (s - p_iq)
+            delta += gamma * (rating_i.sigma / c) ** 2 * p_iq * (1 - p_iq)
+        deltas.append((omega, delta))
+
+    for rating, (omega, delta) in zip(ratings, deltas):
+        rating.mu += omega
+        rating.sigma *= math.sqrt(max(1 - delta, KAPPA))
+        rating.games += 1
+
+
+def play_league_game(
+        lineup: Sequence[tuple[str, Type[WizardBasePlayer]]],
+        seed: int | None = None,
+        opponent_model: OpponentModel | None = None
+) -> dict[str, int]:
+    """Play one game between the named agents and return the final score per agent name."""
+    return _play_league_game(lineup, seed, opponent_model)[0]
+
+
+def _play_league_game(
+        lineup: Sequence[tuple[str, Type[WizardBasePlayer]]],
+        seed: int | None,
+        opponent_model: OpponentModel | None
+) -> tuple[dict[str, int], list[tuple[int, dict[str, tuple[int, int]]]]]:
+    """Also return ``(round_number, {name: (bet, won)})`` per round, to update the opponent model of the league."""
+    if seed is not None:
+        random.seed(seed)
+
+    game = WizardGame(opponent_model)
+    for name, p_class in lineup:
+        game.add_player(p_class(name))
+    game.start_game()
+
+    rounds = [
+        (round_number, {player.name: (bets['bet'], bets['bet'] + bets['diff']) for player, bets in history.items()})
+        for round_number, history in game.bets_history.items()
+    ]
+    return {player.name: score for _, player, score in rank_players(game.current_scores)}, rounds
+
+
+@dataclass
+class LeagueGame:
+    lineup: list[str]
+    scores: dict[str, int]
+    ranks: dict[str, int] = field(default_factory=dict)
+
+
+class WizardLeague:
+    """
+    League over a pool of agents with online ratings.
+
+    Lineups and table sizes are sampled from the pool, favouring agents whose
+    rating is uncertain and opponents of similar strength, which are the
+    games that reduce rating error the most. Games run on a worker pool and
+    ratings are updated as soon as each result comes back.
+
+    All games share ``opponent_model``. Games on workers start from a copy
+    of it and their rounds are added to the league's model when they finish.
+    """
+
+    def __init__(
+            self,
+            agents: Mapping[str, Type[WizardBasePlayer]] | Sequence[Type[WizardBasePlayer]],
+            table_sizes: Sequence[int] = (3, 4, 5, 6),
+            beta: float = DEFAULT_BETA,
+            seed: int | None = None
+    ):
+        if not isinstance(agents, Mapping):
+            agents = {p_class.__name__: p_class for p_class in agents}
+        self.agents: dict[str, Type[WizardBasePlayer]] = dict(agents)
+
+        self.table_sizes = [size for size in table_sizes if 3 <= size <= min(6, len(self.agents))]
+        if not self.table_sizes:
+            raise ValueError('The agent pool is too small for any table size')
+
+        self.beta = beta
+        self.ratings: dict[str, Rating] = {name: Rating() for name in self.agents}
+        self.history: list[LeagueGame] = []
+        self.opponent_model = OpponentModel()
+        self._random = random.Random(seed)
+
+    def add_agent(self, name: str, p_class: Type[WizardBasePlayer]):
+        self.agents[name] = p_class
+        self.ratings.setdefault(name, Rating())
+
+    def sample_lineup(self) -> list[str]:
+        """Sample a lineup, weighting agents by uncertainty and closeness to the first pick."""
+        size = self._random.choice(self.table_sizes)
+        names = list(self.agents)
+
+        first = self._weighted_choice(names, [self.ratings[name].sigma ** 2 for name in names])
+        lineup = [first]
+        anchor = self.ratings[first]
+
+        while len(lineup) < size:
+            candidates = [name for name in names if name not in lineup]
+            weights = []
+            for name in candidates:
+                rating = self.ratings[name]
+                c2 = anchor.sigma ** 2 + rating.sigma ** 2 + 2 * self.beta ** 2
+                weights.append(rating.sigma ** 2 * math.exp(-(rating.mu - anchor.mu) ** 2 / (2 * c2)))
+            lineup.append(self._weighted_choice(candidates, weights))
+
+        self._random.shuffle(lineup)
+        return lineup
+
+    def _weighted_choice(self, names: list[str], weights: list[float]) -> str:
+        return self._random.choices(names, weights=weights)[0]
+
+    def record(self, lineup: Sequence[str], scores: Mapping[str, int]) -> LeagueGame:
+        """Update the ratings from a finished game. Equal scores count as a tie."""
+        distinct_scores = sorted(set(scores.values()), reverse=True)
+        ranks = {name: distinct_scores.index(scores[name]) + 1 for name in lineup}
+
+        update_ratings([self.ratings[name] for name in lineup], [ranks[name] for name in lineup], self.beta)
+
+        game = LeagueGame(list(lineup), dict(scores), ranks)
+        self.history.append(game)
+        return game
+
+    def run(self, num_games: int, workers: int = 0, in_flight: int | None = None) -> dict[str, Rating]:
+        """
+        Play ``num_games`` league games and return the ratings.
+
+        With ``workers`` > 0 games run in a process pool; at most ``in_flight``
+        games (default two per worker) are scheduled ahead so new lineups are
+        always sampled from nearly up to date ratings.
+        """
+        if workers <= 0:
+            for _ in range(num_games):
+                lineup = self.sample_lineup()
+                scores = play_league_game(self._lineup_classes(lineup), self._random.getrandbits(32), self.opponent_model)
+                self.record(lineup, scores)
+            return self.ratings
+
+        in_flight = in_flight or 2 * workers
+        scheduled = 0
+        with ProcessPoolExecutor(workers) as executor:
+            pending = {}
+            while scheduled < num_games or pending:
+                while scheduled < num_games and len(pending) < in_flight:
+                    lineup = self.sample_lineup()
+                    future = executor.submit(
+                        _play_league_game, self._lineup_classes(lineup), self._random.getrandbits(32), self.opponent_model
+                    )
+                    pending[future] = lineup
+                    scheduled += 1
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    scores, rounds = future.result()
+                    self.opponent_model.record_rounds(rounds)
+                    self.record(pending.pop(future), scores)
+
+        return self.ratings
+
+    def _lineup_classes(self, lineup: Sequence[str]) -> list[tuple[str, Type[WizardBasePlayer]]]:
+        return [(name, self.agents[name]) for name in lineup]
+
+    def leaderboard(self) -> list[tuple[str, Rating]]:
+        return sorted(self.ratings.items(), key=lambda item: item[1].conservative, reverse=True)
+
+    def print_leaderboard(self):
+        print('\nLeague Leaderboard:')
+        print('-' * 80)
+        for position, (name, rating) in enumerate(self.leaderboard(), 1):
+            print(f'{position:>3}. {name:<30} mu={rating.mu:6.2f} sigma={rating.sigma:5.2f} games={rating.games}')
+        print('-' * 80)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import Sequence, TextIO
+
+import numpy as np
+
+from src.ai.confidence import mean_interval, wilson_interval
+from src.ai.evaluation_records import EvaluationRecords
+from src.ai.pipeline import ResultConsumer
+from src.ai.telemetry import Telemetry
+
+# ANSI sequence clearing from the cursor to the end of the screen
+_CLEAR = '\x1b[J'
+
+
+def _up(lines: int) -> str:
+    """ANSI sequence moving the cursor to the start of the line ``lines`` lines up."""
+    return f'\x1b[{lines}F' if lines else ''
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    return f'{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}'
+
+
+class LiveProgress(ResultConsumer):
+    """
+    Live terminal view of a running evaluation.
+
+    Shows games per second, the ETA, the utilization of every worker (from
+    ``telemetry``, if the evaluation has one, otherwise the games every
+    worker finished, see ``watch_workers``) and interim win rates and mean
+    scores with 95% confidence intervals per agent, from running sums over
+    the streamed results. Seats of the same agent are pooled like in the
+    environment's stats. A background thread redraws the view every
+    ``interval`` seconds, so a stalled run still shows its rate falling;
+    on a terminal the view is redrawn in place, otherwise every frame is
+    printed below the last.
+    """
+
+    def __init__(
+            self,
+            total_games: int,
+            agent_names: Sequence[str],
+            telemetry: Telemetry | None = None,
+            interval: float = 0.5,
+            stream: TextIO | None = None
+    ):
+        self.total_games = total_games
+        self.telemetry = telemetry
+        self.interval = interval
+        self.stream = stream if stream is not None else sys.stdout
+        self.frames = 0
+
+        self.names = list(dict.fromkeys(agent_names))
+        self._agent_of_seat = np.array([self.names.index(name) for name in agent_names])
+        num_agents = len(self.names)
+        self.completed = 0
+        self._games = np.zeros(num_agents, dtype=np.int64)
+        self._wins = np.zeros(num_agents, dtype=np.int64)
+        self._score_sum = np.zeros(num_agents, dtype=np.float64)
+        self._score_squares = np.zeros(num_agents, dtype=np.float64)
+        self._worker_progress: tuple[np.ndarray, np.ndarray] | None = None
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start_time = 0.0
+        self._lines = 0
+        self._in_place = hasattr(self.stream, 'isatty') and self.stream.isatty()
+
+    def start(self):
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._render_loop, name='live-progress', daemon=True)
+        self._thread.start()
+
+    def consume(self, records: EvaluationRecords):
+        scores = records.scores.astype(np.float64)
+        wins = records.scores == records.scores.max(axis=1, keepdims=True)
+        seats = self._agent_of_seat
+        with self._lock:
+            self.completed += len(records)
+            np.add.at(self._games, seats, len(records))
+            np.add.at(self._wins, seats, wins.sum(axis=0))
+            np.add.at(self._score_sum, seats, scores.sum(axis=0))
+            np.add.at(self._score_squares, seats, (scores ** 2).sum(axis=0))
+
+    def watch_workers(self, progress: np.ndarray, block_sizes: Sequence[int]):
+        """
+        Show the finished games of every worker out of its ``block_sizes`` games.
+
+        ``progress`` holds the finished games per worker and is read on every
+        frame, e.g. the counters of SharedEvaluationRecords. Pass a copy
+        before the memory behind it is released.
+        """
+        with self._lock:
+            self._worker_progress = (progress, np.asarray(block_sizes))
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.render()
+
+    def _render_loop(self):
+        while not self._stop.wait(self.interval):
+            self.render()
+
+    def frame(self) -> list[str]:
+        """The lines of the view for the current state."""
+        with self._lock:
+            completed = self.completed
+            games, wins = self._games.copy(), self._wins.copy()
+            score_sum, score_squares = self._score_sum.copy(), self._score_squares.copy()
+            if self._worker_progress is not None:
+                worker_games, worker_totals = self._worker_progress[0].copy(), self._worker_progress[1]
+            else:
+                worker_games = worker_totals = None
+
+        elapsed = max(time.perf_counter() - self._start_time, 1e-9)
+        rate = completed / elapsed
+        remaining = max(self.total_games - completed, 0)
+        eta = format_duration(remaining / rate) if rate > 0 else '--:--:--'
+        percent = completed / self.total_games if self.total_games else 1.0
+        lines = [
+            f'Games {completed}/{self.total_games} ({percent:.1%})  {rate:8.1f} games/s  '
+            f'elapsed {format_duration(elapsed)}  ETA {eta}'
+        ]
+
+        snapshot = self.telemetry.last if self.telemetry is not None else None
+        if snapshot:
+            lines.append('Workers: ' + '  '.join(
+                f'{index}:{utilization:4.0%}' for index, utilization in enumerate(snapshot['worker_utilization'])
+            ))
+        elif worker_games is not None:
+            lines.append('Workers: ' + '  '.join(
+                f'{index}:{done}/{total}' for index, (done, total) in enumerate(zip(worker_games.tolist(), worker_totals.tolist()))
+            ))
+
+        low, high = wilson_interval(wins, games)
+        mean, mean_low, mean_high = mean_interval(score_sum, score_squares, games)
+        lines.append(f'{"Agent":<30} {"Games":>8}  {"Win rate (95% CI)":<26} {"Mean score (95% CI)":<28}')
+        for i, name in enumerate(self.names):
+            win_rate = wins[i] / games[i] if games[i] else 0.0
+            lines.append(
+                f'{name:<30} {games[i]:>8}  '
+                f'{win_rate:6.1%} [{low[i]:6.1%}, {high[i]:6.1%}]    '
+                f'{mean[i]:7.1f} [{mean_low[i]:7.1f}, {mean_high[i]:7.1f}]'
+            )
+        return lines
+
+    def render(self):
+        lines = self.frame()
+        if self._in_place:
+            text = _up(self._lines) + _CLEAR + '\n'.join(lines) + '\n'
+        else:
+            text = '\n'.join(lines) + '\n\n'
+        self.stream.write(text)
+        self.stream.flush()
+        self._lines = len(lines)
+        self.frames += 1
@@ -0,0 +1,127 @@
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from src.core.tracing import Tracer, tracing
+
+
+@dataclass
+class MemoryUsage:
+    """
+    Allocations of one kind of span, summed over its calls.
+
+    ``allocated_bytes`` is the peak of traced memory above its level at the
+    start of the span, so memory that is allocated and freed again inside
+    the span still counts. ``retained_bytes`` and ``retained_blocks`` are the
+    net change that outlives the span.
+    """
+    calls: int = 0
+    allocated_bytes: int = 0
+    retained_bytes: int = 0
+    retained_blocks: int = 0
+
+    def add(self, allocated: int, retained: int, blocks: int):
+        self.calls += 1
+        self.allocated_bytes += allocated
+        self.retained_bytes += retained
+        self.retained_blocks += blocks
+
+
+@dataclass
+class GameMemory:
+    bytes: int
+    blocks: int
+    peak_bytes: int
+
+
+class MemoryProfiler(Tracer):
+    """
+    Memory profile of the games played while ``profile`` is active.
+
+    Hooks into the engine spans of src.core.tracing and measures, per game,
+    per phase and per agent call, the peak of memory traced by tracemalloc
+    above the level at the start of the span, plus the net change of traced
+    memory and of allocated blocks (``sys.getallocatedblocks``). The
+    allocation sites that grew the most over the whole run are kept in
+    ``top_sites``.
+
+    tracemalloc has a single peak, which every span resets when it begins;
+    the peak reached before that is handed to the enclosing spans through
+    ``_open_spans``.
+    """
+
+    def __init__(self, num_sites: int = 10, frames: int = 1):
+        super().__init__(sample_rate=1.0)
+        self.num_sites = num_sites
+        self.frames = frames
+        self.games: list[GameMemory] = []
+        self.phases: dict[str, MemoryUsage] = {}
+        self.agents: dict[str, MemoryUsage] = {}
+        self.top_sites: list[tracemalloc.StatisticDiff] = []
+        # Highest traced memory seen so far by every unfinished span, innermost last
+        self._open_spans: list[int] = []
+
+    def begin(self) -> tuple[int, int]:
+        current, peak = tracemalloc.get_traced_memory()
+        if self._open_spans:
+            self._open_spans[-1] = max(self._open_spans[-1], peak)
+        tracemalloc.reset_peak()
+        self._open_spans.append(current)
+        return current, sys.getallocatedblocks()
+
+    def end(self, name: str, start: tuple[int, int], args: dict[str, Any] | None):
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(peak, self._open_spans.pop())
+        if self._open_spans:
+            self._open_spans[-1] = max(self._open_spans[-1], peak)
+
+        allocated = peak - start[0]
+        retained = current - start[0]
+        blocks = sys.getallocatedblocks() - start[1]
+
+        self.phases.setdefault(name, MemoryUsage()).add(allocated, retained, blocks)
+        if name == 'agent':
+            self.agents.setdefault(args['agent'], MemoryUsage()).add(allocated, retained, blocks)
+        elif name == 'game':
+            self.games.append(GameMemory(retained, blocks, allocated))
+
+    @contextmanager
+    def profile(self) -> Iterator['MemoryProfiler']:
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start(self.frames)
+        try:
+            before = tracemalloc.take_snapshot()
+            with tracing(self):
+                yield self
+            after = tracemalloc.take_snapshot()
+            self.top_sites = after.compare_to(before, 'lineno')[:self.num_sites]
+        finally:
+            if started:
+                tracemalloc.stop()
+
+    def print_report(self):
+        print('\nMemory Profile:')
+        print('-' * 80)
+        if self.games:
+            print(f'Games: {len(self.games)}')
+            print(f'  Mean net bytes:  {sum(g.bytes for g in self.games) / len(self.games):12.0f}')
+            print(f'  Mean net blocks: {sum(g.blocks for g in self.games) / len(self.games):12.0f}')
+            print(f'  Max peak bytes:  {max(g.peak_bytes for g in self.games):12d}')
+
+        for title, usages in (('Phases', self.phases), ('Agent calls', self.agents)):
+            print(f'\n{title}:')
+            for name, usage in sorted(usages.items(), key=lambda item: item[1].allocated_bytes, reverse=True):
+                print(
+                    f'  {name:<30} calls={usage.calls:<8} '
+                    f'allocated bytes/call={usage.allocated_bytes / usage.calls:10.1f} '
+                    f'retained bytes/call={usage.retained_bytes / usage.calls:10.1f} '
+                    f'retained blocks/call={usage.retained_blocks / usage.calls:8.2f}'
+                )
+
+        print('\nTop allocation sites:')
+        for stat in self.top_sites:
+            print(f'  {stat}')
+        print('-' * 80)
@@ -0,0 +1,145 @@
+from typing import Sequence
+
+import numpy as np
+
+from src.core.player import WizardBasePlayer
+from src.game.game_state import GameState
+from src.game.wizard_card import CardSuit, NUM_CARD_IDS, SUIT_INDEX, card_to_id
+
+# Integer buffers store scores in tens, offset so that negative scores stay positive
+SCORE_OFFSET = 128
+
+
+class ObservationEncoder:
+    """
+    Encode a GameState into a fixed-length feature vector.
+
+    All per-player blocks are ordered relative to the observing player:
+    index 0 is the observer, followed by the others in ``state.players``
+    order. The layout only depends on the number of players, so rows of a
+    preallocated (N, size) buffer can be filled in place for batched agents.
+
+    Layout:
+        hand          NUM_CARD_IDS   card counts in hand
+        trick         P * NUM_CARD_IDS   one-hot card per relative seat in the current trick
+        trump_card    NUM_CARD_IDS + 1   trump card id, last slot if there is none
+        trump_suit    len(CardSuit) + 1   trump suit, last slot if there is none
+        has_bid       P   1 once the player has placed a bid
+        bids          P
+        won_tricks    P
+        scores        P   in tens (offset by SCORE_OFFSET for integer dtypes)
+        seat          P   one-hot position of the observer in this round's order
+        round         1
+        played        NUM_CARD_IDS   counts of cards played in the round, current trick included
+    """
+
+    def __init__(self, num_players: int, dtype=np.float32):
+        if not 3 <= num_players <= 6:
+            raise ValueError('Number of players must be between 3 and 6')
+
+        self.num_players = num_players
+        self.dtype = np.dtype(dtype)
+        if np.issubdtype(self.dtype, np.floating):
+            self._score_offset = 0
+            self._score_range = (-np.inf, np.inf)
+        else:
+            self._score_offset = SCORE_OFFSET
+            self._score_range = (np.iinfo(self.dtype).min, np.iinfo(self.dtype).max)
+
+        offset = 0
+        self.slices: dict[str, slice] = {}
+        for name, length in (
+                ('hand', NUM_CARD_IDS),
+                ('trick', num_players * NUM_CARD_IDS),
+                ('trump_card', NUM_CARD_IDS + 1),
+                ('trump_suit', len(CardSuit) + 1),
+                ('has_bid', num_players),
+                ('bids', num_players),
+                ('won_tricks', num_players),
+                ('scores', num_players),
+                ('seat', num_players),
+                ('round', 1),
+                ('played', NUM_CARD_IDS),
+        ):
+            self.slices[name] = slice(offset, offset + length)
+            offset += length
+        self.size = offset
+
+        self._hand = self.slices['hand'].start
+        self._trick = self.slices['trick'].start
+        self._trump_card = self.slices['trump_card'].start
+        self._trump_suit = self.slices['trump_suit'].start
+        self._has_bid = self.slices['has_bid'].start
+        self._bids = self.slices['bids'].start
+        self._won_tricks = self.slices['won_tricks'].start
+        self._scores = self.slices['scores'].start
+        self._seat = self.slices['seat'].start
+        self._round = self.slices['round'].start
+        self._played = self.slices['played'].start
+
+    def allocate(self, batch_size: int | None = None) -> np.ndarray:
+        shape = (self.size,) if batch_size is None else (batch_size, self.size)
+        return np.zeros(shape, dtype=self.dtype)
+
+    def encode(self, state: GameState, player: WizardBasePlayer, out: np.ndarray | None = None) -> np.ndarray:
+        """Write the observation of ``player`` into ``out`` (a row of length ``size``) and return it."""
+        if out is None:
+            out = self.allocate()
+        else:
+            out.fill(0)
+
+        players = state.players
+        num_players = len(players)
+        if num_players != self.num_players:
+            raise ValueError(f'Encoder expects {self.num_players} players, got {num_players}')
+        seat = players.index(player)
+
+        for card in state.hand:
+            out[self._hand + card_to_id(card)] += 1
+
+        for card in state.played_cards:
+            out[self._played + card_to_id(card)] += 1
+
+        if state.current_trick:
+            for trick_player, card in state.current_trick.trick_cards.items():
+                relative = (players.index(trick_player) - seat) % num_players
+                out[self._trick + relative * NUM_CARD_IDS + card_to_id(card)] = 1
+
+        trump_card = state.trump_card
+        out[self._trump_card + (card_to_id(trump_card) if trump_card else NUM_CARD_IDS)] = 1
+        trump_suit = state.trump_suit
+        out[self._trump_suit + (SUIT_INDEX[trump_suit] if trump_suit else len(CardSuit))] = 1
+
+        bets = state.current_bets
+        won_tricks = state.won_tricks
+        scores = state.current_scores
+        for relative in range(num_players):
+            other = players[(seat + relative) % num_players]
+            if other in bets:
+                out[self._has_bid + relative] = 1
+                out[self._bids + relative] = bets[other]
+            out[self._won_tricks + relative] = won_tricks.get(other, 0)
+            score = scores.get(other, 0) // 10 + self._score_offset
+            out[self._scores + relative] = min(max(score, self._score_range[0]), self._score_range[1])
+
+        out[self._seat + seat] = 1
+        out[self._round] = state.current_round_number
+
+        return out
+
+    def encode_batch(
+            self,
+            states: Sequence[GameState],
+            players: Sequence[WizardBasePlayer],
+            out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Fill the first ``len(states)`` rows of ``out`` (allocated if not given) in place."""
+        if out is None:
+            out = self.allocate(len(states))
+        elif out.shape[0] < len(states) or out.shape[1] != self.size:
+            raise ValueError(f'Buffer of shape {out.shape} cannot hold {len(states)} observations of size {self.size}')
+
+        for row, state, player in zip(out, states, players):
+            self.encode(state, player, row)
+
+        return out
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import abc
+import os
+import queue
+import threading
+from typing import Callable, Sequence
+
+from src.ai.evaluation_records import EvaluationRecords
+from src.ai.league import DEFAULT_BETA, Rating, update_ratings
+
+# Sent through the queues to stop the consumer threads
+_DONE = None
+
+
+class ResultConsumer(abc.ABC):
+    """
+    Receives the results of an evaluation in chunks of finished games, see ResultPipeline.
+
+    ``consume`` runs on the consumer's own thread and sees the chunks in the
+    order they were put, which is the order games finished, not seed order.
+    """
+
+    def start(self):
+        """Called on the consumer's thread before the first chunk."""
+
+    @abc.abstractmethod
+    def consume(self, records: EvaluationRecords):
+        """Called on the consumer's thread with every chunk of finished games."""
+
+    def close(self):
+        """Called on the consumer's thread after the last chunk."""
+
+
+class StatsAccumulator(ResultConsumer):
+    """Folds every chunk into the statistics of a WizardEnvironment."""
+
+    def __init__(self, update: Callable[[EvaluationRecords], None]):
+        self._update = update
+
+    def consume(self, records: EvaluationRecords):
+        self._update(records)
+
+
+class ProgressPrinter(ResultConsumer):
+    """Prints the number of finished games every ``every`` games."""
+
+    def __init__(self, every: int = 10):
+        self.every = every
+        self.completed = 0
+
+    def consume(self, records: EvaluationRecords):
+        before = self.completed
+        self.completed += len(records)
+        if self.completed // self.every > before // self.every:
+            print(f'Completed {self.completed} games')
+
+
+class RecordWriter(ResultConsumer):
+    """Writes every chunk to its own ``records_<n>.npz`` file in ``directory``, see EvaluationRecords.load."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.paths: list[str] = []
+        os.makedirs(directory, exist_ok=True)
+
+    def consume(self, records: EvaluationRecords):
+        path = os.path.join(self.directory, f'records_{len(self.paths):06d}.npz')
+        records.save(path)
+        self.paths.append(path)
+
+
+class RatingUpdater(ResultConsumer):
+    """Online ratings of the seats of the lineup, updated game by game like WizardLeague."""
+
+    def __init__(self, beta: float = DEFAULT_BETA):
+        self.beta = beta
+        self.ratings: list[Rating] = []
+
+    def consume(self, records: EvaluationRecords):
+        if not self.ratings:
+            self.ratings = [Rating() for _ in range(records.num_seats)]
+
+        # Rank 1 is best, equal scores share a rank
+        ranks = (records.scores[:, None, :] > records.scores[:, :, None]).sum(axis=2) + 1
+        for game_ranks in ranks.tolist():
+            update_ratings(self.ratings, game_ranks, self.beta)
+
+
+class _ConsumerThread(threading.Thread):
+    def __init__(self, consumer: ResultConsumer, queue_size: int):
+        super().__init__(name=f'consumer-{type(consumer).__name__}', daemon=True)
+        self.consumer = consumer
+        self.queue: queue.Queue[EvaluationRecords | None] = queue.Queue(queue_size)
+        self.error: BaseException | None = None
+
+    def run(self):
+        try:
+            self.consumer.start()
+        except BaseException as e:
+            self.error = e
+        while (records := self.queue.get()) is not _DONE:
+            # After a failure keep draining, so the producer is never blocked by a dead consumer
+            if self.error is None:
+                try:
+                    self.consumer.consume(records)
+                except BaseException as e:
+                    self.error = e
+        if self.error is None:
+            try:
+                self.consumer.close()
+            except BaseException as e:
+                self.error = e
+
+
+class ResultPipeline:
+    """
+    Streams chunks of game results to several consumers running side by side.
+
+    Every consumer runs on its own thread behind a bounded queue of
+    ``queue_size`` chunks. ``put`` blocks while a consumer is that far
+    behind, which slows down the producer instead of buffering without
+    bound. Simulation workers write into shared memory and never block on
+    the pipeline; only the parent process that collects their results does.
+    The first error raised by a consumer is re-raised by ``close``.
+    """
+
+    def __init__(self, consumers: Sequence[ResultConsumer], queue_size: int = 16):
+        self.consumers = list(consumers)
+        self._threads = [_ConsumerThread(consumer, queue_size) for consumer in self.consumers]
+        for thread in self._threads:
+            thread.start()
+
+    def put(self, records: EvaluationRecords):
+        if len(records) == 0:
+            return
+        for thread in self._threads:
+            thread.queue.put(records)
+
+    def close(self):
+        for thread in self._threads:
+            thread.queue.put(_DONE)
+        for thread in self._threads:
+            thread.join()
+        for thread in self._threads:
+            if thread.error is not None:
+                raise thread.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        try:
+            self.close()
+        except BaseException:
+            # Let an error of the producer propagate rather than the consumer's
+            if exc_type is None:
+                raise
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Any, Hashable, Type
+
+from src.core.decision import DecisionKind
+from src.core.player import WizardBasePlayer, rotate_players
+from src.core.seen_cards import SeenCards
+from src.game.game_state import GameState
+from src.game.wizard_card import CardSuit, CardType, WizardCard, card_to_id
+from src.game.wizard_card_factory import create_wizard_cards
+
+
+@dataclass(frozen=True)
+class HypotheticalTrick:
+    """Read-only stand-in for Trick in states after a move that was not made yet."""
+    trick_cards: MappingProxyType[WizardBasePlayer, WizardCard]
+    trick_suit: CardSuit | None
+
+
+def next_player(state: GameState, player: WizardBasePlayer, kind: DecisionKind) -> WizardBasePlayer | None:
+    """The player deciding right after ``player`` in the same bidding round or trick, if any."""
+    if kind == DecisionKind.BID:
+        order = list(state.players)
+    else:
+        trick_cards = state.current_trick.trick_cards if state.current_trick else {}
+        order = rotate_players(list(state.players), next(iter(trick_cards), player))
+
+    index = order.index(player) + 1
+    return order[index] if index < len(order) else None
+
+
+def after_move(state: GameState, player: WizardBasePlayer, kind: DecisionKind, move: Any) -> GameState:
+    """
+    The state of the next player in ``state`` after ``player`` made ``move``.
+
+    Only valid while no trick is completed by the move, see next_player.
+    """
+    if kind == DecisionKind.BID:
+        return replace(state, current_bets=MappingProxyType({**state.current_bets, player: move}))
+
+    trick = state.current_trick
+    trick_cards = dict(trick.trick_cards)
+    trick_suit = trick.trick_suit
+    # Same rule as Trick.play_steps: the first standard card after only Jesters sets the suit
+    if not trick_suit and all(c.card_type == CardType.JESTER for c in trick_cards.values()) and move.card_type == CardType.STANDARD:
+        trick_suit = move.card_suit
+    trick_cards[player] = move
+    seen_cards = SeenCards()
+    for card, owner in zip(state.seen_cards.cards, state.seen_cards.players):
+        seen_cards.add(card, owner)
+    seen_cards.add(move, player)
+    return replace(
+        state,
+        current_trick=HypotheticalTrick(MappingProxyType(trick_cards), trick_suit),
+        played_cards=seen_cards.cards,
+        seen_cards=seen_cards
+    )
+
+
+def unseen_cards(state: GameState) -> list[WizardCard]:
+    """Distinct cards another player may still hold, as far as the owner of ``state`` knows."""
+    remaining = Counter(create_wizard_cards())
+    seen = list(state.hand) + list(state.played_cards) + ([state.trump_card] if state.trump_card else [])
+    remaining.subtract(seen)
+    return [card for card, count in remaining.items() if count > 0]
+
+
+def state_key(state: GameState, kind: DecisionKind) -> Hashable:
+    """Everything a decision depends on that changes while a round is played."""
+    trick_cards = state.current_trick.trick_cards if state.current_trick else {}
+    return (
+        kind,
+        state.current_round_number,
+        tuple(card_to_id(card) for card in state.hand),
+        tuple((player.name, bet) for player, bet in state.current_bets.items()),
+        tuple((player.name, card_to_id(card)) for player, card in trick_cards.items()),
+        len(state.played_cards),
+    )
+
+
+class PonderingPlayer(WizardBasePlayer):
+    """
+    Mixin answering the decision right after a blocking player from a precomputed table.
+
+    While the blocking player decides, ``ponder`` asks the agent for its
+    answer to every move that player could make (every bid, every card not
+    seen by this agent). ``ponder_hit`` keeps the answer to the actual move,
+    and it is returned without asking the agent again if the state matches.
+    Build agents with ``pondering``.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._answers: dict[Any, tuple[Hashable, Any]] = {}
+        self._pondered: tuple[Hashable, Any] | None = None
+        self.ponder_hits = 0
+
+    def ponder(self, state: GameState, player: WizardBasePlayer, kind: DecisionKind, stop: threading.Event) -> None:
+        self._answers = {}
+        if next_player(state, player, kind) is not self:
+            return
+
+        if kind == DecisionKind.BID:
+            moves = range(state.current_round_number + 1)
+            decide = super().make_bid
+        else:
+            moves = unseen_cards(state)
+            decide = super().play_card
+
+        for move in moves:
+            if stop.is_set():
+                return
+            hypothetical = after_move(state, player, kind, move)
+            self._answers[move] = (state_key(hypothetical, kind), decide(hypothetical))
+
+    def ponder_hit(self, player: WizardBasePlayer, kind: DecisionKind, move: Any) -> None:
+        self._pondered = self._answers.get(move)
+        self._answers = {}
+
+    def _take_pondered(self, state: GameState, kind: DecisionKind) -> tuple[bool, Any]:
+        pondered, self._pondered = self._pondered, None
+        if pondered is not None and pondered[0] == state_key(state, kind):
+            self.ponder_hits += 1
+            return True, pondered[1]
+        return False, None
+
+    def make_bid(self, state: GameState) -> int:
+        hit, answer = self._take_pondered(state, DecisionKind.BID)
+        return answer if hit else super().make_bid(state)
+
+    def play_card(self, state: GameState) -> WizardCard:
+        hit, answer = self._take_pondered(state, DecisionKind.PLAY_CARD)
+        return answer if hit else super().play_card(state)
+
+
+def pondering(agent_class: Type[WizardBasePlayer]) -> Type[WizardBasePlayer]:
+    """
+    Subclass of ``agent_class`` that ponders while blocking players decide.
+
+    The agent must decide from the state alone: decisions are computed ahead
+    for states that may never happen, and agents drawing from the global
+    random module change its stream.
+    """
+    return type(f'Pondering{agent_class.__name__}', (PonderingPlayer, agent_class), {})
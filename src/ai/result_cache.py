@@ -0,0 +1,116 @@
+import glob
+import hashlib
+import inspect
+import os
+import sys
+from functools import lru_cache
+from typing import Sequence, Type
+
+import numpy as np
+
+from src.ai.evaluation_records import EvaluationRecords
+from src.core.player import WizardBasePlayer
+
+_ENGINE_PACKAGES = ('src.core', 'src.game')
+
+
+@lru_cache(maxsize=None)
+def engine_version() -> str:
+    """Hash of the engine sources (src/core and src/game); changes whenever the rules or engine change."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    digest = hashlib.sha256()
+    for package in _ENGINE_PACKAGES:
+        package_dir = os.path.join(root, *package.split('.')[1:])
+        for path in sorted(glob.glob(os.path.join(package_dir, '*.py'))):
+            digest.update(os.path.basename(path).encode())
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def agent_source_hash(p_class: Type[WizardBasePlayer]) -> str:
+    """
+    Hash of the source of every module defining the agent class or one of its bases.
+
+    Wrapper classes such as sandboxed agents name the agent they host in
+    ``__wrapped__``; its sources are part of the hash as well.
+    """
+    digest = hashlib.sha256()
+    for cls in p_class.__mro__:
+        module = sys.modules.get(cls.__module__)
+        if module is None or cls.__module__ == 'builtins':
+            continue
+        digest.update(f'{cls.__module__}.{cls.__qualname__}'.encode())
+        try:
+            digest.update(inspect.getsource(module).encode())
+        except (OSError, TypeError):
+            # Classes without retrievable source are keyed by name only
+            pass
+    wrapped = getattr(p_class, '__wrapped__', None)
+    if wrapped is not None:
+        digest.update(agent_source_hash(wrapped).encode())
+    return digest.hexdigest()
+
+
+def seed_ranges(seeds: np.ndarray) -> list[range]:
+    """Split sorted seeds into contiguous ranges."""
+    if not len(seeds):
+        return []
+    breaks = np.flatnonzero(np.diff(seeds) != 1) + 1
+    return [range(int(chunk[0]), int(chunk[-1]) + 1) for chunk in np.split(seeds, breaks)]
+
+
+class EvaluationCache:
+    """
+    Content-addressed on-disk cache of evaluation records.
+
+    Results live in one directory per lineup, keyed by the hash of the agent
+    sources, their seat order and the engine version. Inside it every run
+    adds a shard covering a contiguous seed range, so a larger run only has
+    to simulate the seeds that are not cached yet.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def key(self, player_classes: Sequence[Type[WizardBasePlayer]]) -> str:
+        digest = hashlib.sha256(engine_version().encode())
+        for p_class in player_classes:
+            digest.update(agent_source_hash(p_class).encode())
+        return digest.hexdigest()[:32]
+
+    def _lineup_dir(self, player_classes: Sequence[Type[WizardBasePlayer]]) -> str:
+        return os.path.join(self.cache_dir, self.key(player_classes))
+
+    def load(
+            self,
+            player_classes: Sequence[Type[WizardBasePlayer]],
+            seeds: range
+    ) -> tuple[EvaluationRecords | None, list[range]]:
+        """Return the cached records for ``seeds`` (sorted by seed) and the seed ranges still missing."""
+        shards = []
+        for path in sorted(glob.glob(os.path.join(self._lineup_dir(player_classes), 'seeds_*.npz'))):
+            start, stop = (int(part) for part in os.path.basename(path)[6:-4].split('_'))
+            if start < seeds.stop and stop > seeds.start:
+                shards.append(EvaluationRecords.load(path))
+
+        if not shards:
+            return None, [seeds]
+
+        records = EvaluationRecords.concatenate(shards)
+        _, unique_index = np.unique(records.seeds, return_index=True)
+        records = records[unique_index]
+        records = records[(records.seeds >= seeds.start) & (records.seeds < seeds.stop)]
+
+        requested = np.arange(seeds.start, seeds.stop, dtype=np.int64)
+        missing = requested[~np.isin(requested, records.seeds)]
+        return (records if len(records) else None), seed_ranges(missing)
+
+    def store(self, player_classes: Sequence[Type[WizardBasePlayer]], records: EvaluationRecords):
+        """Store records of a contiguous seed range as a new shard."""
+        if not len(records):
+            return
+        lineup_dir = self._lineup_dir(player_classes)
+        os.makedirs(lineup_dir, exist_ok=True)
+        start, stop = int(records.seeds.min()), int(records.seeds.max()) + 1
+        records.save(os.path.join(lineup_dir, f'seeds_{start}_{stop}.npz'))
@@ -0,0 +1,439 @@
+import atexit
+import copyreg
+import functools
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import select
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Sequence, Type
+
+from src.core.player import WizardBasePlayer
+from src.core.seen_cards import SeenCards
+from src.core.turn import valid_cards
+from src.game.game_state import GameState
+from src.game.wizard_card import NUM_CARD_IDS, CardSuit, WizardCard, card_from_id, card_to_id
+from src.server.protocol import RemotePlayer, RemoteTrick
+
+# Agent instances a worker keeps before dropping the least recently used one
+MAX_HOSTED_AGENTS = 256
+
+_BID = 0
+_PLAY_CARD = 1
+
+# Reply of a worker: success flag and the bid or card id, followed by the UTF-8 error text on failure.
+# The parent never unpickles what an untrusted agent's process sends back.
+_REPLY = struct.Struct('<?i')
+_MAX_ERROR_BYTES = 1024
+
+
+def _send(connection, message):
+    # Plain pickle is faster than Connection.send, which builds a ForkingPickler per message
+    connection.send_bytes(pickle.dumps(message, pickle.HIGHEST_PROTOCOL))
+
+
+def _recv(connection):
+    return pickle.loads(connection.recv_bytes())
+
+
+def _encode_reply(ok: bool, value: int = 0, error: str = '') -> bytes:
+    return _REPLY.pack(ok, value) + error.encode('utf-8', 'replace')[:_MAX_ERROR_BYTES]
+
+
+def _decode_reply(data: bytes) -> tuple[bool, int | str] | None:
+    """The flag and the answer or error text of a worker reply, None if the reply is malformed."""
+    if len(data) < _REPLY.size:
+        return None
+    ok, value = _REPLY.unpack_from(data)
+    if ok:
+        return (True, value) if len(data) == _REPLY.size else None
+    return False, data[_REPLY.size:].decode('utf-8', 'replace')
+
+
+_EMPTY = MappingProxyType({})
+
+
+def _mapping(players: Sequence[WizardBasePlayer], values: tuple) -> MappingProxyType:
+    return MappingProxyType({player: value for player, value in zip(players, values) if value is not None})
+
+
+class _StateEncoder:
+    """
+    Parent side of the compact state encoding sent to a sandbox worker.
+
+    Cards travel as ids and players as seat indices in plain tuples. The seat
+    names are sent once per game and the hand once per round; after that a
+    message only carries the cards played since the seat's previous decision,
+    and the worker takes the seat's own cards out of the hand itself. The
+    current trick is sent as its number of cards, which are the last played
+    cards. Scores,
+    bets and won tricks are sent when they changed, None otherwise.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._players: tuple[WizardBasePlayer, ...] = ()
+        self._seats: dict[WizardBasePlayer, int] = {}
+        self._round = -1
+        self._played = 0
+        self._mappings: list[Mapping[WizardBasePlayer, int] | None] = [None, None, None]
+
+    def _changed(self, index: int, mapping: Mapping[WizardBasePlayer, int]) -> tuple | None:
+        if mapping == self._mappings[index]:
+            return None
+        self._mappings[index] = mapping
+        return tuple(mapping.get(player) for player in self._players)
+
+    def encode(self, state: GameState) -> tuple:
+        players = state.players
+        names = None
+        if players != self._players:
+            self._players = players
+            self._seats = {player: seat for seat, player in enumerate(players)}
+            self._round = -1
+            self._mappings = [None, None, None]
+            names = tuple(player.name for player in players)
+        seats = self._seats
+
+        round_fields = None
+        if state.current_round_number != self._round or len(state.played_cards) < self._played:
+            self._round = state.current_round_number
+            self._played = 0
+            round_fields = (
+                self._round,
+                card_to_id(state.trump_card) if state.trump_card else None,
+                state.trump_suit.value if state.trump_suit else None,
+                tuple(card_to_id(card) for card in state.hand)
+            )
+
+        played = state.played_cards[self._played:]
+        played_by = state.seen_cards.players[self._played:]
+        self._played += len(played)
+
+        trick = state.current_trick
+        if trick is not None:
+            trick_size = len(trick.trick_cards)
+            trick_suit = trick.trick_suit.value if trick.trick_suit else None
+        else:
+            trick_size = trick_suit = None
+        return (
+            names,
+            round_fields,
+            tuple(card_to_id(card) for card in played),
+            tuple(seats[player] for player in played_by),
+            trick_size,
+            trick_suit,
+            self._changed(0, state.current_scores),
+            self._changed(1, state.current_bets),
+            self._changed(2, state.won_tricks),
+        )
+
+
+class _StateDecoder:
+    """Worker side of _StateEncoder, rebuilding a GameState for one hosted agent."""
+
+    def __init__(self, agent: WizardBasePlayer):
+        self._agent = agent
+        self._players: tuple[WizardBasePlayer, ...] = ()
+        self._round = 0
+        self._trump_card: WizardCard | None = None
+        self._trump_suit: CardSuit | None = None
+        self._hand: list[int] = []
+        self._seen = SeenCards()
+        self._mappings = [_EMPTY, _EMPTY, _EMPTY]
+
+    def decode(self, message: tuple) -> GameState:
+        names, round_fields, played, played_by, trick_size, trick_suit, *mappings = message
+        if names is not None:
+            self._players = tuple(self._agent if name == self._agent.name else RemotePlayer(name) for name in names)
+        players = self._players
+
+        if round_fields is not None:
+            self._round, trump_id, trump_suit, hand = round_fields
+            self._trump_card = card_from_id(trump_id) if trump_id is not None else None
+            self._trump_suit = CardSuit(trump_suit) if trump_suit else None
+            # The hand is as of this decision, including the cards played before it
+            self._hand = list(hand)
+            self._seen = SeenCards()
+
+        for card_id, seat in zip(played, played_by):
+            player = players[seat]
+            self._seen.add(card_from_id(card_id), player)
+            if player is self._agent and round_fields is None:
+                self._hand.remove(card_id)
+
+        for index, values in enumerate(mappings):
+            if values is not None:
+                self._mappings[index] = _mapping(players, values)
+        scores, bets, won = self._mappings
+
+        return GameState(
+            players=players,
+            current_round_number=self._round,
+            current_scores=scores,
+            current_bets=bets,
+            trump_card=self._trump_card,
+            trump_suit=self._trump_suit,
+            current_trick=RemoteTrick(
+                MappingProxyType(dict(zip(self._seen.players[len(self._seen) - trick_size:],
+                                          self._seen.cards[len(self._seen) - trick_size:]))),
+                CardSuit(trick_suit) if trick_suit else None
+            ) if trick_size is not None else None,
+            won_tricks=won,
+            hand=tuple(map(card_from_id, self._hand)),
+            played_cards=self._seen.cards,
+            seen_cards=self._seen,
+        )
+
+
+def _sandbox_worker(connection, agent_class: Type[WizardBasePlayer]):
+    agents: OrderedDict[int, tuple[WizardBasePlayer, _StateDecoder]] = OrderedDict()
+
+    while True:
+        try:
+            message = _recv(connection)
+        except (EOFError, KeyboardInterrupt):
+            return
+        if message is None:
+            return
+
+        key, name, kind, delta = message
+        if key in agents:
+            agents.move_to_end(key)
+            agent, decoder = agents[key]
+        else:
+            agent = agent_class(name)
+            decoder = _StateDecoder(agent)
+            agents[key] = (agent, decoder)
+            if len(agents) > MAX_HOSTED_AGENTS:
+                agents.popitem(last=False)
+
+        try:
+            state = decoder.decode(delta)
+            if kind == _BID:
+                answer = int(agent.make_bid(state))
+            else:
+                answer = card_to_id(agent.play_card(state))
+            reply = _encode_reply(True, answer)
+        except Exception as e:
+            reply = _encode_reply(False, error=repr(e))
+        connection.send_bytes(reply)
+
+
+@dataclass
+class SandboxStats:
+    decisions: int = 0
+    timeouts: int = 0
+    crashes: int = 0
+    errors: int = 0
+
+
+class _SandboxWorker:
+    """
+    One persistent subprocess hosting every instance of an agent class.
+
+    The pipe carries one request and its reply at a time, a lock keeps
+    threads playing the same agent class from interleaving them.
+    """
+
+    def __init__(self, agent_class: Type[WizardBasePlayer]):
+        self.agent_class = agent_class
+        self.stats = SandboxStats()
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._process = None
+        self._connection = None
+        self._poller = None
+        self._start()
+
+    def _start(self):
+        parent_connection, child_connection = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_sandbox_worker,
+            args=(child_connection, self.agent_class),
+            daemon=True
+        )
+        self._process.start()
+        child_connection.close()
+        self._connection = parent_connection
+        self._poller = None
+        if hasattr(select, 'poll'):
+            self._poller = select.poll()
+            self._poller.register(parent_connection.fileno(), select.POLLIN)
+        self.generation += 1
+
+    def restart(self):
+        self._process.kill()
+        self._process.join()
+        self._connection.close()
+        self._start()
+
+    def ask(self, message: tuple, timeout: float) -> tuple[bool, int | str] | None:
+        """Send one decision request, None if the agent missed the deadline, crashed or sent a malformed reply."""
+        with self._lock:
+            self.stats.decisions += 1
+            try:
+                _send(self._connection, message)
+                if not self._wait(timeout):
+                    self.stats.timeouts += 1
+                    self.restart()
+                    return None
+                reply = _decode_reply(self._connection.recv_bytes(_REPLY.size + _MAX_ERROR_BYTES))
+            except (EOFError, OSError):
+                reply = None
+            if reply is None:
+                self.stats.crashes += 1
+                self.restart()
+            return reply
+
+    def _wait(self, timeout: float) -> bool:
+        if self._poller is None:
+            return self._connection.poll(timeout)
+        return bool(self._poller.poll(timeout * 1000))
+
+    def close(self):
+        try:
+            _send(self._connection, None)
+        except (OSError, ValueError):
+            pass
+        self._process.join(timeout=1)
+        if self._process.is_alive():
+            self._process.kill()
+        self._connection.close()
+
+
+_workers: dict[Type[WizardBasePlayer], _SandboxWorker] = {}
+_workers_pid = os.getpid()
+# Threads asking for the same agent class must get the same worker
+_workers_lock = threading.Lock()
+
+
+def _worker_for(agent_class: Type[WizardBasePlayer]) -> _SandboxWorker:
+    global _workers, _workers_pid, _workers_lock
+
+    # A forked evaluation worker must not share its parent's pipes, nor a lock held while it forked
+    if _workers_pid != os.getpid():
+        _workers = {}
+        _workers_pid = os.getpid()
+        _workers_lock = threading.Lock()
+
+    with _workers_lock:
+        if agent_class not in _workers:
+            _workers[agent_class] = _SandboxWorker(agent_class)
+        return _workers[agent_class]
+
+
+def sandbox_stats() -> dict[str, SandboxStats]:
+    return {agent_class.__name__: worker.stats for agent_class, worker in _workers.items()}
+
+
+@atexit.register
+def shutdown_sandboxes():
+    """Stop every sandbox worker of this process."""
+    if _workers_pid == os.getpid():
+        for worker in _workers.values():
+            worker.close()
+    _workers.clear()
+
+
+class _SandboxedClass(type):
+    """Metaclass of the classes made by sandboxed(), which pickle as the sandboxed() call creating them."""
+
+
+class SandboxedPlayer(WizardBasePlayer, metaclass=_SandboxedClass):
+    """
+    Play an agent hosted in a persistent worker subprocess.
+
+    All instances of the same agent class share one worker, which is reused
+    across games. States are sent in the compact encoding of _StateEncoder.
+    A decision that misses ``decision_timeout``, crashes the worker or raises
+    inside the agent is replaced by a default legal move (bid 0, first valid
+    card) and counted in ``sandbox_stats``, so an untrusted bot cannot abort
+    the evaluation.
+
+    A sandboxed decision costs about 70 us more than an in-process one on a
+    single core, about 20 us of which is the pipe round trip itself, see
+    benchmarks/sandbox_benchmark.py. Decisions within a trick depend on the
+    cards played before them, so they cannot be batched.
+    """
+    agent_class: Type[WizardBasePlayer] = None
+    decision_timeout: float = 1.0
+
+    _keys = itertools.count()
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._key = next(self._keys)
+        self._encoder = _StateEncoder()
+        self._generation = 0
+        self.logger = logging.getLogger(__name__)
+
+    def make_bid(self, state: GameState) -> int:
+        answer = self._ask(_BID, state)
+        if isinstance(answer, int) and 0 <= answer <= state.current_round_number:
+            return answer
+        return 0
+
+    def play_card(self, state: GameState) -> WizardCard:
+        legal = valid_cards(state.hand, state.current_trick.trick_cards, state.current_trick.trick_suit)
+        answer = self._ask(_PLAY_CARD, state)
+        if isinstance(answer, int) and 0 <= answer < NUM_CARD_IDS and card_from_id(answer) in legal:
+            return card_from_id(answer)
+        return legal[0]
+
+    def _ask(self, kind: int, state: GameState):
+        worker = _worker_for(self.agent_class)
+        if worker.generation != self._generation:
+            # A fresh worker has no decoder state for this agent yet
+            self._encoder.reset()
+            self._generation = worker.generation
+
+        reply = worker.ask((self._key, self.name, kind, self._encoder.encode(state)), self.decision_timeout)
+        if reply is None:
+            self.logger.warning(f'{self.name}: sandboxed agent timed out or crashed')
+            return None
+
+        ok, answer = reply
+        if not ok:
+            worker.stats.errors += 1
+            self.logger.warning(f'{self.name}: sandboxed agent raised {answer}')
+            return None
+        return answer
+
+
+def sandboxed(agent_class: Type[WizardBasePlayer], decision_timeout: float = 1.0) -> Type[SandboxedPlayer]:
+    """
+    Create a player class hosting ``agent_class`` in a sandbox, usable in evaluation lineups.
+
+    The same arguments give the same class. It pickles by its arguments, so
+    lineups with sandboxed agents can be sent to worker processes, and its
+    ``__wrapped__`` attribute lets result caches hash the hosted agent's source.
+    """
+    return _sandboxed_class(agent_class, float(decision_timeout))
+
+
+@functools.lru_cache(maxsize=None)
+def _sandboxed_class(agent_class: Type[WizardBasePlayer], decision_timeout: float) -> Type[SandboxedPlayer]:
+    return _SandboxedClass(
+        f'Sandboxed{agent_class.__name__}',
+        (SandboxedPlayer,),
+        {'agent_class': agent_class, 'decision_timeout': decision_timeout, '__wrapped__': agent_class}
+    )
+
+
+def _reduce_sandboxed_class(cls: _SandboxedClass):
+    if '__wrapped__' not in cls.__dict__:
+        # SandboxedPlayer itself and named subclasses pickle by reference as usual
+        return cls.__qualname__
+    return sandboxed, (cls.agent_class, cls.decision_timeout)
+
+
+copyreg.pickle(_SandboxedClass, _reduce_sandboxed_class)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.ai.evaluation_records import EvaluationRecords
+
+_ALIGNMENT = 64
+
+
+@dataclass(frozen=True)
+class SharedRecordsSpec:
+    """Picklable description of a shared block, used by workers to attach to it."""
+    name: str
+    num_games: int
+    num_seats: int
+    num_workers: int
+
+
+def _layout(spec: SharedRecordsSpec) -> tuple[list[tuple[str, tuple, np.dtype, int]], int]:
+    """Offsets of every records array and of the progress counters inside the block."""
+    template = EvaluationRecords.empty(0, spec.num_seats)
+    arrays = [
+        (f.name, (spec.num_games,) + getattr(template, f.name).shape[1:], getattr(template, f.name).dtype)
+        for f in fields(EvaluationRecords)
+    ]
+    arrays.append(('progress', (spec.num_workers,), np.dtype(np.int64)))
+
+    layout = []
+    offset = 0
+    for name, shape, dtype in arrays:
+        layout.append((name, shape, dtype, offset))
+        size = int(np.prod(shape)) * dtype.itemsize
+        offset += -(-size // _ALIGNMENT) * _ALIGNMENT
+    return layout, max(offset, 1)
+
+
+class SharedEvaluationRecords:
+    """
+    EvaluationRecords living in one multiprocessing.shared_memory block.
+
+    Worker processes attach to the block and write each finished game
+    straight into its row, and bump their own slot of ``progress``. Every
+    slot has a single writer, so the counters need no lock. The parent reads
+    the arrays in place and never deserializes a per-game result.
+    """
+
+    def __init__(self, spec: SharedRecordsSpec, shm: shared_memory.SharedMemory, owner: bool):
+        self.spec = spec
+        self._shm = shm
+        self._owner = owner
+
+        layout, _ = _layout(spec)
+        views = {
+            name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            for name, shape, dtype, offset in layout
+        }
+        self.progress: np.ndarray = views.pop('progress')
+        self.records = EvaluationRecords(**views)
+
+    @classmethod
+    def create(cls, num_games: int, num_seats: int, num_workers: int) -> SharedEvaluationRecords:
+        spec = SharedRecordsSpec('', num_games, num_seats, num_workers)
+        _, size = _layout(spec)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        shared = cls(SharedRecordsSpec(shm.name, num_games, num_seats, num_workers), shm, owner=True)
+
+        empty = EvaluationRecords.empty(1, num_seats)
+        for f in fields(EvaluationRecords):
+            getattr(shared.records, f.name)[:] = getattr(empty, f.name)[0]
+        shared.progress[:] = 0
+        return shared
+
+    @classmethod
+    def attach(cls, spec: SharedRecordsSpec) -> SharedEvaluationRecords:
+        return cls(spec, shared_memory.SharedMemory(name=spec.name), owner=False)
+
+    def copy(self) -> EvaluationRecords:
+        """One bulk copy per array, to keep the results after the block is released."""
+        return self.records.copy()
+
+    def close(self):
+        # Drop the views before closing, the buffer cannot be released while they exist
+        self.records = None
+        self.progress = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
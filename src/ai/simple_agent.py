@@ -7,14 +7,19 @@ from src.core.player import WizardBasePlayer
 
 
 class WizardSimpleBot(WizardBasePlayer):
+    # Tunable constants, see src/ai/sweep.py
+    min_trump_value = 0
+    bid_offset = 0
+
     def make_bid(self, state) -> int:
         bid = 0
         hand = state.hand
 
         bid += len([c for c in hand if c.card_type == CardType.WIZARD])
-        bid += len([c for c in hand if c.card_suit == state.trump_suit])
+        bid += len([c for c in hand if c.card_suit == state.trump_suit and (c.card_value or 0) >= self.min_trump_value])
+        bid += self.bid_offset
 
-        return min(bid, state.current_round_number)
+        return max(0, min(bid, state.current_round_number))
 
     def play_card(self, state) -> WizardCard:
         trick = state.current_trick
@@ -0,0 +1,170 @@
+import hashlib
+import itertools
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence, Type
+
+import numpy as np
+
+from src.ai.evaluation_records import EvaluationRecords
+from src.ai.result_cache import EvaluationCache, agent_source_hash
+from src.ai.wizard_environment import play_game_into
+from src.core.player import WizardBasePlayer
+
+
+def config_hash(agent_class: Type[WizardBasePlayer], params: Mapping[str, Any]) -> str:
+    """Hash of the agent source and its hyperparameters."""
+    digest = hashlib.sha256(agent_source_hash(agent_class).encode())
+    digest.update(json.dumps(dict(params), sort_keys=True).encode())
+    return digest.hexdigest()[:12]
+
+
+def configure(agent_class: Type[WizardBasePlayer], params: Mapping[str, Any]) -> Type[WizardBasePlayer]:
+    """
+    Subclass of ``agent_class`` with its tunable class constants overridden.
+
+    The class name carries the config hash, so evaluation caches keep the
+    results of different configurations apart.
+    """
+    for name in params:
+        if not hasattr(agent_class, name):
+            raise ValueError(f'{agent_class.__name__} has no hyperparameter {name!r}')
+    return type(f'{agent_class.__name__}_{config_hash(agent_class, params)}', (agent_class,), dict(params))
+
+
+def grid(space: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    """All combinations of the parameter values."""
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def _evaluate_config(
+        agent_class: Type[WizardBasePlayer],
+        params: Mapping[str, Any],
+        opponents: Sequence[Type[WizardBasePlayer]],
+        seeds: range,
+        cache_dir: str
+) -> EvaluationRecords:
+    player_classes = [configure(agent_class, params), *opponents]
+    cache = EvaluationCache(cache_dir)
+    cached, missing = cache.load(player_classes, seeds)
+
+    shards = [cached] if cached is not None else []
+    for seed_range in missing:
+        shard = EvaluationRecords.empty(len(seed_range), len(player_classes))
+        game = None
+        for index, seed in enumerate(seed_range):
+            game = play_game_into(shard, index, player_classes, seed, game=game)
+        cache.store(player_classes, shard)
+        shards.append(shard)
+
+    records = EvaluationRecords.concatenate(shards)
+    return records[np.argsort(records.seeds, kind='stable')]
+
+
+@dataclass
+class SweepResult:
+    params: dict[str, Any]
+    config_hash: str
+    games: int
+    mean_score: float
+    win_rate: float
+
+    def objective(self, name: str) -> float:
+        return getattr(self, name)
+
+
+class HyperparameterSweep:
+    """
+    Search the class constants of an agent against a fixed set of opponents.
+
+    The tuned agent takes seat 0 and every configuration plays the same seeds.
+    Configurations are evaluated in parallel on ``workers`` processes and the
+    records of every configuration are cached under its config hash in
+    ``cache_dir``, so an interrupted sweep resumes where it stopped and a
+    later rung only plays the games it has not played yet.
+    """
+
+    def __init__(
+            self,
+            agent_class: Type[WizardBasePlayer],
+            opponents: Sequence[Type[WizardBasePlayer]],
+            cache_dir: str,
+            seed: int = 0,
+            workers: int = 0,
+            objective: str = 'mean_score'
+    ):
+        if not 3 <= len(opponents) + 1 <= 6:
+            raise ValueError('Number of players must be between 3 and 6')
+        if objective not in ('mean_score', 'win_rate'):
+            raise ValueError(f'Unknown objective {objective!r}')
+
+        self.agent_class = agent_class
+        self.opponents = list(opponents)
+        self.cache_dir = cache_dir
+        self.seed = seed
+        self.workers = workers
+        self.objective = objective
+
+    def evaluate(self, configs: Sequence[Mapping[str, Any]], num_games: int) -> list[SweepResult]:
+        """Evaluate every configuration on the first ``num_games`` seeds, best first."""
+        seeds = range(self.seed, self.seed + num_games)
+        args = [(self.agent_class, dict(params), self.opponents, seeds, self.cache_dir) for params in configs]
+
+        if self.workers > 0:
+            with ProcessPoolExecutor(self.workers) as executor:
+                all_records = list(executor.map(_evaluate_config, *zip(*args)))
+        else:
+            all_records = [_evaluate_config(*arg) for arg in args]
+
+        results = [
+            SweepResult(
+                params=dict(params),
+                config_hash=config_hash(self.agent_class, params),
+                games=len(records),
+                mean_score=float(records.scores[:, 0].mean()),
+                # Ties count as wins, like the win rate of WizardEnvironment
+                win_rate=float((records.scores[:, 0] == records.scores.max(axis=1)).mean())
+            )
+            for params, records in zip(configs, all_records)
+        ]
+        return sorted(results, key=lambda result: result.objective(self.objective), reverse=True)
+
+    def grid_search(self, space: Mapping[str, Sequence[Any]], num_games: int) -> list[SweepResult]:
+        return self.evaluate(grid(space), num_games)
+
+    def successive_halving(
+            self,
+            space: Mapping[str, Sequence[Any]] | Sequence[Mapping[str, Any]],
+            min_games: int = 50,
+            max_games: int = 1000,
+            eta: int = 3
+    ) -> list[SweepResult]:
+        """
+        Evaluate all configurations on ``min_games`` and keep the best 1/``eta``
+        for ``eta`` times as many games, until one is left or ``max_games`` is
+        reached. Returns the results of the last rung, best first.
+        """
+        configs = grid(space) if isinstance(space, Mapping) else [dict(params) for params in space]
+        num_games = min_games
+
+        while True:
+            results = self.evaluate(configs, num_games)
+            keep = max(1, math.ceil(len(results) / eta))
+            if len(results) == 1 or num_games >= max_games:
+                return results
+
+            configs = [result.params for result in results[:keep]]
+            num_games = min(num_games * eta, max_games)
+
+    def print_results(self, results: Sequence[SweepResult]):
+        print(f'\nSweep Results for {self.agent_class.__name__}:')
+        print('-' * 80)
+        for result in results:
+            print(
+                f'{result.config_hash}  games={result.games:<6} mean_score={result.mean_score:8.2f} '
+                f'win_rate={result.win_rate:6.1%}  {result.params}'
+            )
+        print('-' * 80)
@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import json
+import os
+import resource
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import shared_memory
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from src.core.decision import is_awaitable
+from src.core.player import WizardBasePlayer
+from src.game.wizard_game import WizardGame
+
+OPENMETRICS_CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+_GAMES = 0
+_BUSY_NS = 1
+_SEAT_COLUMNS = 2
+
+
+@dataclass(frozen=True)
+class TelemetrySpec:
+    """Picklable description of shared counters, used by workers to attach to them."""
+    name: str
+    num_workers: int
+    num_seats: int
+
+
+class TelemetryCounters:
+    """
+    Monotonic counters of one evaluation run.
+
+    One int64 row per worker holds the finished games, the busy time and the
+    decisions, decision time and exceptions of every seat. Every row has a
+    single writer, so workers update their row in shared memory without a
+    lock, and only once per game.
+    """
+
+    def __init__(self, spec: TelemetrySpec, shm: shared_memory.SharedMemory | None = None, owner: bool = True):
+        self.spec = spec
+        self._shm = shm
+        self._owner = owner
+        shape = (spec.num_workers, _SEAT_COLUMNS + 3 * spec.num_seats)
+        if shm is None:
+            self.rows = np.zeros(shape, dtype=np.int64)
+        else:
+            self.rows = np.ndarray(shape, dtype=np.int64, buffer=shm.buf)
+
+    @classmethod
+    def create(cls, num_workers: int, num_seats: int, shared: bool = False) -> TelemetryCounters:
+        if not shared:
+            return cls(TelemetrySpec('', num_workers, num_seats))
+        shm = shared_memory.SharedMemory(create=True, size=num_workers * (_SEAT_COLUMNS + 3 * num_seats) * 8)
+        counters = cls(TelemetrySpec(shm.name, num_workers, num_seats), shm)
+        counters.rows[:] = 0
+        return counters
+
+    @classmethod
+    def attach(cls, spec: TelemetrySpec) -> TelemetryCounters:
+        return cls(spec, shared_memory.SharedMemory(name=spec.name), owner=False)
+
+    @property
+    def games(self) -> np.ndarray:
+        return self.rows[:, _GAMES]
+
+    @property
+    def busy_ns(self) -> np.ndarray:
+        return self.rows[:, _BUSY_NS]
+
+    def _seat_block(self, block: int) -> np.ndarray:
+        start = _SEAT_COLUMNS + block * self.spec.num_seats
+        return self.rows[:, start:start + self.spec.num_seats]
+
+    @property
+    def decisions(self) -> np.ndarray:
+        return self._seat_block(0)
+
+    @property
+    def decision_ns(self) -> np.ndarray:
+        return self._seat_block(1)
+
+    @property
+    def exceptions(self) -> np.ndarray:
+        return self._seat_block(2)
+
+    def play_game(self, worker: int, game: WizardGame, seats: Mapping[WizardBasePlayer, int]):
+        """Play a game like ``run_decisions`` while timing every decision per seat."""
+        num_seats = self.spec.num_seats
+        decisions = [0] * num_seats
+        decision_ns = [0] * num_seats
+        exceptions = [0] * num_seats
+        clock = time.perf_counter_ns
+
+        start = clock()
+        steps = game.play_steps()
+        try:
+            decision = next(steps)
+            while True:
+                before = clock()
+                try:
+                    answer = decision.ask()
+                    error = None
+                except Exception as e:
+                    error = e
+
+                seat = seats[decision.player]
+                decision_ns[seat] += clock() - before
+                decisions[seat] += 1
+
+                if error is not None:
+                    exceptions[seat] += 1
+                    decision = steps.throw(error)
+                elif is_awaitable(answer):
+                    answer.close()
+                    raise TypeError(f'Player {decision.player.name} is asynchronous, use run_decisions_async')
+                else:
+                    decision = steps.send(answer)
+        except StopIteration:
+            self.rows[worker, _GAMES] += 1
+        finally:
+            row = self.rows[worker]
+            row[_BUSY_NS] += clock() - start
+            row[_SEAT_COLUMNS:] += decisions + decision_ns + exceptions
+
+    def copy(self) -> TelemetryCounters:
+        counters = TelemetryCounters(TelemetrySpec('', self.spec.num_workers, self.spec.num_seats))
+        counters.rows[:] = self.rows
+        return counters
+
+    def close(self):
+        if self._shm is not None:
+            self.rows = None
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+
+
+def rss_bytes(pid: int | None = None) -> int:
+    """Resident set size of a process, falls back to the peak RSS of this process without /proc."""
+    try:
+        with open(f'/proc/{pid or "self"}/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        if pid is not None and pid != os.getpid():
+            return 0
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Telemetry:
+    """
+    Export evaluation metrics while games are running.
+
+    A background thread samples the counters every ``interval`` seconds and
+    appends a snapshot to a rotating JSON-lines file (``jsonl_path``, rotated
+    at ``max_bytes`` keeping ``backups`` old files). With ``http_address``
+    an OpenMetrics text endpoint is served at ``/metrics``. The game loop only
+    adds to its counter row once per game, all aggregation happens here.
+    """
+
+    def __init__(
+            self,
+            interval: float = 1.0,
+            jsonl_path: str | None = None,
+            max_bytes: int = 10 * 1024 * 1024,
+            backups: int = 3,
+            http_address: tuple[str, int] | None = None
+    ):
+        self.interval = interval
+        self.jsonl_path = jsonl_path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.worker_pids: list[int] = []
+        self.last: dict[str, Any] | None = None
+
+        self._lock = threading.Lock()
+        self._counters: TelemetryCounters | None = None
+        self._running = False
+        self._seat_names: list[str] = []
+        self._run_start = 0.0
+        self._previous: tuple[float, int, int, np.ndarray] | None = None
+        self._stop = threading.Event()
+
+        self._server = None
+        if http_address is not None:
+            self._server = ThreadingHTTPServer(http_address, _metrics_handler(self))
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+        self._thread.start()
+
+    @property
+    def http_address(self) -> tuple[str, int] | None:
+        return self._server.server_address if self._server else None
+
+    def start_run(self, num_workers: int, seat_names: Sequence[str], shared: bool = False) -> TelemetryCounters:
+        with self._lock:
+            self._counters = TelemetryCounters.create(num_workers, len(seat_names), shared)
+            self._seat_names = list(seat_names)
+            self._run_start = time.perf_counter()
+            self._previous = None
+            self.worker_pids = []
+            self._running = True
+            return self._counters
+
+    def finish_run(self):
+        """Write a final snapshot and keep the totals of the run available."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            self._sample()
+            counters, self._counters = self._counters, self._counters.copy()
+            counters.close()
+            self.worker_pids = []
+
+    def snapshot(self) -> dict[str, Any] | None:
+        with self._lock:
+            return self._sample(write=False) if self._counters is not None else None
+
+    def openmetrics(self) -> str:
+        snapshot = self.snapshot()
+        lines = []
+
+        def metric(name: str, kind: str, samples: list[tuple[str, float]]):
+            lines.append(f'# TYPE {name} {kind}')
+            suffix = '_total' if kind == 'counter' else ''
+            lines.extend(f'{name}{suffix}{labels} {value}' for labels, value in samples)
+
+        if snapshot is not None:
+            agents = snapshot['agents']
+            metric('wizard_games', 'counter', [('', snapshot['games'])])
+            metric('wizard_decisions', 'counter', [(f'{{agent="{name}"}}', a['decisions']) for name, a in agents.items()])
+            metric('wizard_decision_seconds', 'counter', [(f'{{agent="{name}"}}', a['decision_seconds']) for name, a in agents.items()])
+            metric('wizard_agent_exceptions', 'counter', [(f'{{agent="{name}"}}', a['exceptions']) for name, a in agents.items()])
+            metric('wizard_games_per_second', 'gauge', [('', snapshot['games_per_second'])])
+            metric('wizard_decisions_per_second', 'gauge', [('', snapshot['decisions_per_second'])])
+            metric('wizard_rss_bytes', 'gauge', [('', snapshot['rss_bytes'])])
+            metric('wizard_worker_utilization', 'gauge', [
+                (f'{{worker="{worker}"}}', utilization) for worker, utilization in enumerate(snapshot['worker_utilization'])
+            ])
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                if self._running:
+                    self._sample()
+
+    def _sample(self, write: bool = True) -> dict[str, Any]:
+        counters = self._counters
+        now = time.perf_counter()
+        games = int(counters.games.sum())
+        decisions = int(counters.decisions.sum())
+        busy_ns = counters.busy_ns.copy()
+
+        previous_time, previous_games, previous_decisions, previous_busy = self._previous or (self._run_start, 0, 0, np.zeros_like(busy_ns))
+        elapsed = max(now - previous_time, 1e-9)
+
+        agents: dict[str, dict[str, float]] = {}
+        for seat, name in enumerate(self._seat_names):
+            agent = agents.setdefault(name, {'decisions': 0, 'decision_seconds': 0.0, 'exceptions': 0})
+            agent['decisions'] += int(counters.decisions[:, seat].sum())
+            agent['decision_seconds'] += int(counters.decision_ns[:, seat].sum()) / 1e9
+            agent['exceptions'] += int(counters.exceptions[:, seat].sum())
+        for agent in agents.values():
+            agent['mean_latency_us'] = agent['decision_seconds'] / agent['decisions'] * 1e6 if agent['decisions'] else 0.0
+
+        snapshot = {
+            'time': time.time(),
+            'elapsed': now - self._run_start,
+            'games': games,
+            'decisions': decisions,
+            'games_per_second': (games - previous_games) / elapsed,
+            'decisions_per_second': (decisions - previous_decisions) / elapsed,
+            'agents': agents,
+            'rss_bytes': rss_bytes() + sum(rss_bytes(pid) for pid in self.worker_pids),
+            'worker_utilization': [min(float(u), 1.0) for u in (busy_ns - previous_busy) / 1e9 / elapsed],
+        }
+
+        if write:
+            self._previous = (now, games, decisions, busy_ns)
+            self.last = snapshot
+            if self.jsonl_path is not None:
+                self._write(json.dumps(snapshot))
+        return snapshot
+
+    def _write(self, line: str):
+        if os.path.exists(self.jsonl_path) and os.path.getsize(self.jsonl_path) + len(line) + 1 > self.max_bytes:
+            for index in range(self.backups - 1, 0, -1):
+                if os.path.exists(f'{self.jsonl_path}.{index}'):
+                    os.replace(f'{self.jsonl_path}.{index}', f'{self.jsonl_path}.{index + 1}')
+            if self.backups > 0:
+                os.replace(self.jsonl_path, f'{self.jsonl_path}.1')
+            else:
+                os.remove(self.jsonl_path)
+
+        with open(self.jsonl_path, 'a') as f:
+            f.write(line + '\n')
+
+
+def _metrics_handler(telemetry: Telemetry):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != '/metrics':
+                self.send_error(404)
+                return
+            body = telemetry.openmetrics().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', OPENMETRICS_CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return MetricsHandler
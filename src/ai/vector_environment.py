@@ -0,0 +1,301 @@
+import multiprocessing
+import random
+from dataclasses import dataclass
+from typing import Type
+
+import numpy as np
+
+from src.ai.observation import ObservationEncoder
+from src.core.decision import Decision, DecisionKind
+from src.core.player import WizardBasePlayer
+from src.game.game_state import GameState
+from src.game.wizard_card import NUM_CARD_IDS, card_to_id
+from src.game.wizard_game import WizardGame
+
+MAX_BID = 20
+# Actions 0..MAX_BID are bids, the following NUM_CARD_IDS actions play the card with that id
+CARD_ACTION_OFFSET = MAX_BID + 1
+ACTION_SIZE = CARD_ACTION_OFFSET + NUM_CARD_IDS
+
+
+class PolicySeat(WizardBasePlayer):
+    """Placeholder for a seat whose decisions are taken by the caller of the vector environment."""
+
+    def make_bid(self, state: GameState) -> int:
+        raise RuntimeError(f'{self.name} is controlled by the vector environment')
+
+    def play_card(self, state: GameState):
+        raise RuntimeError(f'{self.name} is controlled by the vector environment')
+
+
+@dataclass(frozen=True)
+class VectorStep:
+    """
+    Batched result of a reset or step.
+
+    Row i describes the pending decision of table i. ``rewards`` and
+    ``final_scores`` are indexed by seat, in the order seats were created.
+    """
+    observations: np.ndarray  # (N, observation_size) float32, see ObservationEncoder
+    action_masks: np.ndarray  # (N, ACTION_SIZE) bool
+    seats: np.ndarray  # (N,) seat index of the acting policy seat
+    rewards: np.ndarray  # (N, P) round scores earned since the previous step
+    dones: np.ndarray  # (N,) True if the table finished a game and was reset
+    final_scores: np.ndarray  # (N, P) final scores of finished games, zero otherwise
+
+
+class _Table:
+    def __init__(self, num_players: int, opponents: list[Type[WizardBasePlayer]]):
+        self._num_players = num_players
+        self._opponents = opponents
+        self.game: WizardGame | None = None
+        self.seats: list[WizardBasePlayer] = []
+        self.decision: Decision | None = None
+        self._steps = None
+        self._scored_rounds = 0
+
+    def reset(self, rewards: np.ndarray):
+        num_policy_seats = self._num_players - len(self._opponents)
+        self.seats = [PolicySeat(f'policy_{i}') for i in range(num_policy_seats)]
+        self.seats += [
+            p_class(f'{p_class.__name__}_{i}')
+            for i, p_class in enumerate(self._opponents, num_policy_seats)
+        ]
+
+        self.game = self.game.reset() if self.game is not None else WizardGame()
+        for player in self.seats:
+            self.game.add_player(player)
+
+        self._scored_rounds = 0
+        self._steps = self.game.play_steps()
+        return self._advance(lambda: next(self._steps), rewards)
+
+    def step(self, answer, rewards: np.ndarray) -> bool:
+        return self._advance(lambda: self._steps.send(answer), rewards)
+
+    def _advance(self, resume, rewards: np.ndarray) -> bool:
+        """Run the game until a policy seat must decide. Returns True if the game ended."""
+        try:
+            decision = resume()
+            while not isinstance(decision.player, PolicySeat):
+                self._collect_rewards(rewards)
+                try:
+                    answer = decision.ask()
+                except Exception as e:
+                    decision = self._steps.throw(e)
+                else:
+                    decision = self._steps.send(answer)
+        except StopIteration:
+            self._collect_rewards(rewards)
+            self.decision = None
+            return True
+
+        self._collect_rewards(rewards)
+        self.decision = decision
+        return False
+
+    def _collect_rewards(self, rewards: np.ndarray):
+        round_scores = self.game.round_scores
+        while self._scored_rounds < len(round_scores):
+            self._scored_rounds += 1
+            for seat, player in enumerate(self.seats):
+                rewards[seat] += round_scores[self._scored_rounds][player]
+
+    def observe(self, encoder: ObservationEncoder, observation: np.ndarray, action_mask: np.ndarray) -> int:
+        decision = self.decision
+        state = decision.state
+        player = decision.player
+
+        encoder.encode(state, player, observation)
+
+        if decision.kind == DecisionKind.BID:
+            action_mask[:state.current_round_number + 1] = True
+        else:
+            for card in decision.legal_cards:
+                action_mask[CARD_ACTION_OFFSET + card_to_id(card)] = True
+
+        return self.seats.index(player)
+
+    def final_scores(self, final_scores: np.ndarray):
+        for seat, player in enumerate(self.seats):
+            final_scores[seat] = self.game.current_scores[player]
+
+
+class _LocalVectorEnv:
+    def __init__(self, num_envs: int, num_players: int, opponents: list[Type[WizardBasePlayer]]):
+        self.num_envs = num_envs
+        self.num_players = num_players
+        self._tables = [_Table(num_players, opponents) for _ in range(num_envs)]
+        self._encoder = ObservationEncoder(num_players)
+
+    def reset(self) -> VectorStep:
+        rewards = np.zeros((self.num_envs, self.num_players), dtype=np.float32)
+        for table, table_rewards in zip(self._tables, rewards):
+            table.reset(table_rewards)
+
+        return self._batch(rewards, np.zeros(self.num_envs, dtype=bool), rewards.copy())
+
+    def step(self, actions: np.ndarray) -> VectorStep:
+        rewards = np.zeros((self.num_envs, self.num_players), dtype=np.float32)
+        final_scores = np.zeros_like(rewards)
+        dones = np.zeros(self.num_envs, dtype=bool)
+
+        # Decode every action first, so an invalid one leaves all tables untouched
+        answers = [self._decode_action(table.decision, int(action)) for table, action in zip(self._tables, actions)]
+        for i, (table, answer) in enumerate(zip(self._tables, answers)):
+            done = table.step(answer, rewards[i])
+            if done:
+                dones[i] = True
+                table.final_scores(final_scores[i])
+                table.reset(np.zeros(self.num_players, dtype=np.float32))
+
+        return self._batch(rewards, dones, final_scores)
+
+    def _batch(self, rewards: np.ndarray, dones: np.ndarray, final_scores: np.ndarray) -> VectorStep:
+        observations = self._encoder.allocate(self.num_envs)
+        action_masks = np.zeros((self.num_envs, ACTION_SIZE), dtype=bool)
+        seats = np.zeros(self.num_envs, dtype=np.int64)
+
+        for i, table in enumerate(self._tables):
+            seats[i] = table.observe(self._encoder, observations[i], action_masks[i])
+
+        return VectorStep(observations, action_masks, seats, rewards, dones, final_scores)
+
+    @staticmethod
+    def _decode_action(decision: Decision, action: int):
+        if decision.kind == DecisionKind.BID:
+            if not 0 <= action <= decision.state.current_round_number:
+                raise ValueError(f'Invalid bid action {action}')
+            return action
+
+        card_id = action - CARD_ACTION_OFFSET
+        card = next((c for c in decision.legal_cards if card_to_id(c) == card_id), None)
+        if card is None:
+            raise ValueError(f'Invalid card action {action}')
+        return card
+
+    def close(self):
+        pass
+
+
+def _worker(conn, num_envs: int, num_players: int, opponents: list[Type[WizardBasePlayer]], seed: int | None):
+    if seed is not None:
+        random.seed(seed)
+    env = _LocalVectorEnv(num_envs, num_players, opponents)
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == 'reset':
+                conn.send(env.reset())
+            elif command == 'step':
+                conn.send(env.step(data))
+            elif command == 'close':
+                break
+    finally:
+        conn.close()
+
+
+class WizardVectorEnv:
+    """
+    Gym-style vector environment running several Wizard tables in lockstep.
+
+    Every table has ``num_players`` seats; the seats not taken by
+    ``opponents`` are policy seats whose decisions are taken by the caller.
+    Each ``step`` receives one action per table and returns batched
+    observations, legal action masks and rewards for the next policy
+    decision of every table. Finished tables are reset automatically.
+    """
+
+    def __init__(
+            self,
+            num_envs: int,
+            num_players: int = 3,
+            opponents: list[Type[WizardBasePlayer]] | None = None,
+            num_workers: int = 0,
+            seed: int | None = None
+    ):
+        opponents = list(opponents or [])
+        if not 3 <= num_players <= 6:
+            raise ValueError('Number of players must be between 3 and 6')
+        if len(opponents) >= num_players:
+            raise ValueError('At least one seat must be controlled by the policy')
+
+        self.num_envs = num_envs
+        self.num_players = num_players
+        self.observation_size = ObservationEncoder(num_players).size
+        self._workers = []
+        self._connections = []
+        self._action_masks: np.ndarray | None = None
+
+        if num_workers <= 0:
+            if seed is not None:
+                random.seed(seed)
+            self._local = _LocalVectorEnv(num_envs, num_players, opponents)
+            return
+
+        self._local = None
+        self._slices = np.array_split(np.arange(num_envs), min(num_workers, num_envs))
+        for worker_index, env_slice in enumerate(self._slices):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            worker_seed = None if seed is None else seed + worker_index
+            process = multiprocessing.Process(
+                target=_worker,
+                args=(child_conn, len(env_slice), num_players, opponents, worker_seed),
+                daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self._workers.append(process)
+            self._connections.append(parent_conn)
+
+    def reset(self) -> VectorStep:
+        if self._local is not None:
+            return self._local.reset()
+
+        for conn in self._connections:
+            conn.send(('reset', None))
+        return self._gather()
+
+    def step(self, actions) -> VectorStep:
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_envs,):
+            raise ValueError(f'Expected {self.num_envs} actions, got shape {actions.shape}')
+
+        if self._local is not None:
+            return self._local.step(actions)
+
+        # Validate against the masks of the last step before any worker advances its tables
+        if self._action_masks is None:
+            raise RuntimeError('reset must be called before step')
+        in_range = (actions >= 0) & (actions < ACTION_SIZE)
+        legal = in_range & self._action_masks[np.arange(self.num_envs), np.where(in_range, actions, 0)]
+        if not legal.all():
+            raise ValueError(f'Invalid actions {actions[~legal].tolist()} for tables {np.flatnonzero(~legal).tolist()}')
+
+        for conn, env_slice in zip(self._connections, self._slices):
+            conn.send(('step', actions[env_slice]))
+        return self._gather()
+
+    def _gather(self) -> VectorStep:
+        results = [conn.recv() for conn in self._connections]
+        step = VectorStep(*(
+            np.concatenate([getattr(result, field) for result in results])
+            for field in VectorStep.__dataclass_fields__
+        ))
+        self._action_masks = step.action_masks
+        return step
+
+    def close(self):
+        for conn in self._connections:
+            conn.send(('close', None))
+            conn.close()
+        for process in self._workers:
+            process.join()
+        self._connections = []
+        self._workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
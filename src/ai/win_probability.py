@@ -0,0 +1,212 @@
+from functools import lru_cache
+from math import comb, perm
+from typing import Iterable
+
+import numpy as np
+
+from src.core.trick_kernel import NO_TRUMP
+from src.game.wizard_card import (
+    CardSuit, CardType, JESTER_ID, NUM_CARD_IDS, NUM_SUIT_VALUES, SUIT_INDEX, WIZARD_ID, WizardCard, card_to_id
+)
+
+DECK_SIZE = 60
+# Copies of the Wizard and of the Jester in a deck
+NUM_SPECIAL_COPIES = 4
+
+# Exact binomial coefficients C(n, k) for 0 <= k <= n <= DECK_SIZE
+BINOMIAL: tuple[tuple[int, ...], ...] = tuple(
+    tuple(comb(n, k) for k in range(DECK_SIZE + 1))
+    for n in range(DECK_SIZE + 1)
+)
+# The same table as float64 for the batched entry point
+BINOMIAL_TABLE = np.array([[float(c) for c in row] for row in BINOMIAL])
+# Falling factorials n! / (n - k)! as float64, 0 for k > n
+PERM_TABLE = np.array([[float(perm(n, k)) for k in range(DECK_SIZE + 1)] for n in range(DECK_SIZE + 1)])
+
+
+@lru_cache(maxsize=None)
+def no_threat_probability(unknown: int, threats: int, opponents: int) -> float:
+    """
+    Probability that none of ``opponents`` cards drawn without replacement from
+    ``unknown`` unseen cards is one of the ``threats`` cards.
+
+    This is the hypergeometric P(X = 0) = C(unknown - threats, opponents) / C(unknown, opponents),
+    computed exactly from integer binomials and rounded once.
+    """
+    if opponents > unknown:
+        return 0.0
+    return BINOMIAL[unknown - threats][opponents] / BINOMIAL[unknown][opponents]
+
+
+def no_threat_probability_batch(unknown: np.ndarray, threats: np.ndarray, opponents: np.ndarray) -> np.ndarray:
+    """Vectorized no_threat_probability for arrays of equal shape (or broadcastable)."""
+    unknown, threats, opponents = np.broadcast_arrays(
+        np.asarray(unknown, dtype=np.intp), np.asarray(threats, dtype=np.intp), np.asarray(opponents, dtype=np.intp)
+    )
+    valid = opponents <= unknown
+    safe = np.clip(unknown - threats, 0, DECK_SIZE)
+    drawn = np.minimum(opponents, unknown)
+    return np.where(valid, BINOMIAL_TABLE[safe, drawn] / BINOMIAL_TABLE[unknown, drawn], 0.0)
+
+
+@lru_cache(maxsize=None)
+def follow_win_probability(unknown: int, threats: int, jesters: int, lower: int, before: int, after: int) -> float:
+    """
+    Probability that a standard card wins with ``before`` opponents playing ahead of it and ``after`` behind it.
+
+    No opponent may play one of the ``threats`` cards, and ahead of the card
+    the first non-Jester must be one of the ``lower`` cards of its suit (or
+    there is none), otherwise another suit becomes the trick suit. Counted
+    exactly with falling factorials over the position of that first card.
+    """
+    safe = unknown - threats
+    if safe < before + after:
+        return 0.0
+
+    ways = perm(jesters, before) * perm(safe - before, after)
+    for k in range(before):
+        ways += perm(jesters, k) * lower * perm(safe - k - 1, before - k - 1 + after)
+    return ways / perm(unknown, before + after)
+
+
+def follow_win_probability_batch(
+        unknown: np.ndarray,
+        threats: np.ndarray,
+        jesters: np.ndarray,
+        lower: np.ndarray,
+        before: np.ndarray,
+        after: np.ndarray
+) -> np.ndarray:
+    """Vectorized follow_win_probability for broadcastable integer arrays."""
+    unknown, threats, jesters, lower, before, after = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.intp) for a in (unknown, threats, jesters, lower, before, after))
+    )
+    safe = unknown - threats
+    valid = safe >= before + after
+
+    def falling(n, k):
+        return PERM_TABLE[np.clip(n, 0, DECK_SIZE), np.clip(k, 0, DECK_SIZE)]
+
+    ways = falling(jesters, before) * falling(safe - before, after)
+    for k in range(int(before.max(initial=0))):
+        ways += np.where(k < before, falling(jesters, k) * lower * falling(safe - k - 1, before - k - 1 + after), 0.0)
+    return np.where(valid, ways / falling(unknown, before + after), 0.0)
+
+
+def card_win_probability(
+        card: WizardCard,
+        hand: Iterable[WizardCard],
+        trump_card: WizardCard | None,
+        played_cards: Iterable[WizardCard],
+        seat: int,
+        num_players: int,
+        trump_suit: CardSuit | None = None
+) -> float:
+    """
+    Probability that ``card`` wins a trick it is played into as the ``seat``-th card.
+
+    Every opponent is assumed to play one card drawn at random from the
+    cards this player has not seen (not in ``hand``, ``played_cards`` or the
+    trump card). That is exact for the first round, where each opponent
+    holds a single card dealt from those and has to play it. In later
+    rounds opponents choose their card and follow suit, so it is only an
+    estimate there. ``trump_suit`` defaults to the suit of ``trump_card``,
+    pass it when the dealer picked the trump suit.
+    """
+    seen = list(hand) + list(played_cards) + ([trump_card] if trump_card else [])
+    if trump_suit is None and trump_card is not None:
+        trump_suit = trump_card.card_suit
+    unknown = DECK_SIZE - len(seen)
+    before = seat
+    after = num_players - 1 - seat
+
+    wizards = NUM_SPECIAL_COPIES - sum(1 for c in seen if c.card_type == CardType.WIZARD)
+    jesters = NUM_SPECIAL_COPIES - sum(1 for c in seen if c.card_type == CardType.JESTER)
+    seen_ids = {card_to_id(c) for c in seen if c.card_type == CardType.STANDARD}
+
+    def unseen_above(suit: CardSuit, value: int) -> int:
+        base = SUIT_INDEX[suit] * NUM_SUIT_VALUES
+        return sum(1 for v in range(value + 1, NUM_SUIT_VALUES + 1) if base + v - 1 not in seen_ids)
+
+    if card.card_type == CardType.WIZARD:
+        # Only a Wizard played earlier beats a Wizard
+        return no_threat_probability(unknown, wizards, before)
+    elif card.card_type == CardType.JESTER:
+        # A Jester only wins if it leads and everybody else plays a Jester
+        return no_threat_probability(unknown, unknown - jesters, before + after) if before == 0 else 0.0
+    elif card.card_suit == trump_suit:
+        # Wizards and higher trump cards are better
+        return no_threat_probability(unknown, wizards + unseen_above(card.card_suit, card.card_value), before + after)
+
+    higher = unseen_above(card.card_suit, card.card_value)
+    trumps = unseen_above(trump_suit, 0) if trump_suit else 0
+    threats = wizards + trumps + higher
+    if before == 0:
+        return no_threat_probability(unknown, threats, after)
+
+    # Earlier players must not set another trick suit before a lower card of the same suit does
+    lower = unseen_above(card.card_suit, 0) - higher
+    return follow_win_probability(unknown, threats, jesters, lower, before, after)
+
+
+def seen_card_counts(hand: Iterable[WizardCard], trump_card: WizardCard | None, played_cards: Iterable[WizardCard]) -> np.ndarray:
+    """(NUM_CARD_IDS,) number of copies of every card id in the hand, the played cards and the trump card."""
+    seen = [card_to_id(c) for c in hand] + [card_to_id(c) for c in played_cards]
+    if trump_card is not None:
+        seen.append(card_to_id(trump_card))
+    return np.bincount(np.asarray(seen, dtype=np.intp), minlength=NUM_CARD_IDS)
+
+
+def card_win_probability_batch(
+        cards: np.ndarray,
+        seen: np.ndarray,
+        trump: np.ndarray | int,
+        seat: np.ndarray | int,
+        num_players: np.ndarray | int
+) -> np.ndarray:
+    """
+    card_win_probability for many cards at once, on card ids.
+
+    :param cards: (N,) card ids
+    :param seen: (N, NUM_CARD_IDS) copies of every card id seen by the player, see seen_card_counts
+    :param trump: (N,) trump suit index (see SUIT_INDEX), NO_TRUMP if none
+    :param seat: (N,) number of cards played into the trick before the card
+    :param num_players: (N,) players in the game
+    :return: (N,) win probabilities
+    """
+    cards = np.asarray(cards, dtype=np.intp)
+    seen = np.asarray(seen, dtype=np.intp).reshape(len(cards), NUM_CARD_IDS)
+    trump, before, num_players = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.intp) for a in (trump, seat, num_players)), cards
+    )[:3]
+    rows = np.arange(len(cards))
+    after = num_players - 1 - before
+
+    unknown = DECK_SIZE - seen.sum(axis=1)
+    wizards = NUM_SPECIAL_COPIES - seen[:, WIZARD_ID]
+    jesters = NUM_SPECIAL_COPIES - seen[:, JESTER_ID]
+
+    # Unseen standard cards of each suit with a value at least v, per suit and value index v
+    unseen = (seen[:, :WIZARD_ID] == 0).reshape(len(cards), len(CardSuit), NUM_SUIT_VALUES)
+    at_least = np.cumsum(unseen[:, :, ::-1], axis=2)[:, :, ::-1]
+    standard = cards < WIZARD_ID
+    suit = np.where(standard, cards // NUM_SUIT_VALUES, 0)
+    value = np.where(standard, cards % NUM_SUIT_VALUES, 0)
+    in_suit = at_least[rows, suit, 0]
+    higher = at_least[rows, suit, value] - unseen[rows, suit, value]
+    trumps = np.where(trump == NO_TRUMP, 0, at_least[rows, np.maximum(trump, 0), 0])
+
+    is_trump = standard & (suit == trump)
+    threats = np.where(is_trump, wizards + higher, wizards + trumps + higher)
+    leading = no_threat_probability_batch(unknown, threats, np.where(is_trump, before + after, after))
+    following = follow_win_probability_batch(unknown, threats, jesters, in_suit - higher, before, after)
+
+    return np.select(
+        [cards == WIZARD_ID, cards == JESTER_ID, is_trump | (before == 0)],
+        [
+            no_threat_probability_batch(unknown, wizards, before),
+            np.where(before == 0, no_threat_probability_batch(unknown, unknown - jesters, before + after), 0.0),
+            leading
+        ],
+        following
+    )
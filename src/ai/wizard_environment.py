@@ -1,30 +1,144 @@
-from typing import Type
+import contextlib
+import multiprocessing
+import random
+import time
+from typing import Sequence, Type
 
 import numpy as np
 from matplotlib import pyplot as plt
 
+from src.ai.confidence import bootstrap_mean_interval, std_interval
+from src.ai.distributed import EvaluationCoordinator
+from src.ai.evaluation_records import EvaluationRecords
+from src.ai.live_progress import LiveProgress
+from src.ai.memory_profile import MemoryProfiler
+from src.ai.pipeline import ProgressPrinter, ResultConsumer, ResultPipeline, StatsAccumulator
+from src.ai.result_cache import EvaluationCache
+from src.ai.shared_records import SharedEvaluationRecords, SharedRecordsSpec
+from src.ai.telemetry import Telemetry, TelemetryCounters, TelemetrySpec
 from src.core.player import WizardBasePlayer
 from src.game.wizard_game import WizardGame
 
 
+def play_game_into(
+        records: EvaluationRecords,
+        index: int,
+        player_classes: Sequence[Type[WizardBasePlayer]],
+        seed: int | None,
+        telemetry: TelemetryCounters | None = None,
+        worker_index: int = 0,
+        game: WizardGame | None = None
+) -> WizardGame:
+    """
+    Play one game of the lineup and store its results in row ``index`` of ``records``.
+
+    ``game`` is reset and reused if given, pass the returned game to play the
+    next one with the same engine objects.
+    """
+    if seed is not None:
+        random.seed(seed)
+
+    if game is None:
+        game = WizardGame()
+    else:
+        # Games of an evaluation are independent, so the reused game starts without opponent statistics
+        game.reset()
+        game.opponent_model.clear()
+
+    # Create players for this game
+    seats = {}
+    for i, p_class in enumerate(player_classes):
+        player = p_class(f'{p_class.__name__ }_{i}')
+        seats[player] = i
+        game.add_player(player)
+
+    # Play the game
+    if telemetry is None:
+        game.start_game()
+    else:
+        telemetry.play_game(worker_index, game, seats)
+
+    records.record_game(index, game, seats, seed)
+    return game
+
+
+def _simulate_worker(
+        spec: SharedRecordsSpec,
+        worker_index: int,
+        player_classes: Sequence[Type[WizardBasePlayer]],
+        seeds: Sequence[int | None],
+        start: int,
+        stop: int,
+        telemetry_spec: TelemetrySpec | None = None
+):
+    # Forked workers inherit the parent's random state, unseeded games must not repeat
+    random.seed()
+
+    shared = SharedEvaluationRecords.attach(spec)
+    telemetry = TelemetryCounters.attach(telemetry_spec) if telemetry_spec is not None else None
+    try:
+        game = None
+        for index in range(start, stop):
+            game = play_game_into(shared.records, index, player_classes, seeds[index], telemetry, worker_index, game)
+            shared.progress[worker_index] += 1
+    finally:
+        shared.close()
+        if telemetry is not None:
+            telemetry.close()
+
+
 class WizardEnvironment:
-    def __init__(self):
+    # Games played in-process are streamed to the result consumers in chunks of this size
+    stream_chunk_size = 10
+    # Bootstrap resamples and confidence level of the intervals in the results
+    ci_resamples = 1000
+    ci_confidence = 0.95
+
+    def __init__(self, telemetry: Telemetry | None = None, memory_profiler: MemoryProfiler | None = None):
         self.stats: dict[str, dict] = {}
+        self.records: EvaluationRecords | None = None
+        self.telemetry = telemetry
+        self.memory_profiler = memory_profiler
+        self._pipeline: ResultPipeline | None = None
+        self._live: LiveProgress | None = None
 
     def evaluate_players(
             self,
             player_classes: list[Type[WizardBasePlayer]],
-            num_games: int = 100
+            num_games: int = 100,
+            seed: int | None = None,
+            cache_dir: str | None = None,
+            workers: int = 0,
+            coordinator: EvaluationCoordinator | None = None,
+            consumers: Sequence[ResultConsumer] = (),
+            queue_size: int = 16,
+            live: bool = False
     ) -> dict[str, dict]:
         """
         Evaluate multiple AI players over several games.
 
         :param player_classes: List of WizardBasePlayer classes to evaluate
         :param num_games: Number of games to play
-        :param players_per_game: Number of players in each game
+        :param seed: Game i is played with seed ``seed + i``, unseeded if None
+        :param cache_dir: Directory caching results per lineup and seed, requires a seed
+        :param workers: Number of worker processes, games are played in-process if 0
+        :param coordinator: Hands the seed ranges to remote workers instead, requires a seed
+        :param consumers: Extra consumers streamed the results while games are played, see ResultPipeline
+        :param queue_size: Number of result chunks buffered per consumer before the simulation waits
+        :param live: Show a LiveProgress view instead of printing the number of completed games
+
+        The per-game lists of the returned stats (scores, positions, round
+        scores and bet history) are in seed order, like ``self.records``, even
+        though consumers see the games in the order they finished.
         """
         if not 3 <= len(player_classes) <= 6:
             raise ValueError('Number of players must be between 3 and 6')
+        if cache_dir is not None and seed is None:
+            raise ValueError('Caching evaluation results requires a seed')
+        if coordinator is not None and seed is None:
+            raise ValueError('Distributed evaluation requires a seed')
+        if self.memory_profiler is not None and (workers > 0 or coordinator is not None):
+            raise ValueError('Memory profiling only runs in-process')
 
         # Initialize statistics tracking
         self.stats = {
@@ -44,67 +158,212 @@ class WizardEnvironment:
             for player_class in player_classes
         }
 
-        # Run games
-        for game_num in range(num_games):
-            # Create new game instance
-            game = WizardGame()
-
-            # Create players for this game
-            game_players = []
-            for i, p_class in enumerate(player_classes):
-                # player_class = np.random.choice(player_classes)
-                player = p_class(f'{p_class.__name__ }_{i}')
-                game_players.append(player)
-                game.add_player(player)
-
-            # Play the game
-            game.start_game()
-
-            # Update statistics
-            self._update_stats(game)
-
-            if (game_num + 1) % 10 == 0:
-                print(f'Completed {game_num + 1} games')
+        stats = StatsAccumulator(lambda chunk: self._update_stats(chunk, player_classes))
+        if live:
+            progress = self._live = LiveProgress(num_games, [p_class.__name__ for p_class in player_classes], self.telemetry)
+        else:
+            progress = ProgressPrinter()
+        self._pipeline = ResultPipeline([stats, progress, *consumers], queue_size)
+        try:
+            with self._pipeline:
+                records = self._play(player_classes, num_games, seed, cache_dir, workers, coordinator)
+        finally:
+            self._pipeline = None
+            self._live = None
+
+        self.records = records
 
         # Calculate final statistics
+        self._collect_per_game_stats(records, player_classes)
         self._calculate_final_stats(num_games)
+        self._calculate_confidence_intervals(player_classes)
 
         return self.stats
 
-    def _update_stats(self, game: WizardGame):
-        """Update statistics after each game"""
-        scores = game.current_scores
-        round_scores = game.round_scores
-        bets_history = game.bets_history
-
-        # Sort players by score to get positions
-        sorted_players = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        max_score = sorted_players[0][1]
+    def _play(
+            self,
+            player_classes: list[Type[WizardBasePlayer]],
+            num_games: int,
+            seed: int | None,
+            cache_dir: str | None,
+            workers: int,
+            coordinator: EvaluationCoordinator | None
+    ) -> EvaluationRecords:
+        """Collect the records of all games from the cache, the coordinator or a simulation, in seed order"""
+        if seed is None:
+            return self.simulate(player_classes, [None] * num_games, workers)
+
+        seeds = range(seed, seed + num_games)
+        cached, missing = None, [seeds]
+        cache = EvaluationCache(cache_dir) if cache_dir is not None else None
+        if cache:
+            cached, missing = cache.load(player_classes, seeds)
+
+        shards = []
+        if cached is not None:
+            self._publish(cached)
+            shards.append(cached)
+        for seed_range in missing:
+            if coordinator is not None:
+                shard = coordinator.run(player_classes, seed_range)
+                self._publish(shard)
+            else:
+                shard = self.simulate(player_classes, seed_range, workers)
+            if cache:
+                cache.store(player_classes, shard)
+            shards.append(shard)
+
+        records = EvaluationRecords.concatenate(shards)
+        return records[np.argsort(records.seeds, kind='stable')]
+
+    def _publish(self, records: EvaluationRecords):
+        """Stream finished games to the consumers of the running evaluation, if any"""
+        if self._pipeline is not None:
+            self._pipeline.put(records)
+
+    def simulate(
+            self,
+            player_classes: list[Type[WizardBasePlayer]],
+            seeds: Sequence[int | None],
+            workers: int = 0
+    ) -> EvaluationRecords:
+        """
+        Play one game per seed and return the per-game records.
 
-        for position, (player, score) in enumerate(sorted_players, 1):
-            player_class_name = player.__class__.__name__
-            stats = self.stats[player_class_name]
+        Unlike evaluate_players this neither caches nor updates the stats; the
+        games are only streamed to the consumers of a running evaluation.
+        """
+        if workers > 0 and len(seeds) > 1:
+            return self._simulate_in_workers(player_classes, seeds, workers)
+
+        telemetry = None
+        if self.telemetry is not None:
+            telemetry = self.telemetry.start_run(1, [p_class.__name__ for p_class in player_classes])
+
+        records = EvaluationRecords.empty(len(seeds), len(player_classes))
+        profile = self.memory_profiler.profile() if self.memory_profiler is not None else contextlib.nullcontext()
+        try:
+            with profile:
+                published, game = 0, None
+                for game_num in range(len(seeds)):
+                    game = play_game_into(records, game_num, player_classes, seeds[game_num], telemetry, game=game)
+
+                    if game_num + 1 - published >= self.stream_chunk_size:
+                        self._publish(records[published:game_num + 1])
+                        published = game_num + 1
+                self._publish(records[published:])
+        finally:
+            if self.telemetry is not None:
+                self.telemetry.finish_run()
+
+        return records
+
+    def _simulate_in_workers(
+            self,
+            player_classes: list[Type[WizardBasePlayer]],
+            seeds: Sequence[int | None],
+            workers: int
+    ) -> EvaluationRecords:
+        """
+        Play the games in worker processes writing into shared memory.
 
-            stats['total_games'] += 1
-            stats['total_score'] += score
-            stats['scores'].append(score)
-            stats['positions'].append(position)
-            stats['cumulative_scores'].append(score)  # Store final game score
+        Workers fill their own contiguous block of game rows and progress
+        slot, the parent only polls the counters, streams copies of newly
+        finished rows to the consumers and copies the finished arrays once.
+        """
+        workers = min(workers, len(seeds))
+        blocks = np.array_split(np.arange(len(seeds)), workers)
+
+        telemetry_spec = None
+        if self.telemetry is not None:
+            names = [p_class.__name__ for p_class in player_classes]
+            telemetry_spec = self.telemetry.start_run(workers, names, shared=True).spec
+
+        with SharedEvaluationRecords.create(len(seeds), len(player_classes), workers) as shared:
+            processes = [
+                multiprocessing.Process(
+                    target=_simulate_worker,
+                    args=(
+                        shared.spec, worker_index, player_classes, list(seeds),
+                        int(block[0]), int(block[-1]) + 1, telemetry_spec
+                    ),
+                    daemon=True
+                )
+                for worker_index, block in enumerate(blocks)
+            ]
+            for process in processes:
+                process.start()
+            if self.telemetry is not None:
+                self.telemetry.worker_pids = [process.pid for process in processes]
+
+            # The live view reads the progress counters, it keeps a copy once the memory is released
+            live = self._live
+            block_sizes = [len(block) for block in blocks]
+            if live is not None:
+                live.watch_workers(shared.progress, block_sizes)
+            try:
+                published = [0] * workers
+
+                def publish_finished_rows():
+                    for worker_index, block in enumerate(blocks):
+                        done = int(shared.progress[worker_index])
+                        if done > published[worker_index]:
+                            start = int(block[0])
+                            self._publish(shared.records[start + published[worker_index]:start + done].copy())
+                            published[worker_index] = done
+
+                while any(process.is_alive() for process in processes):
+                    time.sleep(0.05)
+                    publish_finished_rows()
+
+                if self.telemetry is not None:
+                    self.telemetry.finish_run()
+
+                for process in processes:
+                    process.join()
+                    if process.exitcode != 0:
+                        raise RuntimeError(f'Evaluation worker failed with exit code {process.exitcode}')
+                publish_finished_rows()
+
+                return shared.copy()
+            finally:
+                if live is not None:
+                    live.watch_workers(shared.progress.copy(), block_sizes)
+
+    def _update_stats(self, records: EvaluationRecords, player_classes: list[Type[WizardBasePlayer]]):
+        """Update the running totals from the records of finished games, in any order"""
+        max_scores = records.scores.max(axis=1)
+
+        for seat, player_class in enumerate(player_classes):
+            stats = self.stats[player_class.__name__]
+            scores = records.scores[:, seat]
+
+            stats['total_games'] += len(records)
+            stats['total_score'] += int(scores.sum())
 
             # Count wins (including ties)
-            if score == max_score:
-                stats['wins'] += 1
+            stats['wins'] += int((scores == max_scores).sum())
 
-            for round_num in bets_history:
-                if player in bets_history[round_num]:
-                    stats['round_scores'][round_num].append(round_scores[round_num][player])
-                    bet_info = bets_history[round_num][player]
-                    stats['bets_placed'][round_num] += 1
-                    if bet_info['diff'] == 0:
-                        stats['right_bets'][round_num] += 1
+            for round_index in range(records.bets.shape[2]):
+                round_num = round_index + 1
+                stats['bets_placed'][round_num] += len(records)
+                stats['right_bets'][round_num] += int((records.diffs[:, seat, round_index] == 0).sum())
 
-                    stats['bet_history'][round_num]['bets'].append(bet_info['bet'])
-                    stats['bet_history'][round_num]['diffs'].append(bet_info['diff'])
+    def _collect_per_game_stats(self, records: EvaluationRecords, player_classes: list[Type[WizardBasePlayer]]):
+        """Fill the per-game lists of the stats from all records, in seed order"""
+        for seat, player_class in enumerate(player_classes):
+            stats = self.stats[player_class.__name__]
+            scores = records.scores[:, seat]
+
+            stats['scores'].extend(scores.tolist())
+            stats['positions'].extend(records.positions[:, seat].tolist())
+            stats['cumulative_scores'].extend(scores.tolist())  # Store final game score
+
+            for round_index in range(records.bets.shape[2]):
+                round_num = round_index + 1
+                stats['round_scores'][round_num].extend(records.round_scores[:, seat, round_index].tolist())
+                stats['bet_history'][round_num]['bets'].extend(records.bets[:, seat, round_index].tolist())
+                stats['bet_history'][round_num]['diffs'].extend(records.diffs[:, seat, round_index].tolist())
 
     def _calculate_final_stats(self, num_games: int):
         """Calculate final statistics for all players"""
@@ -119,21 +378,75 @@ class WizardEnvironment:
                 position_counts = np.bincount(player_stats['positions'], minlength=7)[1:7]
                 player_stats['position_distribution'] = position_counts / len(player_stats['positions'])
 
+    def _calculate_confidence_intervals(self, player_classes: list[Type[WizardBasePlayer]]):
+        """
+        Confidence intervals of the reported metrics, with games as the unit of sampling.
+
+        Means are bootstrapped, seats of the same agent are summed per game
+        first so whole games are resampled. The score std gets a normal
+        interval, see std_interval. Seeded with a fixed generator, the intervals are
+        reproducible and leave the global random state alone.
+        """
+        records = self.records
+        rng = np.random.default_rng(0)
+        wins = records.scores == records.scores.max(axis=1, keepdims=True)
+        right_bets = records.diffs == 0
+        names = [p_class.__name__ for p_class in player_classes]
+
+        for name in dict.fromkeys(names):
+            seats = [seat for seat, seat_name in enumerate(names) if seat_name == name]
+
+            def interval(samples: np.ndarray) -> np.ndarray:
+                return bootstrap_mean_interval(samples, len(seats), self.ci_resamples, self.ci_confidence, rng)
+
+            def seat_total(samples: np.ndarray) -> np.ndarray:
+                # Adding the seat views avoids copying all seats of the agent first
+                total = samples[:, seats[0]]
+                for seat in seats[1:]:
+                    total = np.add(total, samples[:, seat], dtype=np.result_type(samples.dtype, np.int16))
+                return total
+
+            def per_round(samples: np.ndarray) -> dict[int, tuple[float, float]]:
+                bounds = interval(seat_total(samples))
+                return {round_index + 1: tuple(round_bounds) for round_index, round_bounds in enumerate(bounds.tolist())}
+
+            positions = records.positions[:, seats]
+            stats = self.stats[name]
+            stats['win_rate_ci'] = tuple(interval(seat_total(wins)).tolist())
+            stats['average_score_ci'] = tuple(interval(seat_total(records.scores)).tolist())
+            stats['score_std_ci'] = tuple(std_interval(records.scores[:, seats], self.ci_confidence).tolist())
+            stats['average_position_ci'] = tuple(interval(seat_total(records.positions)).tolist())
+            stats['position_distribution_ci'] = [
+                tuple(bounds) for bounds in interval(np.stack([
+                    (positions == position).sum(axis=1, dtype=np.int8) for position in range(1, 7)
+                ], axis=1)).tolist()
+            ]
+            stats['bet_accuracy_ci'] = per_round(right_bets)
+            stats['average_bet_ci'] = per_round(records.bets)
+            stats['average_diff_ci'] = per_round(records.diffs)
+
     def print_results(self):
         """Print formatted results of the evaluation"""
         print('\nEvaluation Results:')
+        print(f'Brackets are {self.ci_confidence:.0%} bootstrap confidence intervals, normal approximation for the score std')
         print('-' * 80)
 
         for player_name, stats in self.stats.items():
             print(f'\nPlayer: {player_name}')
             print(f"Games Played: {stats['total_games']}")
-            print(f"Win Rate: {stats['win_rate']:.2%}")
-            print(f"Average Score: {stats['average_score']:.2f} (±{stats['score_std']:.2f})")
-            print(f"Average Position: {stats['average_position']:.2f}")
+            win_low, win_high = stats['win_rate_ci']
+            score_low, score_high = stats['average_score_ci']
+            position_low, position_high = stats['average_position_ci']
+            print(f"Win Rate: {stats['win_rate']:.2%} [{win_low:.2%}, {win_high:.2%}]")
+            std_low, std_high = stats['score_std_ci']
+            print(f"Average Score: {stats['average_score']:.2f} [{score_low:.2f}, {score_high:.2f}]")
+            print(f"Score Std: {stats['score_std']:.2f} [{std_low:.2f}, {std_high:.2f}]")
+            print(f"Average Position: {stats['average_position']:.2f} [{position_low:.2f}, {position_high:.2f}]")
 
             print("\nPosition Distribution:")
-            for pos, freq in enumerate(stats['position_distribution'], 1):
-                print(f"  {pos}th: {freq:.2%}")
+            for pos, (freq, (freq_low, freq_high)) in enumerate(
+                    zip(stats['position_distribution'], stats['position_distribution_ci']), 1):
+                print(f"  {pos}th: {freq:.2%} [{freq_low:.2%}, {freq_high:.2%}]")
 
             print('\nBetting Statistics by Round:')
             for round_num in range(1, 21):
@@ -146,9 +459,12 @@ class WizardEnvironment:
                     accuracy = right_bets / placed_bets
 
                     print(f'  Round {round_num}:')
-                    print(f'    Accuracy: {accuracy:.2%} ({right_bets}/{placed_bets})')
-                    print(f'    Avg Bet:  {avg_bet:.2}')
-                    print(f'    Avg Diff: {avg_diff:.2}')
+                    accuracy_low, accuracy_high = stats['bet_accuracy_ci'][round_num]
+                    print(f'    Accuracy: {accuracy:.2%} [{accuracy_low:.2%}, {accuracy_high:.2%}] ({right_bets}/{placed_bets})')
+                    bet_low, bet_high = stats['average_bet_ci'][round_num]
+                    diff_low, diff_high = stats['average_diff_ci'][round_num]
+                    print(f'    Avg Bet:  {avg_bet:.2} [{bet_low:.2}, {bet_high:.2}]')
+                    print(f'    Avg Diff: {avg_diff:.2} [{diff_low:.2}, {diff_high:.2}]')
 
         print("-" * 80)
 
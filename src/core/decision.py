@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import inspect
+import threading
+from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Generator, Sequence, TypeVar
+
+from src.core.card import Card
+from src.core.tracing import traced
+
+if TYPE_CHECKING:
+    from src.core.player import WizardBasePlayer
+    from src.game.game_state import GameState
+    from src.game.wizard_card import WizardCard
+
+
+T = TypeVar('T')
+
+
+class DecisionKind(Enum):
+    BID = 'bid'
+    PLAY_CARD = 'play_card'
+
+
+@dataclass(frozen=True)
+class Decision:
+    """A pending agent decision yielded by the engine's step generators."""
+    player: WizardBasePlayer
+    kind: DecisionKind
+    state: GameState
+    legal_cards: tuple[WizardCard, ...] = ()
+
+    @traced('agent', args=lambda decision: {
+        'player': decision.player.name,
+        'agent': type(decision.player).__name__,
+        'kind': decision.kind.value
+    })
+    def ask(self) -> Any:
+        if self.kind == DecisionKind.BID:
+            return self.player.make_bid(self.state)
+        return self.player.play_card(self.state)
+
+
+@traced('agent.batch', args=lambda player, kind, states: {'player': player.name, 'kind': kind.value, 'batch_size': len(states)})
+def ask_batch(player: WizardBasePlayer, kind: DecisionKind, states: Sequence[GameState]) -> list[Any]:
+    if kind == DecisionKind.BID:
+        answers = player.make_bids_batch(states)
+    else:
+        answers = player.play_cards_batch(states)
+
+    if len(answers) != len(states):
+        raise ValueError(f'Player {player.name} returned {len(answers)} answers for {len(states)} states')
+    return answers
+
+
+def batches_natively(player: WizardBasePlayer, kind: DecisionKind) -> bool:
+    """True if the player overrides the batch method for this kind of decision."""
+    from src.core.player import WizardBasePlayer
+
+    method = 'make_bids_batch' if kind == DecisionKind.BID else 'play_cards_batch'
+    return getattr(type(player), method) is not getattr(WizardBasePlayer, method)
+
+
+def ponders(player: WizardBasePlayer) -> bool:
+    """True if the player overrides WizardBasePlayer.ponder."""
+    from src.core.player import WizardBasePlayer
+
+    return type(player).ponder is not WizardBasePlayer.ponder
+
+
+# Generator yielding decisions, receiving the answers and returning T
+DecisionSteps = Generator[Decision, Any, T]
+
+
+def is_awaitable(answer: Any) -> bool:
+    """inspect.isawaitable, skipping its slow ABC check for the plain bids and cards of synchronous agents."""
+    return not isinstance(answer, (int, Card)) and inspect.isawaitable(answer)
+
+
+def run_decisions(steps: DecisionSteps[T]) -> T:
+    """
+    Drive a step generator to completion by asking each player synchronously.
+
+    Exceptions raised by a player are thrown back into the generator, so the
+    engine decides how to handle them exactly as if the call happened inline.
+    """
+    try:
+        decision = next(steps)
+        while True:
+            try:
+                answer = decision.ask()
+            except Exception as e:
+                decision = steps.throw(e)
+            else:
+                if is_awaitable(answer):
+                    answer.close()
+                    raise TypeError(f'Player {decision.player.name} is asynchronous, use run_decisions_async')
+                decision = steps.send(answer)
+    except StopIteration as stop:
+        return stop.value
+
+
+def run_decisions_pondering(
+        steps: DecisionSteps[T],
+        get_state: Callable[[WizardBasePlayer], GameState],
+        executor: Executor | None = None
+) -> T:
+    """
+    Drive a step generator like run_decisions, letting the other players ponder
+    while a ``blocking`` player (a human or a remote agent) decides.
+
+    Every other player that implements ``ponder`` is started on ``executor``
+    (by default a thread pool owned by this call) with its own state from
+    ``get_state``. Once the blocking player answers, pondering is stopped and
+    awaited before the game goes on, then each ponderer receives the move
+    through ``ponder_hit``. Pondering must run in threads of this process,
+    since it leaves its results on the player objects. Errors raised while
+    pondering are ignored; the player is then simply asked as usual.
+    """
+    owned = executor is None
+    if owned:
+        executor = ThreadPoolExecutor(thread_name_prefix='ponder')
+
+    try:
+        decision = next(steps)
+        while True:
+            ponderers = []
+            if decision.player.blocking:
+                ponderers = [
+                    player for player in decision.state.players
+                    if player is not decision.player and ponders(player)
+                ]
+            stop = threading.Event()
+            futures = [
+                executor.submit(player.ponder, get_state(player), decision.player, decision.kind, stop)
+                for player in ponderers
+            ]
+
+            try:
+                answer = decision.ask()
+            except Exception as e:
+                stop.set()
+                wait(futures)
+                decision = steps.throw(e)
+            else:
+                stop.set()
+                wait(futures)
+                for player in ponderers:
+                    player.ponder_hit(decision.player, decision.kind, answer)
+                decision = steps.send(answer)
+    except StopIteration as stop_iteration:
+        return stop_iteration.value
+    finally:
+        if owned:
+            executor.shutdown()
+
+
+async def ask_async(decision: Decision, executor: Executor | None = None) -> Any:
+    """
+    Ask a player from inside an event loop.
+
+    Coroutine results of ``async def`` agents are awaited. Synchronous agents
+    flagged as ``blocking`` (waiting on a console or a socket) are adapted by
+    running them in ``executor``, other synchronous agents are called inline.
+    """
+    if decision.player.blocking:
+        # Imported here, asyncio alone adds about 10 MB to the RSS of synchronous engine users
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(executor, decision.ask)
+
+    answer = decision.ask()
+    if is_awaitable(answer):
+        answer = await answer
+    return answer
+
+
+async def run_decisions_async(steps: DecisionSteps[T], executor: Executor | None = None) -> T:
+    """Drive a step generator to completion inside an event loop, see ask_async."""
+    try:
+        decision = next(steps)
+        while True:
+            try:
+                answer = await ask_async(decision, executor)
+            except Exception as e:
+                decision = steps.throw(e)
+            else:
+                decision = steps.send(answer)
+    except StopIteration as stop:
+        return stop.value
+
+
+def run_decisions_batched(all_steps: Sequence[DecisionSteps[T]]) -> list[T]:
+    """
+    Drive many step generators (e.g. one per table) side by side.
+
+    In every pass the pending decisions of all tables are grouped by player
+    and kind, and each group is answered with a single make_bids_batch or
+    play_cards_batch call. Players relying on the per-state fallback are
+    answered first, so players implementing the batch methods are only asked
+    once every table waits on them and see the largest possible batches.
+    """
+    results: list[T | None] = [None] * len(all_steps)
+    pending: dict[int, Decision] = {}
+
+    def resume(index: int, advance: Callable[[], Decision]):
+        try:
+            pending[index] = advance()
+        except StopIteration as stop:
+            results[index] = stop.value
+
+    for index, steps in enumerate(all_steps):
+        resume(index, steps.__next__)
+
+    while pending:
+        current, pending = pending, {}
+        groups: dict[tuple[WizardBasePlayer, DecisionKind], list[int]] = defaultdict(list)
+        for index, decision in current.items():
+            groups[decision.player, decision.kind].append(index)
+
+        # Players without native batching gain nothing from waiting, answer them first
+        fallback_groups = {key: indices for key, indices in groups.items() if not batches_natively(*key)}
+        if fallback_groups:
+            for key, indices in groups.items():
+                if key not in fallback_groups:
+                    for index in indices:
+                        pending[index] = current[index]
+            groups = fallback_groups
+
+        for (player, kind), indices in groups.items():
+            try:
+                answers = ask_batch(player, kind, [current[index].state for index in indices])
+            except Exception as e:
+                for index in indices:
+                    resume(index, lambda: all_steps[index].throw(e))
+            else:
+                for index, answer in zip(indices, answers):
+                    resume(index, lambda: all_steps[index].send(answer))
+
+    return results
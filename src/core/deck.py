@@ -2,13 +2,24 @@ import random
 
 from typing import Self
 from src.core.player import WizardBasePlayer
+from src.core.tracing import traced
 from src.game.wizard_card import WizardCard
 
 class Deck:
+    __slots__ = ('_all_cards', '_cards')
+
     def __init__(self, cards: list[WizardCard]):
-        self._cards: list[WizardCard] = cards.copy()
+        self._all_cards: tuple[WizardCard, ...] = tuple(cards)
+        self._cards: list[WizardCard] = list(self._all_cards)
+        self.shuffle()
+
+    def reset(self) -> Self:
+        """Put every card back and shuffle, so one deck serves many rounds."""
+        self._cards[:] = self._all_cards
         self.shuffle()
+        return self
 
+    @traced('deck.shuffle')
     def shuffle(self) -> Self:
         random.shuffle(self._cards)
         return self
@@ -17,12 +28,13 @@ class Deck:
         if len(self._cards) < count:
             raise ValueError(f'Not enough cards to draw {count}.')
         drawn = self._cards[:count]
-        self._cards = self._cards[count:]
+        del self._cards[:count]
         return drawn
 
     def draw_one(self) -> WizardCard:
         return self.draw(1)[0]
 
+    @traced('deck.deal')
     def deal(self, players: list[WizardBasePlayer], cards_per_player: int) -> dict[WizardBasePlayer, list[WizardCard]]:
         return {
             player: self.draw(cards_per_player)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping
+
+if TYPE_CHECKING:
+    from src.core.player import WizardBasePlayer
+    from src.game.wizard_card import CardSuit, WizardCard
+
+
+@dataclass(frozen=True)
+class GameEvent:
+    """Base class of the events emitted by the engine."""
+
+
+@dataclass(frozen=True)
+class RoundStarted(GameEvent):
+    round_number: int
+    players: tuple[WizardBasePlayer, ...]
+    trump_card: WizardCard | None
+    trump_suit: CardSuit | None
+
+
+@dataclass(frozen=True)
+class BidPlaced(GameEvent):
+    round_number: int
+    player: WizardBasePlayer
+    bet: int
+
+
+@dataclass(frozen=True)
+class CardPlayed(GameEvent):
+    player: WizardBasePlayer
+    card: WizardCard
+    # Trick suit after the card, None as long as only Jesters or a Wizard lead
+    trick_suit: CardSuit | None
+
+
+@dataclass(frozen=True)
+class TrickWon(GameEvent):
+    round_number: int
+    trick_number: int
+    winner: WizardBasePlayer
+    cards: tuple[tuple[WizardBasePlayer, WizardCard], ...]
+
+
+@dataclass(frozen=True)
+class RoundScored(GameEvent):
+    round_number: int
+    bets: Mapping[WizardBasePlayer, int]
+    won_tricks: Mapping[WizardBasePlayer, int]
+    scores: Mapping[WizardBasePlayer, int]
+
+
+@dataclass(frozen=True)
+class GameFinished(GameEvent):
+    scores: Mapping[WizardBasePlayer, int]
+
+
+class _Subscriber:
+    __slots__ = ('handler', 'batch_size', 'buffer')
+
+    def __init__(self, handler: Callable[[Any], None], batch_size: int):
+        self.handler = handler
+        self.batch_size = batch_size
+        self.buffer: list[GameEvent] = []
+
+    def deliver(self, event: GameEvent):
+        if not self.batch_size:
+            self.handler(event)
+            return
+        self.buffer.append(event)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            batch, self.buffer = self.buffer, []
+            self.handler(batch)
+
+
+class EventBus:
+    """
+    Delivers the events of the games it is passed to (see WizardGame) to its subscribers.
+
+    The engine only builds an event if the bus ``wants`` its type, so a game
+    without a bus, or a bus without interested subscribers, pays one check
+    per emission point. Batched subscribers receive lists of up to
+    ``batch_size`` events; whatever is left is delivered when a game
+    finishes or on ``flush``.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[Callable[[Any], None], tuple[_Subscriber, tuple[type[GameEvent], ...]]] = {}
+        self._dispatch: dict[type[GameEvent], tuple[_Subscriber, ...]] = {}
+
+    def subscribe(
+            self,
+            handler: Callable[[Any], None],
+            event_types: Iterable[type[GameEvent]] = (GameEvent,),
+            batch_size: int = 0
+    ) -> Callable[[Any], None]:
+        """
+        Call ``handler`` with every event of ``event_types`` (subclasses included),
+        or with lists of them if ``batch_size`` > 0. Returns the handler.
+        """
+        self._subscribers[handler] = (_Subscriber(handler, batch_size), tuple(event_types))
+        self._rebuild()
+        return handler
+
+    def unsubscribe(self, handler: Callable[[Any], None]):
+        subscriber, _ = self._subscribers.pop(handler)
+        subscriber.flush()
+        self._rebuild()
+
+    def _rebuild(self):
+        dispatch = {}
+        for event_type in _event_types():
+            subscribers = tuple(
+                subscriber for subscriber, types in self._subscribers.values() if issubclass(event_type, types)
+            )
+            if subscribers:
+                dispatch[event_type] = subscribers
+        self._dispatch = dispatch
+
+    def wants(self, event_type: type[GameEvent]) -> bool:
+        return event_type in self._dispatch
+
+    def emit(self, event: GameEvent):
+        for subscriber in self._dispatch.get(type(event), ()):
+            subscriber.deliver(event)
+
+    def flush(self):
+        for subscriber, _ in self._subscribers.values():
+            subscriber.flush()
+
+
+def _event_types() -> list[type[GameEvent]]:
+    pending = [GameEvent]
+    found = []
+    while pending:
+        event_type = pending.pop()
+        found.append(event_type)
+        pending.extend(event_type.__subclasses__())
+    return found
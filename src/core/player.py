@@ -1,9 +1,16 @@
+from __future__ import annotations
+
 import signal
+import threading
 from functools import wraps
+from typing import TYPE_CHECKING, Any, Sequence
 
 from src.game.game_state import GameState
 from src.game.wizard_card import WizardCard, CardSuit
 
+if TYPE_CHECKING:
+    from src.core.decision import DecisionKind
+
 def timeout(seconds=1):
     def decorator(func):
         @wraps(func)
@@ -26,6 +33,9 @@ def timeout(seconds=1):
 
 
 class WizardBasePlayer:
+    # Set by agents whose decisions block on I/O, so async drivers run them in a thread
+    blocking: bool = False
+
     def __init__(self, name: str):
         self.name: str = name
 
@@ -37,9 +47,31 @@ class WizardBasePlayer:
     def play_card(self, state: GameState) -> WizardCard:
         raise NotImplementedError('This method should be implemented by subclasses.')
 
+    def make_bids_batch(self, states: Sequence[GameState]) -> list[int]:
+        """
+        Bid for several tables at once. Agents backed by batched models
+        override this; the default falls back to one make_bid call per state.
+        """
+        return [self.make_bid(state) for state in states]
+
+    def play_cards_batch(self, states: Sequence[GameState]) -> list[WizardCard]:
+        """Play a card at several tables at once, see make_bids_batch."""
+        return [self.play_card(state) for state in states]
+
     def pick_trump_suit(self, state: GameState) -> CardSuit:
         raise NotImplementedError('This method should be implemented by subclasses.')
 
+    def ponder(self, state: GameState, player: WizardBasePlayer, kind: DecisionKind, stop: threading.Event) -> None:
+        """
+        Precompute in a background thread while the blocking ``player`` makes a
+        ``kind`` decision, see run_decisions_pondering. ``state`` is this
+        player's own state; return early once ``stop`` is set. Agents that
+        ponder override this, the default does nothing.
+        """
+
+    def ponder_hit(self, player: WizardBasePlayer, kind: DecisionKind, move: Any) -> None:
+        """Called with the actual ``move`` of ``player`` once pondering stopped."""
+
     def __str__(self) -> str:
         return self.name
 
@@ -1,67 +1,144 @@
+from __future__ import annotations
+
 import logging
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Self
 
-from src.core.player import WizardBasePlayer, rotate_players
+from src.core.decision import Decision, DecisionKind, DecisionSteps, run_decisions
+from src.core.player import WizardBasePlayer
 from src.core.deck import Deck
+from src.core.events import BidPlaced, EventBus, RoundScored, RoundStarted, TrickWon
+from src.core.seen_cards import SeenCards, SeenCardsView
+from src.core.tracing import traced
 from src.core.trick import Trick
+from src.core.trick_history import TrickHistory
+from src.core.turn import Turn
 from src.game.wizard_card import WizardCard
 from src.game.wizard_card_factory import create_wizard_cards
 
+if TYPE_CHECKING:
+    from src.game.opponent_model import OpponentModel
+
 
 class Round:
+    __slots__ = (
+        'logger', '_players', '_round_number', '_game_state_callback', '_current_trick', '_turn', '_deck',
+        '_hands', '_trump_card', '_current_bets', '_seen_cards', '_won_tricks', '_trick_starting_player',
+        '_events', 'trick_history', 'opponent_model'
+    )
 
     def __init__(
             self,
             round_number: int,
             players: list[WizardBasePlayer],
-            game_state_callback
+            game_state_callback,
+            deck: Deck | None = None,
+            events: EventBus | None = None
     ):
         self.logger = logging.getLogger(__name__)
-        self._players: list[WizardBasePlayer] = players
-        self._round_number: int = round_number
         self._game_state_callback = game_state_callback
 
+        self._turn: Turn | None = None
+        self._deck: Deck = deck if deck is not None else Deck(create_wizard_cards())
+        self._current_bets: dict[WizardBasePlayer, int] = {}
+        self._seen_cards: SeenCards = SeenCards()
+        self._events = events
+        # Set by the game, every trick of the round is recorded in it
+        self.trick_history: TrickHistory | None = None
+        # Set by the game, updated with every player's bet and won tricks once the round is scored
+        self.opponent_model: OpponentModel | None = None
+        self.reset(round_number, players)
+
+    def reset(
+            self,
+            round_number: int,
+            players: list[WizardBasePlayer]
+    ) -> Self:
+        """Reuse the round object, its deck and its turn for the next round."""
+        self._players: list[WizardBasePlayer] = players
+        self._round_number: int = round_number
         self._current_trick: Trick | None = None
-        self._deck: Deck = Deck(create_wizard_cards()).shuffle()
+
+        self._deck.reset().shuffle()
         self._hands: dict[WizardBasePlayer, list[WizardCard]] = self._deck.deal(self._players, self._round_number)
         self._trump_card: WizardCard | None = self._deck.draw_one() if self._deck.remaining() > 0 else None
-        self._current_bets: dict[WizardBasePlayer, int] = {}
+        self._current_bets.clear()
+        self._seen_cards.reset()
         self._won_tricks: dict[WizardBasePlayer, int] = {player: 0 for player in players}
         self._trick_starting_player: WizardBasePlayer = self._players[0]
+        return self
 
     def play(self) -> dict[WizardBasePlayer, int]:
+        return run_decisions(self.play_steps())
+
+    def play_steps(self) -> DecisionSteps[dict[WizardBasePlayer, int]]:
 
-        self.logger.info(f'\nTrump suit: {self.trump_suit}')
-        self.run_bidding_phase()
+        self.logger.info('\nTrump suit: %s', self.trump_suit)
+        events = self._events
+        if events is not None and events.wants(RoundStarted):
+            events.emit(RoundStarted(self._round_number, tuple(self._players), self._trump_card, self.trump_suit))
+        if self.trick_history is not None:
+            self.trick_history.begin_round(self._round_number)
+        yield from self.bidding_steps()
 
         for i in range(self._round_number):
-            self.logger.info(f'\nTrick {i + 1} of {self._round_number}')
-            winner = self.play_trick(self._trick_starting_player)
+            self.logger.info('\nTrick %d of %d', i + 1, self._round_number)
+            self._start_trick(self._trick_starting_player)
+            winner = yield from self._current_trick.play_steps()
 
             self._won_tricks[winner] += 1
+            if events is not None and events.wants(TrickWon):
+                events.emit(TrickWon(self._round_number, i + 1, winner, tuple(self._current_trick.trick_cards.items())))
             self._trick_starting_player = winner
 
         round_scores = self.calculate_scores()
+        if self.opponent_model is not None:
+            for player in self._players:
+                self.opponent_model.update(
+                    player, self._current_bets[player], self._won_tricks[player], self._round_number
+                )
+        if events is not None and events.wants(RoundScored):
+            events.emit(RoundScored(
+                self._round_number,
+                MappingProxyType(dict(self._current_bets)),
+                MappingProxyType(dict(self._won_tricks)),
+                MappingProxyType(dict(round_scores))
+            ))
 
         return round_scores
 
 
     def run_bidding_phase(self):
+        run_decisions(self.bidding_steps())
+
+    @traced('bidding')
+    def bidding_steps(self) -> DecisionSteps[None]:
         for player in self._players:
-            decision = player.make_bid(self._game_state_callback(player))
-            self.logger.info(f'{player.name}: I bet {decision}')
+            decision = yield Decision(player, DecisionKind.BID, self._game_state_callback(player))
+            self.logger.info('%s: I bet %s', player.name, decision)
             self._current_bets[player] = decision
+            if self._events is not None and self._events.wants(BidPlaced):
+                self._events.emit(BidPlaced(self._round_number, player, decision))
 
     def play_trick(self, starting_player) -> WizardBasePlayer:
-        self._current_trick = Trick(
-            rotate_players(self._players, starting_player).copy(),
-            self._hands,
-            self.trump_suit,
-            self._game_state_callback
-        )
+        self._start_trick(starting_player)
         winner = self.current_trick.play()
 
         return winner
 
+    def _start_trick(self, starting_player: WizardBasePlayer):
+        # Agents may keep the trick of a GameState, so every trick is a new object; only the turn is reused
+        if self._current_trick is not None:
+            self._turn = self._current_trick.turn
+        trick = Trick(
+            self._players, self._hands, self.trump_suit, self._game_state_callback,
+            self._players.index(starting_player), self._turn
+        )
+        trick.events = self._events
+        trick.seen_cards = self._seen_cards
+        trick.history = self.trick_history
+        self._current_trick = trick
+
     def calculate_scores(self) -> dict[WizardBasePlayer, int]:
         scores: dict[WizardBasePlayer, int] = {player: 0 for player in self._players}
         for player in self._players:
@@ -91,6 +168,14 @@ class Round:
     def current_trick(self):
         return self._current_trick
 
+    @property
+    def played_cards(self):
+        return self._seen_cards.cards
+
+    @property
+    def seen_cards(self) -> SeenCardsView:
+        return self._seen_cards
+
     @property
     def round_number(self):
         return self._round_number
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.game.wizard_card import (
+    CardSuit, JESTER_ID, NUM_CARD_IDS, NUM_SUIT_VALUES, SUIT_INDEX, WIZARD_ID, WizardCard, card_to_id
+)
+
+if TYPE_CHECKING:
+    from src.core.player import WizardBasePlayer
+
+
+class SeenCardsView:
+    """
+    Read-only view of the cards played so far in the current round.
+
+    Keeps a bitmask over card ids (see wizard_card.card_to_id), the number of
+    copies played per card id and per suit, and who played every card. All
+    queries are O(1) except ``played_by`` for Wizards and Jesters. The
+    tuples of ``cards`` and ``players`` are built once per played card.
+    """
+    __slots__ = ('_mask', '_counts', '_suit_counts', '_position', '_cards', '_players', '_cards_tuple', '_players_tuple')
+
+    def __init__(self):
+        self._mask = 0
+        self._counts = [0] * NUM_CARD_IDS
+        self._suit_counts = [0] * len(CardSuit)
+        # Index into the play order of every played standard card
+        self._position = [0] * WIZARD_ID
+        self._cards: list[WizardCard] = []
+        self._players: list[WizardBasePlayer] = []
+        # Cached results of ``cards`` and ``players``, None after a change
+        self._cards_tuple: tuple[WizardCard, ...] | None = ()
+        self._players_tuple: tuple[WizardBasePlayer, ...] | None = ()
+
+    @property
+    def mask(self) -> int:
+        """Bit ``card_to_id(card)`` is set once a copy of the card was played."""
+        return self._mask
+
+    @property
+    def cards(self) -> tuple[WizardCard, ...]:
+        """Played cards in play order."""
+        if self._cards_tuple is None:
+            self._cards_tuple = tuple(self._cards)
+        return self._cards_tuple
+
+    @property
+    def players(self) -> tuple[WizardBasePlayer, ...]:
+        """The player of every card in ``cards``."""
+        if self._players_tuple is None:
+            self._players_tuple = tuple(self._players)
+        return self._players_tuple
+
+    @property
+    def wizards(self) -> int:
+        return self._counts[WIZARD_ID]
+
+    @property
+    def jesters(self) -> int:
+        return self._counts[JESTER_ID]
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __contains__(self, card: WizardCard) -> bool:
+        return bool(self._mask >> card_to_id(card) & 1)
+
+    def count(self, card: WizardCard) -> int:
+        """Number of copies of ``card`` played, up to 4 for Wizards and Jesters."""
+        return self._counts[card_to_id(card)]
+
+    def suit_count(self, suit: CardSuit) -> int:
+        """Number of standard cards of ``suit`` played."""
+        return self._suit_counts[SUIT_INDEX[suit]]
+
+    def played_by(self, card: WizardCard) -> tuple[WizardBasePlayer, ...]:
+        """Players who played a copy of ``card``, in play order."""
+        card_id = card_to_id(card)
+        if card_id < WIZARD_ID:
+            if not self._mask >> card_id & 1:
+                return ()
+            return (self._players[self._position[card_id]],)
+        return tuple(player for c, player in zip(self._cards, self._players) if c == card)
+
+
+class SeenCards(SeenCardsView):
+    """The engine side of SeenCardsView, updated in O(1) per played card."""
+    __slots__ = ()
+
+    def add(self, card: WizardCard, player: WizardBasePlayer):
+        card_id = card.card_id
+        self._mask |= 1 << card_id
+        self._counts[card_id] += 1
+        if card_id < WIZARD_ID:
+            self._suit_counts[card_id // NUM_SUIT_VALUES] += 1
+            self._position[card_id] = len(self._cards)
+        self._cards.append(card)
+        self._players.append(player)
+        self._cards_tuple = self._players_tuple = None
+
+    def reset(self):
+        self._mask = 0
+        self._counts[:] = [0] * NUM_CARD_IDS
+        self._suit_counts[:] = [0] * len(CardSuit)
+        self._cards.clear()
+        self._players.clear()
+        self._cards_tuple = self._players_tuple = ()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import json
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+# Tracer of the current run, None while tracing is off
+_active: Tracer | None = None
+
+
+class Tracer:
+    """
+    Sampling tracer for engine phases.
+
+    Every game is sampled with probability ``sample_rate``; inside a sampled
+    game every ``traced`` function records one complete event. The sampling
+    decision uses its own random generator so seeded games stay the same.
+    It is kept in a context variable, so games played concurrently on other
+    threads or asyncio tasks keep their own decision. Events of this process are kept in memory, up to ``max_events``.
+    """
+
+    def __init__(self, sample_rate: float = 1.0, max_events: int = 1_000_000, seed: int | None = None):
+        self.sample_rate = sample_rate
+        self.max_events = max_events
+        self._sampling: contextvars.ContextVar[bool] = contextvars.ContextVar('tracer_sampling', default=False)
+        self.events: list[tuple[str, int, int, int, dict[str, Any] | None]] = []
+        self.sampled_games = 0
+        self._random = random.Random(seed)
+
+    @property
+    def sampling(self) -> bool:
+        """Whether the game running in the current context is sampled."""
+        return self._sampling.get()
+
+    def start_sample(self) -> bool:
+        """Decide whether a new game is sampled, see ``sampling`` for the game's spans."""
+        sampled = len(self.events) < self.max_events and self._random.random() < self.sample_rate
+        self.sampled_games += sampled
+        return sampled
+
+    def begin(self) -> Any:
+        """Called when a sampled span starts, the result is handed to ``end``."""
+        return time.perf_counter_ns()
+
+    def end(self, name: str, start: Any, args: dict[str, Any] | None):
+        self.record(name, start, time.perf_counter_ns(), args)
+
+    def record(self, name: str, start_ns: int, end_ns: int, args: dict[str, Any] | None = None):
+        if len(self.events) < self.max_events:
+            self.events.append((name, start_ns, end_ns, threading.get_ident(), args))
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Events in the Chrome trace event format, also read by Perfetto."""
+        pid = os.getpid()
+        trace_events = []
+        for name, start_ns, end_ns, tid, args in self.events:
+            event = {'name': name, 'ph': 'X', 'ts': start_ns / 1000, 'dur': (end_ns - start_ns) / 1000, 'pid': pid, 'tid': tid}
+            if args:
+                event['args'] = args
+            trace_events.append(event)
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ns'}
+
+    def save_chrome_trace(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+
+
+# Functions marked with ``traced``: (module, qualname, span name, args builder, root)
+_registry: list[tuple[str, str, str, Callable[..., dict[str, Any]] | None, bool]] = []
+
+
+def traced(name: str, args: Callable[..., dict[str, Any]] | None = None, root: bool = False):
+    """
+    Mark a function, method or classmethod to be traced as span ``name``.
+
+    The function itself is returned unchanged, so traced code costs nothing
+    while tracing is off; ``tracing`` swaps in the recording wrappers for the
+    duration of a run. ``args`` builds the event arguments from the call
+    arguments and is only called for sampled spans. A ``root`` span decides
+    whether its game is sampled. Generator functions are traced from their
+    first step until they return.
+    """
+    def decorator(func):
+        target = func.__func__ if isinstance(func, classmethod) else func
+        _registry.append((target.__module__, target.__qualname__, name, args, root))
+        return func
+    return decorator
+
+
+def _wrap(func: Callable, tracer: Tracer, name: str, args: Callable[..., dict[str, Any]] | None, root: bool) -> Callable:
+    def event_args(call_args, call_kwargs):
+        return args(*call_args, **call_kwargs) if args is not None else None
+
+    if inspect.isgeneratorfunction(func) and root:
+        def root_steps(steps, sampled, span_args):
+            # Step generators of many games can be driven side by side in one
+            # context, so the game's decision is set again on every step
+            start = tracer.begin() if sampled else None
+            try:
+                tracer._sampling.set(sampled)
+                decision = next(steps)
+                while True:
+                    try:
+                        answer = yield decision
+                    except GeneratorExit:
+                        steps.close()
+                        raise
+                    except BaseException as e:
+                        tracer._sampling.set(sampled)
+                        decision = steps.throw(e)
+                    else:
+                        tracer._sampling.set(sampled)
+                        decision = steps.send(answer)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                if sampled:
+                    tracer.end(name, start, span_args)
+                tracer._sampling.set(False)
+
+        @functools.wraps(func)
+        def wrapper(*call_args, **call_kwargs):
+            sampled = tracer.start_sample()
+            span_args = event_args(call_args, call_kwargs) if sampled else None
+            return root_steps(func(*call_args, **call_kwargs), sampled, span_args)
+    elif inspect.isgeneratorfunction(func):
+        def traced_steps(steps, span_args):
+            start = tracer.begin()
+            try:
+                return (yield from steps)
+            finally:
+                tracer.end(name, start, span_args)
+
+        @functools.wraps(func)
+        def wrapper(*call_args, **call_kwargs):
+            if not tracer.sampling:
+                return func(*call_args, **call_kwargs)
+            return traced_steps(func(*call_args, **call_kwargs), event_args(call_args, call_kwargs))
+    elif root:
+        @functools.wraps(func)
+        def wrapper(*call_args, **call_kwargs):
+            sampled = tracer.start_sample()
+            token = tracer._sampling.set(sampled)
+            try:
+                if not sampled:
+                    return func(*call_args, **call_kwargs)
+                start = tracer.begin()
+                try:
+                    return func(*call_args, **call_kwargs)
+                finally:
+                    tracer.end(name, start, event_args(call_args, call_kwargs))
+            finally:
+                tracer._sampling.reset(token)
+    else:
+        @functools.wraps(func)
+        def wrapper(*call_args, **call_kwargs):
+            if not tracer.sampling:
+                return func(*call_args, **call_kwargs)
+            start = tracer.begin()
+            try:
+                return func(*call_args, **call_kwargs)
+            finally:
+                tracer.end(name, start, event_args(call_args, call_kwargs))
+
+    return wrapper
+
+
+def _install(tracer: Tracer) -> list[tuple[Any, str, Any]]:
+    """Replace every registered function by its traced wrapper, returns what to restore."""
+    originals = []
+    for module_name, qualname, name, args, root in _registry:
+        owner = sys.modules[module_name]
+        *path, attribute = qualname.split('.')
+        for part in path:
+            owner = getattr(owner, part)
+
+        original = vars(owner)[attribute]
+        if isinstance(original, classmethod):
+            wrapper = classmethod(_wrap(original.__func__, tracer, name, args, root))
+        else:
+            wrapper = _wrap(original, tracer, name, args, root)
+        originals.append((owner, attribute, original))
+        setattr(owner, attribute, wrapper)
+    return originals
+
+
+@contextmanager
+def tracing(tracer: Tracer) -> Iterator[Tracer]:
+    """Trace the games played inside the block with ``tracer``."""
+    global _active
+    if _active is not None:
+        raise RuntimeError('Another tracer is already active')
+
+    _active = tracer
+    originals = _install(tracer)
+    try:
+        yield tracer
+    finally:
+        for owner, attribute, original in reversed(originals):
+            setattr(owner, attribute, original)
+        _active = None
@@ -2,6 +2,11 @@ from __future__ import annotations
 from typing import Callable, TYPE_CHECKING
 import logging
 
+from src.core.decision import DecisionSteps, run_decisions
+from src.core.events import CardPlayed, EventBus
+from src.core.seen_cards import SeenCards
+from src.core.trick_history import TrickHistory
+from src.core.tracing import traced
 from src.core.turn import Turn
 from src.game.wizard_card import WizardCard, CardSuit, CardType
 
@@ -11,33 +16,63 @@ if TYPE_CHECKING:
 
 
 class Trick:
+    """
+    One trick, played by ``players`` in seat order starting with ``players[lead]``.
+
+    A round creates a new trick for every trick, since agents may keep the
+    trick of a GameState. Only the Turn object is passed on from trick to
+    trick, agents never see it.
+    """
+    __slots__ = (
+        'logger', '_players', '_lead', '_hands', '_trump_suit', '_get_game_state', '_trick_cards', '_trick_suit',
+        '_turn', 'events', 'seen_cards', 'history'
+    )
+
     def __init__(
             self,
             players: list[WizardBasePlayer],
             hands: dict[WizardBasePlayer, list[WizardCard]],
             trump_suit: CardSuit,
             get_game_state: Callable[[WizardBasePlayer], GameState],
+            lead: int = 0,
+            turn: Turn | None = None
     ):
         self.logger = logging.getLogger(__name__)
         self._players = players
+        self._lead = lead
         self._hands = hands
         self._trump_suit = trump_suit
         self._get_game_state = get_game_state
-
         self._trick_cards: dict[WizardBasePlayer, WizardCard] = {}
         self._trick_suit: CardSuit | None = None
+        # Reused for every card of the trick, created on the first one if not handed over
+        self._turn = turn
+        # Set by the round when its game has an event bus
+        self.events: EventBus | None = None
+        # Set by the round, every accepted card is added right away
+        self.seen_cards: SeenCards | None = None
+        # Set by the round when its game keeps a trick history
+        self.history: TrickHistory | None = None
 
     def play(self) -> WizardBasePlayer:
-
-        for player in self._players:
-            turn = Turn(
-                player,
-                self._hands[player],
-                self._trick_cards,
-                self._trick_suit,
-                self._get_game_state,
-            )
-            card = turn.play()
+        return run_decisions(self.play_steps())
+
+    @traced('trick')
+    def play_steps(self) -> DecisionSteps[WizardBasePlayer]:
+        num_players = len(self._players)
+        for i in range(self._lead, self._lead + num_players):
+            player = self._players[i % num_players]
+            if self._turn is None:
+                self._turn = Turn(
+                    player,
+                    self._hands[player],
+                    self._trick_cards,
+                    self._trick_suit,
+                    self._get_game_state,
+                )
+            else:
+                self._turn.reset(player, self._hands[player], self._trick_cards, self._trick_suit)
+            card = yield from self._turn.play_steps()
 
             # Set trick suit logic
             if not self._trick_suit and all(c.card_type == CardType.JESTER for c in self._trick_cards.values()) and card.card_type == CardType.STANDARD:
@@ -45,12 +80,21 @@ class Trick:
 
 
             self._trick_cards[player] = card
-            self.logger.info(f'{player.name}: I play a {card}')
+            if self.seen_cards is not None:
+                self.seen_cards.add(card, player)
+            if self.history is not None:
+                self.history.add_card(card)
+            self.logger.info('%s: I play a %s', player.name, card)
+            if self.events is not None and self.events.wants(CardPlayed):
+                self.events.emit(CardPlayed(player, card, self._trick_suit))
 
         winner = self.determine_winner()
-        self.logger.info(f'\nTrick winner: {winner}')
+        if self.history is not None:
+            self.history.end_trick(self._players[self._lead], winner)
+        self.logger.info('\nTrick winner: %s', winner)
         return winner
 
+    @traced('trick.determine_winner')
     def determine_winner(self) -> WizardBasePlayer:
         trick_suite = None
         for player, card in self._trick_cards.items():
@@ -83,6 +127,10 @@ class Trick:
                 key=lambda x: x[1].card_value
             )[0]
 
+    @property
+    def turn(self) -> Turn | None:
+        return self._turn
+
     @property
     def trick_suit(self):
         return self._trick_suit
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from src.core.player import WizardBasePlayer
+    from src.game.wizard_card import WizardCard
+
+# Fill value of tricks not played (yet)
+NO_TRICK = -1
+
+
+class RoundTricks(NamedTuple):
+    """Read-only views of the tricks played so far in one round."""
+    leads: np.ndarray    # (T,) seat that led each trick
+    cards: np.ndarray    # (T, P) card ids in play order, starting with the lead
+    winners: np.ndarray  # (T,) seat that won each trick
+
+
+class TrickHistory:
+    """
+    Every trick of a game in preallocated arrays.
+
+    Seats are fixed for the whole game: seat ``s`` is ``players[s]`` in the
+    order the players had in the first round, before they rotate. Card ids are
+    those of wizard_card.card_to_id, cards of a trick are stored in play order
+    so ``cards[r, t, i]`` was played by seat ``(leads[r, t] + i) % num_seats``.
+    Rounds are indexed from 0, unplayed entries hold NO_TRICK.
+
+    The engine writes into flat ``array`` buffers as cards are played: the
+    round calls ``begin_round``, its tricks call ``add_card`` and ``end_trick``.
+    Nothing is allocated per trick and the engine does not need NumPy. The
+    public arrays are read-only NumPy views of these buffers, created on first
+    access, so agents read the live history through GameState without copies.
+    """
+    __slots__ = (
+        'players', '_seats', '_num_rounds', '_leads', '_cards', '_winners', '_num_tricks', '_round_index',
+        '_next_card', '_views'
+    )
+
+    def __init__(self, players: list[WizardBasePlayer], num_rounds: int):
+        self.players: tuple[WizardBasePlayer, ...] = tuple(players)
+        self._seats: dict[WizardBasePlayer, int] = {player: seat for seat, player in enumerate(self.players)}
+        self._num_rounds = num_rounds
+
+        # Round r has r + 1 tricks, the last round has num_rounds of them
+        self._leads = array('b', [NO_TRICK]) * (num_rounds * num_rounds)
+        self._cards = array('b', [NO_TRICK]) * (num_rounds * num_rounds * self.num_seats)
+        self._winners = array('b', [NO_TRICK]) * (num_rounds * num_rounds)
+        self._num_tricks = array('h', [0]) * num_rounds
+        self._round_index = 0
+        # Offset in ``_cards`` of the next card of the current trick
+        self._next_card = 0
+        self._views: tuple[np.ndarray, ...] | None = None
+
+    @property
+    def num_seats(self) -> int:
+        return len(self.players)
+
+    def seat(self, player: WizardBasePlayer) -> int:
+        return self._seats[player]
+
+    def begin_round(self, round_number: int):
+        r = self._round_index = round_number - 1
+        self._next_card = (r * self._num_rounds + self._num_tricks[r]) * self.num_seats
+
+    def add_card(self, card: WizardCard):
+        """Record the next card of the current trick, in play order."""
+        self._cards[self._next_card] = card.card_id
+        self._next_card += 1
+
+    def end_trick(self, lead: WizardBasePlayer, winner: WizardBasePlayer):
+        """Complete the current trick, led by ``lead``, and start the next one."""
+        r = self._round_index
+        t = self._num_tricks[r]
+        index = r * self._num_rounds + t
+        self._leads[index] = self._seats[lead]
+        self._winners[index] = self._seats[winner]
+        self._num_tricks[r] = t + 1
+        self._next_card = (index + 1) * self.num_seats
+
+    def _arrays(self) -> tuple[np.ndarray, ...]:
+        if self._views is None:
+            import numpy as np
+
+            n, p = self._num_rounds, self.num_seats
+            self._views = (
+                np.frombuffer(memoryview(self._leads).toreadonly(), dtype=np.int8).reshape(n, n),
+                np.frombuffer(memoryview(self._cards).toreadonly(), dtype=np.int8).reshape(n, n, p),
+                np.frombuffer(memoryview(self._winners).toreadonly(), dtype=np.int8).reshape(n, n),
+                np.frombuffer(memoryview(self._num_tricks).toreadonly(), dtype=np.int16),
+            )
+        return self._views
+
+    @property
+    def leads(self) -> np.ndarray:
+        """(rounds, rounds) seat that led every trick."""
+        return self._arrays()[0]
+
+    @property
+    def cards(self) -> np.ndarray:
+        """(rounds, rounds, seats) card ids of every trick in play order."""
+        return self._arrays()[1]
+
+    @property
+    def winners(self) -> np.ndarray:
+        """(rounds, rounds) seat that won every trick."""
+        return self._arrays()[2]
+
+    @property
+    def num_tricks(self) -> np.ndarray:
+        """(rounds,) number of tricks played in every round."""
+        return self._arrays()[3]
+
+    def round(self, round_number: int) -> RoundTricks:
+        """The tricks played so far in ``round_number`` (counted from 1)."""
+        r = round_number - 1
+        t = self._num_tricks[r]
+        return RoundTricks(self.leads[r, :t], self.cards[r, :t], self.winners[r, :t])
@@ -0,0 +1,51 @@
+import numpy as np
+
+from src.game.wizard_card import NUM_SUIT_VALUES, WIZARD_ID
+
+# Trump value for rounds without a trump suit
+NO_TRUMP = -1
+
+
+def trick_winners(cards: np.ndarray, trump: np.ndarray | int, lead: np.ndarray | int) -> np.ndarray:
+    """
+    Resolve many complete tricks at once with the rules of Trick.determine_winner.
+
+    :param cards: (N, P) card ids, ``cards[n, s]`` is the card played by seat ``s``
+    :param trump: (N,) trump suit index per trick (see SUIT_INDEX), NO_TRUMP if none
+    :param lead: (N,) seat that led each trick, play order continues with the following seats
+    :return: (N,) winning seat per trick
+    """
+    cards = np.asarray(cards)
+    num_tricks, num_seats = cards.shape
+    rows = np.arange(num_tricks)
+    trump = np.broadcast_to(np.asarray(trump), (num_tricks,))[:, None]
+    lead = np.broadcast_to(np.asarray(lead), (num_tricks,))
+
+    # Seats and cards in play order
+    order = (lead[:, None] + np.arange(num_seats)) % num_seats
+    played = np.take_along_axis(cards, order, axis=1)
+
+    wizard = played == WIZARD_ID
+    standard = played < WIZARD_ID
+    suits = np.where(standard, played // NUM_SUIT_VALUES, NO_TRUMP - 1)
+    values = np.where(standard, played % NUM_SUIT_VALUES, -1)
+
+    # The first standard card sets the trick suit
+    lead_suit = suits[rows, standard.argmax(axis=1)][:, None]
+    trumps = standard & (suits == trump)
+    following = standard & (suits == lead_suit)
+
+    position = np.where(
+        wizard.any(axis=1),
+        wizard.argmax(axis=1),
+        np.where(
+            ~standard.any(axis=1),
+            0,  # only Jesters: the first player wins
+            np.where(
+                trumps.any(axis=1),
+                np.where(trumps, values, -1).argmax(axis=1),
+                np.where(following, values, -1).argmax(axis=1)
+            )
+        )
+    )
+    return order[rows, position]
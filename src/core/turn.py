@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Callable, Sequence
+from typing import TYPE_CHECKING, Callable, Self, Sequence
 
+from src.core.decision import Decision, DecisionKind, DecisionSteps, run_decisions
 from src.game.wizard_card import CardSuit, WizardCard, CardType
 
 if TYPE_CHECKING:
@@ -9,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class Turn:
+    __slots__ = ('_player', '_hand', '_trick_cards', '_trick_suit', '_get_game_state', '_played_card')
+
     def __init__(self,
                  player: WizardBasePlayer,
                  hand: list[WizardCard],
@@ -16,19 +19,32 @@ class Turn:
                  trick_suit: CardSuit | None,
                  get_game_state: Callable[[WizardBasePlayer], GameState],
     ):
+        self._get_game_state = get_game_state
+        self.reset(player, hand, trick_cards, trick_suit)
+
+    def reset(self,
+              player: WizardBasePlayer,
+              hand: list[WizardCard],
+              trick_cards: dict[WizardBasePlayer, WizardCard],
+              trick_suit: CardSuit | None,
+    ) -> Self:
+        """Reuse the turn for the next player of a trick."""
         self._player = player
         self._hand = hand
         self._trick_cards = trick_cards
         self._trick_suit = trick_suit
-        self._get_game_state = get_game_state
         self._played_card: WizardCard | None = None
+        return self
 
     def play(self) -> WizardCard:
+        return run_decisions(self.play_steps())
+
+    def play_steps(self) -> DecisionSteps[WizardCard]:
         playable_cards = valid_cards(self._hand, list(self._trick_cards.values()), self._trick_suit)
         game_state = self._get_game_state(self._player)
 
         try:
-            chosen_card = self._player.play_card(game_state)
+            chosen_card = yield Decision(self._player, DecisionKind.PLAY_CARD, game_state, tuple(playable_cards))
         except Exception as e:
             raise ValueError(f'Player {self._player.name} raised an exception: {e}')
 
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Mapping
 
+from src.core.tracing import traced
+from src.core.seen_cards import SeenCards, SeenCardsView
 from src.core.trick import Trick
+from src.core.trick_history import TrickHistory
+from .opponent_model import OpponentModel
 from .wizard_card import WizardCard, CardSuit
 
 if TYPE_CHECKING:
@@ -23,17 +27,30 @@ class GameState:
     current_trick: Trick
     won_tricks: Mapping[WizardBasePlayer, int]
     hand: tuple[WizardCard, ...]
+    played_cards: tuple[WizardCard, ...] = ()
+    # Live view of the round's played cards, shared with the engine instead of copied
+    seen_cards: SeenCardsView = field(default_factory=SeenCards)
+    # Live history of every trick of the game so far, None outside of a WizardGame
+    trick_history: TrickHistory | None = None
+    # Bidding statistics per player name, shared with the game and kept across games
+    opponent_model: OpponentModel | None = None
 
     @classmethod
+    @traced('game_state.from_game')
     def from_game(cls, game: WizardGame, player: WizardBasePlayer) -> GameState:
+        current_round = game.current_round
         return cls(
-            players=tuple(game.players),
-            current_round_number=game.current_round.round_number,
+            players=game.players,
+            current_round_number=current_round.round_number,
             current_scores=MappingProxyType(dict(game.current_scores)),
-            current_bets=MappingProxyType(dict(game.current_round.current_bets)),
-            trump_card=game.current_round.trump_card,
-            trump_suit=game.current_round.trump_suit,
-            current_trick=game.current_round.current_trick,
-            won_tricks=MappingProxyType(dict(game.current_round.won_tricks)),
-            hand=tuple(game.current_round.hands[player])
-        )
\ No newline at end of file
+            current_bets=MappingProxyType(dict(current_round.current_bets)),
+            trump_card=current_round.trump_card,
+            trump_suit=current_round.trump_suit,
+            current_trick=current_round.current_trick,
+            won_tricks=MappingProxyType(dict(current_round.won_tricks)),
+            hand=tuple(current_round.hands[player]),
+            played_cards=current_round.played_cards,
+            seen_cards=current_round.seen_cards,
+            trick_history=game.trick_history,
+            opponent_model=game.opponent_model
+        )
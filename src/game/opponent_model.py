@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping
+
+if TYPE_CHECKING:
+    from src.core.player import WizardBasePlayer
+
+
+@dataclass
+class OpponentStats:
+    """Running bidding statistics of one player, updated once per round."""
+    rounds: int = 0
+    exact: int = 0
+    bid_total: int = 0
+    diff_total: int = 0
+    abs_diff_total: int = 0
+    tricks_total: int = 0
+
+    def update(self, bet: int, won: int, round_number: int):
+        diff = won - bet
+        self.rounds += 1
+        self.exact += diff == 0
+        self.bid_total += bet
+        self.diff_total += diff
+        self.abs_diff_total += abs(diff)
+        self.tricks_total += round_number
+
+    @property
+    def accuracy(self) -> float:
+        """Share of rounds in which the player won exactly the tricks they bid."""
+        return self.exact / self.rounds if self.rounds else 0.0
+
+    @property
+    def bias(self) -> float:
+        """Mean of won minus bid tricks, positive for players who underbid."""
+        return self.diff_total / self.rounds if self.rounds else 0.0
+
+    @property
+    def mean_error(self) -> float:
+        return self.abs_diff_total / self.rounds if self.rounds else 0.0
+
+    @property
+    def aggressiveness(self) -> float:
+        """Share of the tricks of a round the player bids for on average."""
+        return self.bid_total / self.tricks_total if self.tricks_total else 0.0
+
+
+class OpponentModel:
+    """
+    Bidding statistics per player name, kept across games.
+
+    The rounds of a WizardGame update the model once they are scored, and
+    GameState refers to the same object, so agents always read the live
+    statistics. Players are looked up by name because every game creates
+    new player objects.
+    """
+
+    def __init__(self):
+        self._stats: dict[str, OpponentStats] = {}
+
+    @staticmethod
+    def _name(player: WizardBasePlayer | str) -> str:
+        return player if isinstance(player, str) else player.name
+
+    def __getitem__(self, player: WizardBasePlayer | str) -> OpponentStats:
+        """Statistics of ``player``, empty statistics if it has not played a round yet."""
+        return self._stats.get(self._name(player)) or OpponentStats()
+
+    def __contains__(self, player: WizardBasePlayer | str) -> bool:
+        return self._name(player) in self._stats
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def update(self, player: WizardBasePlayer | str, bet: int, won: int, round_number: int):
+        name = self._name(player)
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = OpponentStats()
+        stats.update(bet, won, round_number)
+
+    def clear(self):
+        """Forget the statistics of every player."""
+        self._stats.clear()
+
+    def record_rounds(self, rounds: Iterable[tuple[int, Mapping[str, tuple[int, int]]]]):
+        """Replay ``(round_number, {name: (bet, won)})`` results, e.g. of a game played in another process."""
+        for round_number, results in rounds:
+            for name, (bet, won) in results.items():
+                self.update(name, bet, won, round_number)
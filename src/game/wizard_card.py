@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from src.core.card import Card
@@ -34,19 +34,44 @@ class CardType(Enum):
         return display_names[self]
 
 
+# Compact integer ids for the 54 distinct card kinds: standard cards are
+# suit-major (suit index * 13 + value - 1), followed by Wizard and Jester.
+# The four Wizards and four Jesters of a deck are indistinguishable.
+NUM_SUIT_VALUES = 13
+WIZARD_ID = len(CardSuit) * NUM_SUIT_VALUES
+JESTER_ID = WIZARD_ID + 1
+NUM_CARD_IDS = JESTER_ID + 1
+
+SUIT_INDEX: dict[CardSuit, int] = {suit: i for i, suit in enumerate(CardSuit)}
+
+
 @dataclass(frozen=True)
 class WizardCard(Card):
     card_type: CardType
     card_suit: CardSuit | None = None
     card_value: int | None = None
+    # Id of the card kind (see card_to_id), set once on construction so the engine never hashes a card to get it
+    card_id: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.card_type == CardType.STANDARD:
             if self.card_suit is None or self.card_value is None:
                 raise ValueError('CardType.STANDARD requires card_suit and card_value')
+            card_id = SUIT_INDEX[self.card_suit] * NUM_SUIT_VALUES + self.card_value - 1
         else:
             if self.card_suit is not None or self.card_value is not None:
                 raise ValueError('Special cards must not have suit or value')
+            card_id = WIZARD_ID if self.card_type == CardType.WIZARD else JESTER_ID
+        object.__setattr__(self, 'card_id', card_id)
+
+    # The id identifies the card kind, so comparing and hashing it is equivalent to the generated methods
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return self.card_id == other.card_id
+        return NotImplemented
+
+    def __hash__(self):
+        return self.card_id
 
     def __str__(self):
         if self.card_type == CardType.STANDARD:
@@ -56,3 +81,18 @@ class WizardCard(Card):
         elif self.card_type == CardType.JESTER:
             return 'Jester'
         return 'Unknown Card'
+
+
+CARDS_BY_ID: tuple[WizardCard, ...] = tuple(
+    WizardCard(CardType.STANDARD, suit, value)
+    for suit in CardSuit
+    for value in range(1, NUM_SUIT_VALUES + 1)
+) + (WizardCard(CardType.WIZARD), WizardCard(CardType.JESTER))
+
+
+def card_to_id(card: WizardCard) -> int:
+    return card.card_id
+
+
+def card_from_id(card_id: int) -> WizardCard:
+    return CARDS_BY_ID[card_id]
@@ -1,17 +1,30 @@
 import logging
 import random
+from concurrent.futures import Executor
 from types import MappingProxyType
+from typing import Self, Sequence
 
+from src.core.decision import DecisionSteps, run_decisions, run_decisions_async, run_decisions_pondering
 from src.core.deck import Deck
+from src.core.events import EventBus, GameFinished
 from src.core.player import WizardBasePlayer, rotate_players
 from src.core.round import Round
+from src.core.tracing import traced
 from src.core.trick import Trick
+from src.core.trick_history import TrickHistory
 from src.game.game_state import GameState
+from src.game.opponent_model import OpponentModel
 from src.game.wizard_card_factory import create_wizard_cards
 
 
 class WizardGame:
-    def __init__(self):
+    __slots__ = (
+        'logger', '_current_scores', '_round_scores', '_bets_history', '_deck', '_players',
+        '_current_round', '_spare_round', '_current_trick', '_max_rounds', '_trick_history',
+        '_opponent_model', '_events'
+    )
+
+    def __init__(self, opponent_model: OpponentModel | None = None, events: EventBus | None = None):
         self.logger = logging.getLogger(__name__)
         self._current_scores: dict[WizardBasePlayer, int] = dict()
         self._round_scores = {}
@@ -19,8 +32,32 @@ class WizardGame:
         self._deck: Deck = Deck(create_wizard_cards())
         self._players: list[WizardBasePlayer] = list()
         self._current_round: Round | None = None
+        self._spare_round: Round | None = None
         self._current_trick: Trick | None = None
         self._max_rounds: int = 0
+        self._trick_history: TrickHistory | None = None
+        self._opponent_model: OpponentModel = opponent_model if opponent_model is not None else OpponentModel()
+        self._events = events
+
+    def reset(self) -> Self:
+        """
+        Remove the players and results to play another game with this object.
+
+        The deck and the round and turn objects are kept and reused.
+        Results of the previous game stay valid, they are not cleared in place.
+        The opponent model keeps its statistics for the next game and the event bus stays attached.
+        """
+        self._current_scores = {}
+        self._round_scores = {}
+        self._bets_history = {}
+        self._deck.reset()
+        self._players = []
+        self._spare_round = self._current_round or self._spare_round
+        self._current_round = None
+        self._current_trick = None
+        self._max_rounds = 0
+        self._trick_history = None
+        return self
 
     def add_player(self, player: WizardBasePlayer):
         if len(self._players) >= 6:
@@ -30,6 +67,24 @@ class WizardGame:
             self.logger.info(f"Player '{player.name}' added")
 
     def start_game(self):
+        run_decisions(self.play_steps())
+
+    async def start_game_async(self, executor: Executor | None = None):
+        """Play the game inside an event loop, awaiting ``async def`` agents."""
+        await run_decisions_async(self.play_steps(), executor)
+
+    def start_game_pondering(self, executor: Executor | None = None):
+        """Play the game, letting bots ponder while blocking players decide (see run_decisions_pondering)."""
+        run_decisions_pondering(self.play_steps(), self.get_game_state_for_player, executor)
+
+    @traced('game', root=True)
+    def play_steps(self) -> DecisionSteps[None]:
+        """
+        Play the whole game as a generator yielding every pending agent decision.
+
+        The caller answers each yielded decision with ``send``, which lets
+        external drivers (batched, vectorized or async) take over the agents.
+        """
         if not 3 <= len(self._players) <= 6:
             raise ValueError('Invalid number of players')
 
@@ -38,27 +93,42 @@ class WizardGame:
         self._current_scores = {player: 0 for player in self._players}
 
         self._max_rounds = 60 // len(self._players)
+        self._trick_history = TrickHistory(self._players, self._max_rounds)
 
         self.logger.info(f'\nStart game with {len(self._players)} players. Playing {self._max_rounds} rounds.')
 
         for round_number in range(self._max_rounds):
             self.logger.info(f'\nRound {round_number+1}')
-            self._play_round(round_number+1)
+            yield from self._play_round(round_number+1)
 
 
         self.logger.info(f'\nGame finished')
         self.end_game()
-
-    def _play_round(self, round_number: int):
-
-        self._current_round = Round(
-            round_number,
-            self._players,
-            self.get_game_state_for_player
-        )
+        if self._events is not None:
+            if self._events.wants(GameFinished):
+                self._events.emit(GameFinished(MappingProxyType(dict(self._current_scores))))
+            self._events.flush()
+
+    @traced('round', args=lambda game, round_number: {'round': round_number})
+    def _play_round(self, round_number: int) -> DecisionSteps[None]:
+
+        current_round = self._current_round or self._spare_round
+        if current_round is None:
+            current_round = Round(
+                round_number,
+                self._players,
+                self.get_game_state_for_player,
+                self._deck,
+                self._events
+            )
+        else:
+            current_round.reset(round_number, self._players)
+        current_round.trick_history = self._trick_history
+        current_round.opponent_model = self._opponent_model
+        self._current_round = current_round
 
         self.logger.info(f'Round {round_number}: Start bidding')
-        round_scores = self._current_round.play()
+        round_scores = yield from self._current_round.play_steps()
         self.logger.info(f'Round {round_number}: End bidding')
 
         self._bets_history[round_number] = {
@@ -107,6 +177,18 @@ class WizardGame:
     def players(self) -> tuple[WizardBasePlayer, ...]:
         return tuple(self._players)
 
+    @property
+    def trick_history(self) -> TrickHistory | None:
+        return self._trick_history
+
+    @property
+    def opponent_model(self) -> OpponentModel:
+        return self._opponent_model
+
+    @property
+    def events(self) -> EventBus | None:
+        return self._events
+
     @property
     def round_scores(self):
         return self._round_scores
@@ -114,3 +196,10 @@ class WizardGame:
     @property
     def bets_history(self):
         return self._bets_history
+
+
+async def play_games_async(games: Sequence[WizardGame], executor: Executor | None = None):
+    """Play many games concurrently on the running event loop."""
+    import asyncio
+
+    await asyncio.gather(*(game.start_game_async(executor) for game in games))
@@ -0,0 +1,74 @@
+import asyncio
+from concurrent.futures import Executor
+
+from src.core.decision import Decision, DecisionKind, ask_async
+from src.core.player import WizardBasePlayer
+from src.game.wizard_card import card_to_id
+from src.server.protocol import StateDeltaDecoder, decode_message, encode_message
+
+# Sent instead of an answer when the wrapped player raised
+INVALID_ANSWER = -1
+
+
+class WizardClient:
+    """
+    Connect any WizardBasePlayer to a WizardGameServer.
+
+    The client takes ``seats`` seats for the wrapped player and answers every
+    decision the server sends, rebuilding full GameState objects from the
+    state deltas. It disconnects after ``max_games`` games per seat.
+    """
+
+    def __init__(self, player: WizardBasePlayer, seats: int = 1, executor: Executor | None = None):
+        self.player = player
+        self.seats = seats
+        self.executor = executor
+        self.results: list[dict[str, int]] = []
+        self.decisions = 0
+        self._decoders: dict[str, StateDeltaDecoder] = {}
+
+    async def run_tcp(self, host: str, port: int, max_games: int | None = None):
+        reader, writer = await asyncio.open_connection(host, port)
+        await self._run(reader, writer, max_games)
+
+    async def run_unix(self, path: str, max_games: int | None = None):
+        reader, writer = await asyncio.open_unix_connection(path)
+        await self._run(reader, writer, max_games)
+
+    async def _run(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, max_games: int | None):
+        for _ in range(self.seats):
+            writer.write(encode_message({'type': 'join', 'name': self.player.name, 'games': max_games}))
+        await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                message = decode_message(line)
+
+                if message['type'] == 'seated':
+                    self._decoders[message['seat']] = StateDeltaDecoder(self.player, message['seat'])
+                elif message['type'] == 'start':
+                    self._decoders[message['seat']].reset()
+                elif message['type'] == 'decide':
+                    value = await self._decide(message)
+                    writer.write(encode_message({
+                        'type': 'answer', 'table': message['table'], 'id': message['id'], 'value': value
+                    }))
+                    await writer.drain()
+                elif message['type'] == 'end':
+                    self.results.append(message['scores'])
+                    if max_games is not None and len(self.results) >= max_games * self.seats:
+                        break
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def _decide(self, message: dict):
+        state = self._decoders[message['seat']].decode(message['state'])
+        kind = DecisionKind.BID if message['kind'] == 'bid' else DecisionKind.PLAY_CARD
+        self.decisions += 1
+
+        try:
+            answer = await ask_async(Decision(self.player, kind, state), self.executor)
+            return answer if kind == DecisionKind.BID else card_to_id(answer)
+        except Exception:
+            return INVALID_ANSWER
@@ -0,0 +1,337 @@
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from src.core.player import WizardBasePlayer
+from src.core.turn import valid_cards
+from src.game.game_state import GameState
+from src.game.wizard_card import NUM_CARD_IDS, CardSuit, WizardCard, card_from_id, card_to_id
+from src.game.wizard_game import WizardGame
+from src.server.protocol import StateDeltaEncoder, decode_message, encode_message
+
+
+@dataclass
+class TableStats:
+    table_id: int
+    players: list[str]
+    started: float = field(default_factory=time.perf_counter)
+    finished: float | None = None
+    games: int = 0
+    decisions: int = 0
+
+    def as_dict(self) -> dict:
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        return {
+            'table': self.table_id,
+            'players': self.players,
+            'games': self.games,
+            'decisions': self.decisions,
+            'elapsed': elapsed,
+            'games_per_sec': self.games / elapsed if elapsed else 0.0,
+            'decisions_per_sec': self.decisions / elapsed if elapsed else 0.0,
+        }
+
+
+class _Connection:
+    def __init__(self, connection_id: int, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connection_id = connection_id
+        self.reader = reader
+        self.writer = writer
+        self.pending: dict[tuple[int, int], asyncio.Future] = {}
+        self.seats: list['RemoteSeat'] = []
+        self.connected = time.perf_counter()
+        self.closed = False
+        self.messages_in = 0
+        self.messages_out = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.decisions = 0
+        self.timeouts = 0
+        self.invalid_answers = 0
+        self.latency_total = 0.0
+
+    async def send(self, message: dict):
+        if self.closed:
+            return
+        data = encode_message(message)
+        self.messages_out += 1
+        self.bytes_out += len(data)
+        self.writer.write(data)
+        await self.writer.drain()
+
+    def resolve(self, table_id: int, request_id: int, value):
+        future = self.pending.get((table_id, request_id))
+        if future and not future.done():
+            future.set_result(value)
+
+    def as_dict(self) -> dict:
+        elapsed = time.perf_counter() - self.connected
+        return {
+            'connection': self.connection_id,
+            'seats': [seat.name for seat in self.seats],
+            'messages_in': self.messages_in,
+            'messages_out': self.messages_out,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'decisions': self.decisions,
+            'timeouts': self.timeouts,
+            'invalid_answers': self.invalid_answers,
+            'mean_latency': self.latency_total / self.decisions if self.decisions else 0.0,
+            'decisions_per_sec': self.decisions / elapsed if elapsed else 0.0,
+        }
+
+
+# Fields every client message must carry, by message type; 'games' of a join is optional
+_MESSAGE_FIELDS = {
+    'join': {'name': (str,)},
+    # Any value is accepted here, illegal answers are replaced by a default move
+    'answer': {'table': (int,), 'id': (int,), 'value': (object,)},
+}
+
+
+class ProtocolError(ValueError):
+    """A client message that does not follow the protocol."""
+
+
+def _validate_message(message) -> None:
+    if not isinstance(message, dict) or message.get('type') not in _MESSAGE_FIELDS:
+        raise ProtocolError(f'Unknown message: {message!r}')
+
+    fields = dict(_MESSAGE_FIELDS[message['type']])
+    if message['type'] == 'join' and message.get('games') is not None:
+        fields['games'] = (int,)
+    for name, types in fields.items():
+        if name not in message:
+            raise ProtocolError(f"{message['type']} message without {name!r}")
+        value = message[name]
+        # bool is an int subclass but never a valid number in the protocol
+        if not isinstance(value, types) or int in types and isinstance(value, bool):
+            raise ProtocolError(f"{message['type']} message with invalid {name!r}: {value!r}")
+
+
+class RemoteSeat(WizardBasePlayer):
+    """
+    Server-side player forwarding decisions to a client connection.
+
+    Answers that miss the decision deadline or are not legal are replaced by
+    a default legal move (bid 0, first valid card) so the table keeps going.
+    Trump selection is not part of the protocol, see pick_trump_suit.
+    """
+
+    def __init__(self, name: str, connection: _Connection, decision_timeout: float, games: int | None = None):
+        super().__init__(name)
+        self.connection = connection
+        self.games_left = games
+        self.decision_timeout = decision_timeout
+        self.table: TableStats | None = None
+        self.encoder = StateDeltaEncoder()
+        self._request_ids = itertools.count()
+
+    async def make_bid(self, state: GameState) -> int:
+        bid = await self._ask('bid', state, None)
+        if isinstance(bid, int) and 0 <= bid <= state.current_round_number:
+            return bid
+
+        self._count_invalid(bid)
+        return 0
+
+    async def play_card(self, state: GameState) -> WizardCard:
+        trick = state.current_trick
+        legal = valid_cards(state.hand, list(trick.trick_cards.values()), trick.trick_suit)
+        card_id = await self._ask('play', state, [card_to_id(card) for card in legal])
+        if isinstance(card_id, int) and 0 <= card_id < NUM_CARD_IDS and card_from_id(card_id) in legal:
+            return card_from_id(card_id)
+
+        self._count_invalid(card_id)
+        return legal[0]
+
+    def pick_trump_suit(self, state: GameState) -> CardSuit:
+        """
+        Not asked over the protocol: the suit the seat holds most cards of,
+        ties going to the first suit in CardSuit order, so every table plays
+        the same for the same hand.
+        """
+        counts = {suit: 0 for suit in CardSuit}
+        for card in state.hand:
+            if card.card_suit is not None:
+                counts[card.card_suit] += 1
+        return max(counts, key=counts.get)
+
+    def _count_invalid(self, answer):
+        # None means the deadline passed, which is already counted as a timeout
+        if answer is not None:
+            self.connection.invalid_answers += 1
+
+    async def _ask(self, kind: str, state: GameState, legal: list[int] | None):
+        connection = self.connection
+        if connection.closed:
+            return None
+
+        request_id = next(self._request_ids)
+        key = (self.table.table_id, request_id)
+        future = asyncio.get_running_loop().create_future()
+        connection.pending[key] = future
+
+        message = {
+            'type': 'decide',
+            'table': key[0],
+            'seat': self.name,
+            'id': request_id,
+            'kind': kind,
+            'state': self.encoder.encode(state),
+        }
+        if legal is not None:
+            message['legal'] = legal
+
+        start = time.perf_counter()
+        try:
+            await connection.send(message)
+            return await asyncio.wait_for(future, self.decision_timeout)
+        except asyncio.TimeoutError:
+            connection.timeouts += 1
+            return None
+        finally:
+            connection.pending.pop(key, None)
+            connection.decisions += 1
+            connection.latency_total += time.perf_counter() - start
+            self.table.decisions += 1
+
+
+class WizardGameServer:
+    """
+    Host many Wizard tables for remote agents speaking a JSON-lines protocol.
+
+    Clients send ``{"type": "join", "name": ..., "games": ...}`` once per
+    seat they want to fill, ``games`` being optional. As soon as
+    ``table_size`` seats are waiting a table is opened and plays up to
+    ``games_per_table`` games, after which seats with games left wait for the
+    next table. Each decision is sent as ``{"type": "decide", "table", "seat",
+    "id", "kind", "state", "legal"}`` where ``state`` only holds the fields that
+    changed since the seat's previous decision; clients reply with
+    ``{"type": "answer", "table", "id", "value"}``.
+    """
+
+    def __init__(self, table_size: int = 3, games_per_table: int = 1, decision_timeout: float = 1.0):
+        if not 3 <= table_size <= 6:
+            raise ValueError('Number of players must be between 3 and 6')
+
+        self.logger = logging.getLogger(__name__)
+        self.table_size = table_size
+        self.games_per_table = games_per_table
+        self.decision_timeout = decision_timeout
+
+        self._servers: list[asyncio.AbstractServer] = []
+        self._connections: list[_Connection] = []
+        self._tables: list[TableStats] = []
+        self._table_tasks: set[asyncio.Task] = set()
+        self._waiting: deque[RemoteSeat] = deque()
+        self._connection_ids = itertools.count()
+        self._table_ids = itertools.count()
+        self._seat_ids = itertools.count()
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = 0) -> tuple[str, int]:
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        self._servers.append(server)
+        return server.sockets[0].getsockname()[:2]
+
+    async def start_unix(self, path: str) -> str:
+        server = await asyncio.start_unix_server(self._handle_connection, path)
+        self._servers.append(server)
+        return path
+
+    async def close(self):
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        for task in self._table_tasks:
+            task.cancel()
+        await asyncio.gather(*self._table_tasks, return_exceptions=True)
+        for connection in self._connections:
+            connection.closed = True
+            connection.writer.close()
+
+    def table_stats(self) -> list[dict]:
+        return [table.as_dict() for table in self._tables]
+
+    def connection_stats(self) -> list[dict]:
+        return [connection.as_dict() for connection in self._connections]
+
+    @property
+    def games_played(self) -> int:
+        return sum(table.games for table in self._tables)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connection = _Connection(next(self._connection_ids), reader, writer)
+        self._connections.append(connection)
+
+        try:
+            while line := await reader.readline():
+                connection.messages_in += 1
+                connection.bytes_in += len(line)
+                message = decode_message(line)
+                _validate_message(message)
+
+                if message['type'] == 'join':
+                    seat = RemoteSeat(
+                        f"{message['name']}_{next(self._seat_ids)}",
+                        connection,
+                        self.decision_timeout,
+                        message.get('games')
+                    )
+                    connection.seats.append(seat)
+                    await connection.send({'type': 'seated', 'seat': seat.name, 'name': message['name']})
+                    self._waiting.append(seat)
+                    self._open_tables()
+                elif message['type'] == 'answer':
+                    connection.resolve(message['table'], message['id'], message['value'])
+        except (ConnectionError, ValueError, KeyError, TypeError) as e:
+            # ValueError covers malformed JSON and ProtocolError
+            self.logger.warning(f'Connection {connection.connection_id} dropped: {e!r}')
+        finally:
+            connection.closed = True
+            writer.close()
+            for future in connection.pending.values():
+                if not future.done():
+                    future.set_result(None)
+            self._waiting = deque(seat for seat in self._waiting if seat.connection is not connection)
+
+    def _open_tables(self):
+        while len(self._waiting) >= self.table_size:
+            seats = [self._waiting.popleft() for _ in range(self.table_size)]
+            table = TableStats(next(self._table_ids), [seat.name for seat in seats])
+            self._tables.append(table)
+
+            task = asyncio.create_task(self._run_table(table, seats))
+            self._table_tasks.add(task)
+            task.add_done_callback(self._table_tasks.discard)
+
+    async def _run_table(self, table: TableStats, seats: list[RemoteSeat]):
+        for seat in seats:
+            seat.table = table
+
+        for _ in range(self.games_per_table):
+            if any(seat.connection.closed or seat.games_left == 0 for seat in seats):
+                break
+
+            game = WizardGame()
+            for seat in seats:
+                seat.encoder.reset()
+                game.add_player(seat)
+                await seat.connection.send({'type': 'start', 'table': table.table_id, 'seat': seat.name})
+
+            await game.start_game_async()
+            table.games += 1
+            for seat in seats:
+                if seat.games_left is not None:
+                    seat.games_left -= 1
+
+            scores = {player.name: score for player, score in game.current_scores.items()}
+            for seat in seats:
+                await seat.connection.send({'type': 'end', 'table': table.table_id, 'seat': seat.name, 'scores': scores})
+
+        table.finished = time.perf_counter()
+        self._waiting.extend(seat for seat in seats if not seat.connection.closed and seat.games_left != 0)
+        self._open_tables()
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from src.core.player import WizardBasePlayer
+from src.core.seen_cards import SeenCards
+from src.game.game_state import GameState
+from src.game.wizard_card import CardSuit, WizardCard, card_from_id, card_to_id
+
+
+def encode_message(message: dict) -> bytes:
+    return json.dumps(message, separators=(',', ':')).encode() + b'\n'
+
+
+def decode_message(line: bytes) -> dict:
+    return json.loads(line)
+
+
+def encode_state(state: GameState) -> dict[str, Any]:
+    """Encode a GameState into plain JSON-compatible fields, players are referred to by name."""
+    trick = state.current_trick
+    return {
+        'players': [player.name for player in state.players],
+        'round': state.current_round_number,
+        'scores': {player.name: score for player, score in state.current_scores.items()},
+        'bets': {player.name: bet for player, bet in state.current_bets.items()},
+        'trump': card_to_id(state.trump_card) if state.trump_card else None,
+        'trump_suit': state.trump_suit.value if state.trump_suit else None,
+        'trick': [[player.name, card_to_id(card)] for player, card in trick.trick_cards.items()] if trick else [],
+        'trick_suit': trick.trick_suit.value if trick and trick.trick_suit else None,
+        'won': {player.name: won for player, won in state.won_tricks.items()},
+        'hand': [card_to_id(card) for card in state.hand],
+        'played': [card_to_id(card) for card in state.played_cards],
+        'played_by': [player.name for player in state.seen_cards.players],
+    }
+
+
+# Fields that only grow during a round, sent as the entries appended since the last state
+_APPENDED_FIELDS = {'played': 'played_tail', 'played_by': 'played_by_tail'}
+_TAIL_FIELDS = {tail: key for key, tail in _APPENDED_FIELDS.items()}
+
+
+def _removed_positions(previous: list, current: list) -> list[int] | None:
+    """Positions in ``previous`` whose removal leaves ``current``, None if cards were added or reordered."""
+    removed = []
+    j = 0
+    for i, card_id in enumerate(previous):
+        if j < len(current) and current[j] == card_id:
+            j += 1
+        else:
+            removed.append(i)
+    return removed if j == len(current) else None
+
+
+class StateDeltaEncoder:
+    """
+    Encode successive states of one seat as deltas: only fields that changed since the last state.
+
+    During a round the played cards and who played them only grow and the
+    hand only loses cards, so these are sent as the appended entries
+    (``played_tail``, ``played_by_tail``) and the positions of the removed
+    cards (``hand_removed``). A new round sends them in full again.
+    """
+
+    def __init__(self):
+        self._last: dict[str, Any] = {}
+
+    def reset(self):
+        self._last = {}
+
+    def encode(self, state: GameState) -> dict[str, Any]:
+        fields = encode_state(state)
+        last = self._last
+        delta = {key: value for key, value in fields.items() if last.get(key, ...) != value}
+
+        for key, tail in _APPENDED_FIELDS.items():
+            if key in delta and key in last:
+                known = len(last[key])
+                if delta[key][:known] == last[key]:
+                    delta[tail] = delta.pop(key)[known:]
+        if 'hand' in delta and 'hand' in last:
+            removed = _removed_positions(last['hand'], delta['hand'])
+            if removed is not None:
+                del delta['hand']
+                delta['hand_removed'] = removed
+
+        self._last = fields
+        return delta
+
+
+@dataclass(frozen=True)
+class RemoteTrick:
+    """Read-only stand-in for Trick on the client side of the protocol."""
+    trick_cards: MappingProxyType[WizardBasePlayer, WizardCard]
+    trick_suit: CardSuit | None
+
+
+class RemotePlayer(WizardBasePlayer):
+    """Placeholder for an opponent seated at a remote table."""
+
+
+class StateDeltaDecoder:
+    """
+    Rebuild GameState objects from deltas produced by StateDeltaEncoder.
+
+    The player named ``own_name`` is mapped to ``own_player``, so agents can
+    keep looking themselves up in the state mappings.
+    """
+
+    def __init__(self, own_player: WizardBasePlayer, own_name: str | None = None):
+        self._own_player = own_player
+        self._own_name = own_name or own_player.name
+        self._players: dict[str, WizardBasePlayer] = {self._own_name: own_player}
+        self._fields: dict[str, Any] = {}
+
+    def reset(self):
+        self._fields = {}
+
+    def _player(self, name: str) -> WizardBasePlayer:
+        if name not in self._players:
+            self._players[name] = RemotePlayer(name)
+        return self._players[name]
+
+    def decode(self, delta: dict[str, Any]) -> GameState:
+        fields = self._fields
+        for key, value in delta.items():
+            if key in _TAIL_FIELDS:
+                fields[_TAIL_FIELDS[key]] = fields[_TAIL_FIELDS[key]] + value
+            elif key == 'hand_removed':
+                removed = set(value)
+                fields['hand'] = [card_id for i, card_id in enumerate(fields['hand']) if i not in removed]
+            else:
+                fields[key] = value
+        player = self._player
+
+        trick_suit = CardSuit(fields['trick_suit']) if fields['trick_suit'] else None
+        played_cards = tuple(card_from_id(card_id) for card_id in fields['played'])
+        seen_cards = SeenCards()
+        for card, name in zip(played_cards, fields.get('played_by', ())):
+            seen_cards.add(card, player(name))
+        return GameState(
+            players=tuple(player(name) for name in fields['players']),
+            current_round_number=fields['round'],
+            current_scores=MappingProxyType({player(name): score for name, score in fields['scores'].items()}),
+            current_bets=MappingProxyType({player(name): bet for name, bet in fields['bets'].items()}),
+            trump_card=card_from_id(fields['trump']) if fields['trump'] is not None else None,
+            trump_suit=CardSuit(fields['trump_suit']) if fields['trump_suit'] else None,
+            current_trick=RemoteTrick(
+                MappingProxyType({player(name): card_from_id(card_id) for name, card_id in fields['trick']}),
+                trick_suit
+            ),
+            won_tricks=MappingProxyType({player(name): won for name, won in fields['won'].items()}),
+            hand=tuple(card_from_id(card_id) for card_id in fields['hand']),
+            played_cards=played_cards,
+            seen_cards=seen_cards,
+        )
@@ -0,0 +1,40 @@
+"""Seeded game factories shared by the tests."""
+import random
+from typing import Callable
+
+from src.core.events import EventBus
+from src.core.player import WizardBasePlayer
+from src.game.wizard_game import WizardGame
+
+PlayerSpec = WizardBasePlayer | type[WizardBasePlayer]
+
+
+def make_game(*players: PlayerSpec, events: EventBus | None = None, game: WizardGame | None = None) -> WizardGame:
+    """
+    Seat ``players`` at ``game``, or at a new game reporting to ``events``.
+
+    Player classes are instantiated and named ``<class name>_<seat>``.
+    """
+    game = game if game is not None else WizardGame(events=events)
+    for seat, player in enumerate(players):
+        game.add_player(player(f'{player.__name__}_{seat}') if isinstance(player, type) else player)
+    return game
+
+
+def play(
+        *players: PlayerSpec,
+        seed: int | None = 0,
+        events: EventBus | None = None,
+        game: WizardGame | None = None,
+        start: Callable[[WizardGame], None] = WizardGame.start_game
+) -> WizardGame:
+    """Play a whole game of ``players`` (see make_game) after seeding ``random`` with ``seed``, unless None."""
+    if seed is not None:
+        random.seed(seed)
+    game = make_game(*players, events=events, game=game)
+    start(game)
+    return game
+
+
+def final_scores(game: WizardGame) -> list[tuple[str, int]]:
+    return sorted((player.name, score) for player, score in game.current_scores.items())
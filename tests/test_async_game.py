@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.ai.simple_agent import WizardSimpleBot
+from src.core.decision import run_decisions
+from src.game.wizard_game import play_games_async
+from tests.helpers import make_game
+
+
+class SlowAsyncBot(WizardSimpleBot):
+    """Simple bot that awaits an I/O-like delay before every decision."""
+    delay = 0.001
+
+    async def make_bid(self, state) -> int:
+        await asyncio.sleep(self.delay)
+        return super().make_bid(state)
+
+    async def play_card(self, state):
+        await asyncio.sleep(self.delay)
+        return super().play_card(state)
+
+
+class RecordingAsyncBot(SlowAsyncBot):
+    """Slow async bot recording which tables are waiting on a decision at the same time."""
+    delay = 0
+
+    def __init__(self, name: str, log: list):
+        super().__init__(name)
+        self.log = log
+
+    async def make_bid(self, state) -> int:
+        self.log.append(('start', self.name))
+        bid = await super().make_bid(state)
+        self.log.append(('end', self.name))
+        return bid
+
+
+class BlockingBot(WizardSimpleBot):
+    blocking = True
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.threads = set()
+
+    def make_bid(self, state) -> int:
+        self.threads.add(threading.get_ident())
+        return super().make_bid(state)
+
+
+class TestAsyncGame:
+    def test_async_agents_interleave(self):
+        num_games = 30
+        log = []
+        games = [
+            make_game(RecordingAsyncBot(f'Async_{i}', log), WizardSimpleBot('Bot_1'), WizardSimpleBot('Bot_2'))
+            for i in range(num_games)
+        ]
+
+        asyncio.run(play_games_async(games))
+
+        for game in games:
+            assert len(game.round_scores) == 20
+
+        # While one table awaits a decision the others keep going: every table is
+        # waiting at the same time at least once, instead of one table after another
+        waiting = set()
+        most_waiting = 0
+        for event, name in log:
+            if event == 'start':
+                waiting.add(name)
+            else:
+                waiting.remove(name)
+            most_waiting = max(most_waiting, len(waiting))
+        assert most_waiting == num_games
+        assert len(log) == 2 * 20 * num_games
+
+    def test_blocking_sync_agent_runs_in_thread(self):
+        blocking = BlockingBot('Blocking')
+        game = make_game(blocking, WizardSimpleBot('Bot_1'), WizardSimpleBot('Bot_2'))
+
+        asyncio.run(game.start_game_async())
+
+        assert len(game.round_scores) == 20
+        assert threading.get_ident() not in blocking.threads
+
+    def test_sync_driver_rejects_async_agent(self):
+        game = make_game(SlowAsyncBot('Async'), WizardSimpleBot('Bot_1'), WizardSimpleBot('Bot_2'))
+
+        with pytest.raises(TypeError):
+            run_decisions(game.play_steps())
@@ -0,0 +1,86 @@
+import numpy as np
+
+from src.ai.confidence import bootstrap_mean_interval, std_interval
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.wizard_environment import WizardEnvironment
+
+LINEUP = [WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot]
+
+
+def naive_bootstrap(samples, num_resamples, rng):
+    indices = rng.integers(0, len(samples), (num_resamples, len(samples)))
+    return np.quantile(samples[indices].mean(axis=1), [0.025, 0.975])
+
+
+def test_bootstrap_matches_resampling_games():
+    samples = np.random.default_rng(1).integers(-50, 100, 400)
+    counted = bootstrap_mean_interval(samples, num_resamples=4000, rng=np.random.default_rng(2))
+    naive = naive_bootstrap(samples, 4000, np.random.default_rng(3))
+
+    assert counted[0] < samples.mean() < counted[1]
+    np.testing.assert_allclose(counted, naive, atol=1.0)
+
+
+def test_bootstrap_per_column_and_empty():
+    samples = np.random.default_rng(4).integers(0, 3, (200, 5))
+    bounds = bootstrap_mean_interval(samples, scale=2)
+    assert bounds.shape == (5, 2)
+    assert np.all(bounds[:, 0] <= samples.mean(axis=0) / 2) and np.all(samples.mean(axis=0) / 2 <= bounds[:, 1])
+
+    constant = bootstrap_mean_interval(np.full(50, 3))
+    np.testing.assert_array_equal(constant, [3, 3])
+
+    assert np.isnan(bootstrap_mean_interval(np.zeros(0, dtype=int))).all()
+    assert bootstrap_mean_interval(np.zeros((0, 4), dtype=int)).shape == (4, 2)
+
+
+def test_std_interval_matches_resampling_games():
+    # Two pooled seats per game, like an agent playing twice in the lineup
+    samples = np.random.default_rng(5).integers(-30, 40, (400, 2)) * 10
+    bounds = std_interval(samples)
+    indices = np.random.default_rng(7).integers(0, len(samples), (4000, len(samples)))
+    naive = np.quantile(samples[indices].reshape(4000, -1).std(axis=1), [0.025, 0.975])
+
+    assert bounds[0] < samples.std() < bounds[1]
+    np.testing.assert_allclose(bounds, naive, rtol=0.05)
+    assert np.isnan(std_interval(np.zeros((0, 2)))).all()
+    np.testing.assert_array_equal(std_interval(np.full((10, 2), 5)), [0, 0])
+
+
+def test_evaluation_reports_intervals(capsys):
+    env = WizardEnvironment()
+    env.ci_resamples = 200
+    stats = env.evaluate_players(LINEUP, num_games=12, seed=0)
+
+    for player_stats in stats.values():
+        low, high = player_stats['win_rate_ci']
+        assert 0 <= low <= player_stats['win_rate'] <= high <= 1
+        low, high = player_stats['average_score_ci']
+        assert low <= player_stats['average_score'] <= high
+        low, high = player_stats['average_position_ci']
+        assert 1 <= low <= player_stats['average_position'] <= high <= 3
+        low, high = player_stats['score_std_ci']
+        assert 0 <= low <= player_stats['score_std'] <= high
+        for frequency, (low, high) in zip(player_stats['position_distribution'], player_stats['position_distribution_ci']):
+            assert 0 <= low <= frequency <= high <= 1
+        for key, history_key in (('average_bet_ci', 'bets'), ('average_diff_ci', 'diffs')):
+            assert sorted(player_stats[key]) == list(range(1, 21))
+            for round_num, (low, high) in player_stats[key].items():
+                assert low <= np.mean(player_stats['bet_history'][round_num][history_key]) <= high
+        assert sorted(player_stats['bet_accuracy_ci']) == list(range(1, 21))
+
+    # Fixed generator: the intervals are reproducible
+    again = WizardEnvironment()
+    again.ci_resamples = 200
+    assert again.evaluate_players(LINEUP, num_games=12, seed=0)['WizardSimpleBot']['average_score_ci'] == \
+        stats['WizardSimpleBot']['average_score_ci']
+
+    capsys.readouterr()
+    env.print_results()
+    output = capsys.readouterr().out
+    assert '95% bootstrap confidence intervals, normal approximation for the score std' in output
+    assert 'Win Rate: ' in output and '%]' in output
+    # Every reported metric comes with its interval
+    metric_lines = [line for line in output.splitlines() if ': ' in line and 'Player' not in line and 'Games' not in line]
+    assert metric_lines and all('[' in line for line in metric_lines)
@@ -0,0 +1,96 @@
+import pytest
+
+from src.ai.simple_agent import WizardSimpleBot
+from src.core.decision import run_decisions_batched, run_decisions
+from src.core.player import WizardBasePlayer
+from src.core.turn import valid_cards
+from tests.helpers import make_game
+
+
+class CountingBatchPlayer(WizardBasePlayer):
+    """Plays the first valid card, answering whole batches at once."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.batch_calls = 0
+        self.single_calls = 0
+
+    def make_bid(self, state) -> int:
+        self.single_calls += 1
+        return 0
+
+    def play_card(self, state):
+        self.single_calls += 1
+        return valid_cards(state.hand, state.current_trick.trick_cards, state.current_trick.trick_suit)[0]
+
+    def make_bids_batch(self, states):
+        self.batch_calls += 1
+        return [0 for _ in states]
+
+    def play_cards_batch(self, states):
+        self.batch_calls += 1
+        return [
+            valid_cards(state.hand, state.current_trick.trick_cards, state.current_trick.trick_suit)[0]
+            for state in states
+        ]
+
+
+class FailingBatchPlayer(WizardSimpleBot):
+    def play_cards_batch(self, states):
+        raise RuntimeError('model server unavailable')
+
+
+def make_games(num_games, shared_player):
+    return [make_game(shared_player, WizardSimpleBot, WizardSimpleBot) for _ in range(num_games)]
+
+
+class TestRunDecisionsBatched:
+    def test_shared_player_is_asked_in_batches(self):
+        player = CountingBatchPlayer('Model')
+        games = make_games(20, player)
+
+        run_decisions_batched([game.play_steps() for game in games])
+
+        assert player.single_calls == 0
+        # 20 rounds of one bid and up to 20 cards each: far fewer calls than 20 tables would need
+        decisions_per_table = sum(1 + n for n in range(1, 21))
+        assert 0 < player.batch_calls <= decisions_per_table
+        for game in games:
+            assert len(game.round_scores) == 20
+
+    def test_fallback_to_per_state_calls(self):
+        class PerStatePlayer(CountingBatchPlayer):
+            make_bids_batch = WizardBasePlayer.make_bids_batch
+            play_cards_batch = WizardBasePlayer.play_cards_batch
+
+        player = PerStatePlayer('Plain')
+        games = make_games(3, player)
+
+        results = run_decisions_batched([game.play_steps() for game in games])
+
+        assert results == [None, None, None]
+        assert player.batch_calls == 0
+        assert player.single_calls == 3 * sum(1 + n for n in range(1, 21))
+
+    def test_matches_sync_driver_results_shape(self):
+        games = make_games(2, WizardSimpleBot('Solo'))
+        run_decisions(games[0].play_steps())
+        run_decisions_batched([games[1].play_steps()])
+
+        assert len(games[0].round_scores) == len(games[1].round_scores) == 20
+
+    def test_batch_exception_reaches_every_table(self):
+        games = make_games(3, FailingBatchPlayer('Broken'))
+
+        with pytest.raises(ValueError, match='model server unavailable'):
+            run_decisions_batched([game.play_steps() for game in games])
+
+    def test_wrong_answer_count_raises(self):
+        class ShortBatchPlayer(WizardSimpleBot):
+            def make_bids_batch(self, states):
+                return []
+
+        games = make_games(2, ShortBatchPlayer('Short'))
+
+        with pytest.raises(ValueError):
+            run_decisions_batched([game.play_steps() for game in games])
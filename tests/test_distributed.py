@@ -0,0 +1,154 @@
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+
+import numpy as np
+import pytest
+
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.distributed import AUTHKEY_ENV, EvaluationCoordinator, run_worker
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.wizard_environment import WizardEnvironment
+
+LINEUP = [WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot]
+
+
+def crashing_worker(address, authkey):
+    """Takes one task and dies without answering."""
+    connection = Client(address, authkey=authkey)
+    connection.send(('hello', 'crashing'))
+    connection.recv()
+    connection.close()
+
+
+def hanging_worker(address, authkey):
+    """Takes one task and never answers."""
+    connection = Client(address, authkey=authkey)
+    connection.send(('hello', 'hanging'))
+    connection.recv()
+    time.sleep(60)
+
+
+def raising_worker(address, authkey):
+    """Takes one task and answers with records the coordinator cannot load."""
+    connection = Client(address, authkey=authkey)
+    connection.send(('hello', 'raising'))
+    connection.recv()
+    connection.send(('result', {'scores': None}))
+    connection.close()
+
+
+def start(target, *args):
+    process = multiprocessing.Process(target=target, args=args, daemon=True)
+    process.start()
+    return process
+
+
+@pytest.fixture
+def coordinator():
+    coordinator = EvaluationCoordinator(chunk_size=2)
+    yield coordinator
+    coordinator.close()
+
+
+@pytest.fixture
+def reference():
+    env = WizardEnvironment()
+    env.evaluate_players(LINEUP, num_games=9, seed=5)
+    return env.records
+
+
+class TestEvaluationCoordinator:
+    def test_workers_results_merge_into_stats(self, coordinator, reference):
+        workers = [start(run_worker, coordinator.address, coordinator.authkey) for _ in range(3)]
+
+        env = WizardEnvironment()
+        stats = env.evaluate_players(LINEUP, num_games=9, seed=5, coordinator=coordinator)
+
+        np.testing.assert_array_equal(env.records.seeds, np.arange(5, 14))
+        np.testing.assert_array_equal(env.records.scores, reference.scores)
+        assert stats['WizardSimpleBot']['total_games'] == 18
+
+        coordinator.close()
+        for worker in workers:
+            worker.join(timeout=10)
+            assert worker.exitcode == 0
+
+    def test_dead_worker_chunks_are_requeued(self, coordinator, reference):
+        crashed = start(crashing_worker, coordinator.address, coordinator.authkey)
+        time.sleep(0.2)
+        worker = start(run_worker, coordinator.address, coordinator.authkey)
+
+        records = coordinator.run(LINEUP, range(5, 14))
+
+        np.testing.assert_array_equal(records.scores, reference.scores)
+        crashed.join(timeout=10)
+        worker.kill()
+
+    def test_chunks_of_a_raising_worker_are_requeued(self, coordinator, reference):
+        with ThreadPoolExecutor(1) as executor:
+            run = executor.submit(coordinator.run, LINEUP, range(5, 14))
+            raising = start(raising_worker, coordinator.address, coordinator.authkey)
+            raising.join(timeout=10)
+
+            # Once its connection is served, the chunk of the raising worker is queued again
+            deadline = time.monotonic() + 10
+            while coordinator.workers and time.monotonic() < deadline:
+                time.sleep(0.01)
+            job = coordinator._job
+            requeued = list(job.queue)
+
+            worker = start(run_worker, coordinator.address, coordinator.authkey)
+            np.testing.assert_array_equal(run.result(timeout=30).scores, reference.scores)
+        worker.kill()
+        assert requeued == job.chunks
+
+    def test_straggler_work_is_stolen(self, coordinator, reference):
+        hanging = start(hanging_worker, coordinator.address, coordinator.authkey)
+        time.sleep(0.2)
+        worker = start(run_worker, coordinator.address, coordinator.authkey)
+
+        records = coordinator.run(LINEUP, range(5, 14))
+
+        np.testing.assert_array_equal(records.scores, reference.scores)
+        hanging.kill()
+        worker.kill()
+
+    def test_requires_seed(self, coordinator):
+        with pytest.raises(ValueError):
+            WizardEnvironment().evaluate_players(LINEUP, num_games=2, coordinator=coordinator)
+
+
+class TestAuthkey:
+    def test_generated_keys_are_random(self, monkeypatch):
+        monkeypatch.delenv(AUTHKEY_ENV, raising=False)
+        with EvaluationCoordinator() as first, EvaluationCoordinator() as second:
+            assert first.authkey != second.authkey
+            with pytest.raises(AuthenticationError):
+                Client(first.address, authkey=second.authkey)
+
+            # A rejected client does not stop the coordinator from accepting workers
+            with Client(first.address, authkey=first.authkey) as connection:
+                connection.send(('hello', 'late'))
+
+    def test_key_from_environment(self, monkeypatch, reference):
+        monkeypatch.setenv(AUTHKEY_ENV, 'secret')
+        with EvaluationCoordinator(chunk_size=5) as coordinator:
+            assert coordinator.authkey == b'secret'
+            # The worker process inherits the environment variable
+            worker = start(run_worker, coordinator.address)
+            records = coordinator.run(LINEUP, range(5, 14))
+        worker.join(timeout=10)
+
+        np.testing.assert_array_equal(records.scores, reference.scores)
+
+    def test_public_bind_requires_explicit_key(self, monkeypatch):
+        monkeypatch.delenv(AUTHKEY_ENV, raising=False)
+        with pytest.raises(ValueError):
+            EvaluationCoordinator(('0.0.0.0', 0))
+        with pytest.raises(ValueError):
+            run_worker(('127.0.0.1', 1))
+
+        EvaluationCoordinator(('0.0.0.0', 0), authkey=b'secret').close()
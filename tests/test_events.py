@@ -0,0 +1,94 @@
+from collections import Counter
+
+from src.ai.simple_agent import WizardSimpleBot
+from src.core.events import (
+    BidPlaced, CardPlayed, EventBus, GameEvent, GameFinished, RoundScored, RoundStarted, TrickWon
+)
+from tests.helpers import final_scores, play
+
+
+LINEUP = [WizardSimpleBot] * 3
+
+
+def test_game_emits_every_event():
+    bus = EventBus()
+    events = []
+    bus.subscribe(events.append)
+    game = play(*LINEUP, events=bus)
+
+    counts = Counter(type(event) for event in events)
+    assert counts == {
+        RoundStarted: 20, BidPlaced: 60, CardPlayed: 630, TrickWon: 210, RoundScored: 20, GameFinished: 1
+    }
+    assert isinstance(events[0], RoundStarted) and isinstance(events[-1], GameFinished)
+
+    scored = [event for event in events if isinstance(event, RoundScored)]
+    assert [dict(event.scores) for event in scored] == [game.round_scores[r] for r in range(1, 21)]
+    assert all(event.bets[player] == game.bets_history[event.round_number][player]['bet']
+               for event in scored for player in event.bets)
+    assert dict(events[-1].scores) == dict(game.current_scores)
+
+    # The cards of a won trick are the cards played right before it
+    won = next(i for i, event in enumerate(events) if isinstance(event, TrickWon))
+    assert tuple((e.player, e.card) for e in events[won - 3:won]) == events[won].cards
+
+
+def test_subscribers_filter_by_type():
+    bus = EventBus()
+    tricks = []
+    bus.subscribe(tricks.append, (TrickWon,))
+
+    assert bus.wants(TrickWon) and not bus.wants(CardPlayed)
+    play(*LINEUP, events=bus)
+    assert len(tricks) == 210 and all(isinstance(event, TrickWon) for event in tricks)
+
+
+def test_batched_subscriber_gets_everything_by_the_end_of_the_game():
+    bus = EventBus()
+    batches = []
+    bus.subscribe(batches.append, batch_size=100)
+    play(*LINEUP, events=bus)
+
+    assert all(1 <= len(batch) <= 100 for batch in batches)
+    assert sum(len(batch) for batch in batches) == 941
+    assert isinstance(batches[-1][-1], GameFinished)
+
+
+def test_unsubscribe_flushes_pending_events():
+    bus = EventBus()
+    batches = []
+    bus.subscribe(batches.append, batch_size=1000)
+    bus.emit(GameFinished({}))
+    assert batches == []
+
+    bus.unsubscribe(batches.append)
+    assert batches == [[GameFinished({})]]
+    assert not bus.wants(GameEvent) and not bus.wants(GameFinished)
+
+
+def test_events_do_not_change_the_game():
+    silent = play(*LINEUP, seed=4, events=EventBus())
+    observed_bus = EventBus()
+    observed_bus.subscribe(lambda event: None)
+    observed = play(*LINEUP, seed=4, events=observed_bus)
+    plain = play(*LINEUP, seed=4)
+
+    assert final_scores(silent) == final_scores(observed) == final_scores(plain)
+
+
+def test_bookkeeping_builds_no_events(monkeypatch):
+    def not_wanted(*args):
+        raise AssertionError('event built without a subscriber')
+
+    for name in ('RoundStarted', 'BidPlaced', 'TrickWon', 'RoundScored'):
+        monkeypatch.setattr(f'src.core.round.{name}', not_wanted)
+    monkeypatch.setattr('src.core.trick.CardPlayed', not_wanted)
+    bus = EventBus()
+    finished = []
+    bus.subscribe(finished.append, (GameFinished,))
+
+    # The trick history and opponent model are updated without going through the bus
+    game = play(*LINEUP, events=bus)
+    assert len(finished) == 1
+    assert int(game.trick_history.num_tricks.sum()) == 210
+    assert all(game.opponent_model[player].rounds == 20 for player in game.players)
@@ -0,0 +1,180 @@
+import asyncio
+from types import MappingProxyType
+
+import pytest
+
+from src.ai.simple_agent import WizardSimpleBot
+from src.game.game_state import GameState
+from src.game.wizard_card import CardSuit, CardType, WizardCard
+from src.server.client import WizardClient
+from src.server.game_server import RemoteSeat, WizardGameServer
+from src.server.protocol import StateDeltaDecoder, StateDeltaEncoder, decode_message, encode_message, encode_state
+from tests import helpers
+
+
+class SlowFirstBidBot(WizardSimpleBot):
+    async def make_bid(self, state) -> int:
+        if state.current_round_number == 1:
+            await asyncio.sleep(0.2)
+        return super().make_bid(state)
+
+
+class DeltaCheckingBot(WizardSimpleBot):
+    """Sends every state it sees through the delta protocol and checks the decoded copy."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.encoder = StateDeltaEncoder()
+        self.decoder = StateDeltaDecoder(self)
+        self.deltas = []
+
+    def _check(self, state):
+        delta = decode_message(encode_message(self.encoder.encode(state)))
+        self.deltas.append(delta)
+        assert encode_state(self.decoder.decode(delta)) == encode_state(state)
+
+    def make_bid(self, state) -> int:
+        self._check(state)
+        return super().make_bid(state)
+
+    def play_card(self, state) -> WizardCard:
+        self._check(state)
+        return super().play_card(state)
+
+
+async def play(server: WizardGameServer, clients: list[WizardClient], max_games: int):
+    host, port = await server.start_tcp()
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(client.run_tcp(host, port, max_games) for client in clients)),
+            timeout=30
+        )
+    finally:
+        await server.close()
+
+
+class TestWizardGameServer:
+    def test_remote_bots_play_full_games(self):
+        server = WizardGameServer(table_size=3, games_per_table=2)
+        clients = [WizardClient(WizardSimpleBot(f'Bot{i}')) for i in range(3)]
+
+        asyncio.run(play(server, clients, max_games=2))
+
+        for client in clients:
+            assert len(client.results) == 2
+            assert client.results == clients[0].results
+
+        tables = server.table_stats()
+        assert len(tables) == 1
+        assert tables[0]['games'] == 2
+        assert tables[0]['decisions'] == 2 * 3 * sum(1 + n for n in range(1, 21))
+
+        connections = server.connection_stats()
+        assert sum(c['decisions'] for c in connections) == tables[0]['decisions']
+        assert all(c['timeouts'] == 0 and c['invalid_answers'] == 0 for c in connections)
+
+    def test_many_seats_over_unix_socket(self, tmp_path):
+        async def run():
+            server = WizardGameServer(table_size=3, games_per_table=1)
+            path = await server.start_unix(str(tmp_path / 'wizard.sock'))
+            client = WizardClient(WizardSimpleBot('Multi'), seats=6)
+            try:
+                await asyncio.wait_for(client.run_unix(path, max_games=1), timeout=30)
+            finally:
+                await server.close()
+            return server, client
+
+        server, client = asyncio.run(run())
+
+        assert len(client.results) == 6
+        assert len(server.table_stats()) == 2
+
+    def test_deadline_falls_back_to_default_move(self):
+        server = WizardGameServer(table_size=3, games_per_table=1, decision_timeout=0.05)
+        clients = [WizardClient(SlowFirstBidBot('Slow'))] + [WizardClient(WizardSimpleBot(f'Bot{i}')) for i in range(2)]
+
+        asyncio.run(play(server, clients, max_games=1))
+
+        timeouts = {c['seats'][0].split('_')[0]: c['timeouts'] for c in server.connection_stats()}
+        assert timeouts['Slow'] >= 1
+        assert server.table_stats()[0]['games'] == 1
+
+
+    @pytest.mark.parametrize('message', [
+        {'type': 'join'},
+        {'type': 'join', 'name': 'Bot', 'games': 'many'},
+        {'type': 'answer', 'value': 0},
+        {'type': 'shout'},
+        [1, 2, 3],
+    ])
+    def test_malformed_message_drops_only_its_connection(self, message):
+        async def run():
+            server = WizardGameServer(table_size=3, games_per_table=1)
+            host, port = await server.start_tcp()
+            try:
+                reader, writer = await asyncio.open_connection(host, port)
+                writer.write(encode_message(message))
+                await writer.drain()
+                # The server closes the broken connection
+                assert await asyncio.wait_for(reader.read(), timeout=5) == b''
+                writer.close()
+
+                clients = [WizardClient(WizardSimpleBot(f'Bot{i}')) for i in range(3)]
+                await asyncio.wait_for(asyncio.gather(*(c.run_tcp(host, port, 1) for c in clients)), timeout=30)
+            finally:
+                await server.close()
+            return server
+
+        assert asyncio.run(run()).games_played == 1
+
+    def test_trump_suit_is_picked_without_asking(self):
+        seat = RemoteSeat('Remote', None, decision_timeout=1.0)
+        hand = (
+            WizardCard(CardType.STANDARD, CardSuit.CLUBS, 3),
+            WizardCard(CardType.STANDARD, CardSuit.SPADES, 9),
+            WizardCard(CardType.STANDARD, CardSuit.CLUBS, 11),
+            WizardCard(CardType.WIZARD),
+        )
+        state = GameState(
+            players=(seat,), current_round_number=4, current_scores=MappingProxyType({}),
+            current_bets=MappingProxyType({}), trump_card=WizardCard(CardType.WIZARD), trump_suit=None,
+            current_trick=None, won_tricks=MappingProxyType({}), hand=hand,
+        )
+
+        assert seat.pick_trump_suit(state) == CardSuit.CLUBS
+        assert seat.pick_trump_suit(GameState(**{**state.__dict__, 'hand': ()})) == CardSuit.HEARTS
+
+
+class TestStateDeltaEncoder:
+    def test_only_changed_fields_are_sent(self):
+        players = tuple(WizardSimpleBot(name) for name in 'ABC')
+        state = GameState(
+            players=players,
+            current_round_number=1,
+            current_scores=MappingProxyType({p: 0 for p in players}),
+            current_bets=MappingProxyType({}),
+            trump_card=None,
+            trump_suit=None,
+            current_trick=None,
+            won_tricks=MappingProxyType({p: 0 for p in players}),
+            hand=(),
+            played_cards=(),
+        )
+        encoder = StateDeltaEncoder()
+
+        assert set(encoder.encode(state)) >= {'players', 'round', 'scores'}
+        assert encoder.encode(state) == {}
+
+    def test_played_cards_and_hand_are_sent_as_changes(self):
+        bots = [DeltaCheckingBot(name) for name in 'ABC']
+        game = helpers.play(*bots, seed=3)
+
+        for bot in bots:
+            # Within a round only the cards played since the last decision and the position of the own card travel
+            tails = [delta for delta in bot.deltas if 'played_tail' in delta]
+            assert tails and all(len(delta['played_tail']) < 2 * len(game.players) for delta in tails)
+            assert all(len(delta['played_by_tail']) == len(delta['played_tail']) for delta in tails)
+            removals = [delta['hand_removed'] for delta in bot.deltas if 'hand_removed' in delta]
+            assert removals and all(len(removed) == 1 for removed in removals)
+            # The full hand is sent once per round
+            assert sum('hand' in delta for delta in bot.deltas) == 20
@@ -0,0 +1,81 @@
+import pytest
+
+from src.ai.adrian_agent import WizardAdrianPlayerV01
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.league import Rating, WizardLeague, update_ratings, DEFAULT_SIGMA
+from src.ai.simple_agent import WizardSimpleBot
+
+
+class TestUpdateRatings:
+    def test_winner_gains_loser_loses(self):
+        ratings = [Rating(), Rating(), Rating()]
+        update_ratings(ratings, [1, 2, 3])
+
+        assert ratings[0].mu > ratings[1].mu > ratings[2].mu
+        assert all(rating.sigma < DEFAULT_SIGMA for rating in ratings)
+        assert all(rating.games == 1 for rating in ratings)
+
+    def test_tie_between_equals_keeps_mu(self):
+        ratings = [Rating(), Rating(), Rating()]
+        update_ratings(ratings, [1, 1, 1])
+
+        for rating in ratings:
+            assert rating.mu == pytest.approx(25.0)
+
+    def test_upset_moves_more_than_expected_result(self):
+        expected = [Rating(mu=30), Rating(mu=20), Rating(mu=20)]
+        upset = [Rating(mu=30), Rating(mu=20), Rating(mu=20)]
+        update_ratings(expected, [1, 2, 3])
+        update_ratings(upset, [3, 1, 2])
+
+        assert 30 - upset[0].mu > expected[0].mu - 30
+
+
+class TestWizardLeague:
+    @pytest.fixture
+    def pool(self):
+        return {
+            'adrian_v01': WizardAdrianPlayerV01,
+            'simple_a': WizardSimpleBot,
+            'simple_b': WizardSimpleBot,
+            'debug': WizardDebugPlayer,
+        }
+
+    def test_sample_lineup(self, pool):
+        league = WizardLeague(pool, table_sizes=(3, 4, 5), seed=1)
+
+        for _ in range(20):
+            lineup = league.sample_lineup()
+            assert 3 <= len(lineup) <= 4
+            assert len(set(lineup)) == len(lineup)
+
+    def test_sampling_prefers_uncertain_agents(self, pool):
+        league = WizardLeague(pool, table_sizes=(3,), seed=2)
+        for name in ('adrian_v01', 'simple_a', 'simple_b'):
+            league.ratings[name].sigma = 0.5
+
+        counts = sum('debug' in league.sample_lineup() for _ in range(200))
+
+        assert counts > 190
+
+    def test_record_with_ties(self, pool):
+        league = WizardLeague(pool, seed=3)
+        game = league.record(['simple_a', 'simple_b', 'debug'], {'simple_a': 50, 'simple_b': 50, 'debug': -30})
+
+        assert game.ranks == {'simple_a': 1, 'simple_b': 1, 'debug': 2}
+        assert league.ratings['simple_a'].mu == pytest.approx(league.ratings['simple_b'].mu)
+        assert league.ratings['debug'].mu < 25
+
+    def test_run_in_process(self, pool):
+        league = WizardLeague(pool, seed=4)
+        ratings = league.run(8)
+
+        assert len(league.history) == 8
+        assert sum(rating.games for rating in ratings.values()) == sum(len(game.lineup) for game in league.history)
+        assert [name for name, _ in league.leaderboard()][0] in pool
+
+    def test_run_with_workers(self, pool):
+        league = WizardLeague(pool, seed=5)
+        league.run(6, workers=2)
+
+        assert len(league.history) == 6
@@ -0,0 +1,79 @@
+import io
+import time
+
+import numpy as np
+import pytest
+
+from src.ai.confidence import mean_interval, wilson_interval
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.evaluation_records import EvaluationRecords
+from src.ai.live_progress import LiveProgress, format_duration
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.wizard_environment import WizardEnvironment
+
+
+def test_intervals():
+    low, high = wilson_interval([0, 50, 100], [100, 100, 100])
+    assert low[0] == pytest.approx(0.0, abs=1e-12) and high[2] == pytest.approx(1.0)
+    assert low[1] < 0.5 < high[1] and high[1] - low[1] == pytest.approx(0.1924, abs=1e-3)
+
+    values = np.array([1.0, 2.0, 3.0, 4.0])
+    mean, mean_low, mean_high = mean_interval(values.sum(), (values ** 2).sum(), len(values))
+    half_width = 1.959963984540054 * values.std(ddof=1) / 2
+    assert mean == 2.5 and mean_high - mean == pytest.approx(half_width)
+
+
+def test_view_shows_pooled_agents_and_rate_limits_frames():
+    stream = io.StringIO()
+    progress = LiveProgress(100, ['A', 'B', 'A'], interval=60, stream=stream)
+    progress.start()
+
+    records = EvaluationRecords.empty(10, 3)
+    records.scores[:] = [30, 20, 10]
+    for _ in range(5):
+        progress.consume(records)
+    progress.close()
+
+    # Only the final frame, no redraws in place on a non-terminal stream
+    assert progress.frames == 1 and '\x1b[' not in stream.getvalue()
+    lines = progress.frame()
+    assert lines[0].startswith('Games 50/100 (50.0%)')
+    assert 'ETA' in lines[0] and 'games/s' in lines[0]
+    agent_a = next(line for line in lines if line.startswith('A '))
+    assert ' 100 ' in agent_a and '50.0%' in agent_a and '20.0' in agent_a
+
+
+def test_view_redraws_while_waiting():
+    progress = LiveProgress(10, ['A', 'B', 'C'], interval=0.01, stream=io.StringIO())
+    progress.start()
+    time.sleep(0.2)
+    progress.close()
+    assert progress.frames > 2
+
+
+def test_format_duration():
+    assert format_duration(3725.9) == '1:02:05'
+
+
+def test_live_evaluation(capsys):
+    env = WizardEnvironment()
+    env.evaluate_players([WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot], num_games=3, seed=1, live=True)
+
+    output = capsys.readouterr().out
+    assert 'Games 3/3 (100.0%)' in output and 'WizardDebugPlayer' in output
+
+
+def test_worker_progress_without_telemetry():
+    progress = LiveProgress(10, ['A', 'B', 'C'], interval=60, stream=io.StringIO())
+    counters = np.array([3, 1])
+    progress.watch_workers(counters, [5, 5])
+    counters[1] = 2
+
+    assert 'Workers: 0:3/5  1:2/5' in progress.frame()
+
+
+def test_live_evaluation_in_workers_shows_worker_progress(capsys):
+    env = WizardEnvironment()
+    env.evaluate_players([WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot], num_games=4, seed=1, workers=2, live=True)
+
+    assert 'Workers: 0:2/2  1:2/2' in capsys.readouterr().out
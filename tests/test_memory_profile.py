@@ -0,0 +1,59 @@
+import tracemalloc
+
+import pytest
+
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.memory_profile import MemoryProfiler
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.wizard_environment import WizardEnvironment
+
+LINEUP = [WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot]
+
+
+def test_profile_per_game_phase_and_agent():
+    profiler = MemoryProfiler(num_sites=5)
+    stats = WizardEnvironment(memory_profiler=profiler).evaluate_players(LINEUP, 3, seed=0)
+
+    assert len(profiler.games) == 3
+    assert all(game.peak_bytes > 0 for game in profiler.games)
+    assert profiler.phases['round'].calls == 3 * 20
+    assert profiler.phases['trick.determine_winner'].calls == 3 * sum(range(1, 21))
+    assert profiler.agents['WizardSimpleBot'].calls == 2 * profiler.agents['WizardDebugPlayer'].calls
+    assert profiler.phases['game_state.from_game'].allocated_bytes > 0
+    assert all(usage.allocated_bytes >= usage.retained_bytes for usage in profiler.phases.values())
+    assert 0 < len(profiler.top_sites) <= 5
+    assert not tracemalloc.is_tracing()
+
+    # Profiling does not change the results
+    plain = WizardEnvironment().evaluate_players(LINEUP, 3, seed=0)
+    assert plain['WizardSimpleBot']['total_score'] == stats['WizardSimpleBot']['total_score']
+
+
+def test_memory_freed_inside_a_span_counts_as_allocated():
+    profiler = MemoryProfiler()
+    with profiler.profile():
+        outer = profiler.begin()
+        inner = profiler.begin()
+        buffer = bytearray(1_000_000)
+        del buffer
+        profiler.end('inner', inner, None)
+        profiler.end('outer', outer, None)
+
+    for name in ('inner', 'outer'):
+        usage = profiler.phases[name]
+        assert usage.allocated_bytes >= 1_000_000
+        assert usage.retained_bytes < 100_000
+
+
+def test_print_report(capsys):
+    profiler = MemoryProfiler()
+    WizardEnvironment(memory_profiler=profiler).evaluate_players(LINEUP, 1, seed=0)
+    profiler.print_report()
+
+    output = capsys.readouterr().out
+    assert 'Memory Profile' in output and 'Top allocation sites' in output
+
+
+def test_profiling_requires_in_process_games():
+    with pytest.raises(ValueError):
+        WizardEnvironment(memory_profiler=MemoryProfiler()).evaluate_players(LINEUP, 4, workers=2)
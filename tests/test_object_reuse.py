@@ -0,0 +1,82 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.evaluation_records import EvaluationRecords
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.wizard_environment import WizardEnvironment, play_game_into
+from src.core.deck import Deck
+from src.core.round import Round
+from src.core.trick import Trick
+from src.core.turn import Turn
+from src.game.wizard_card_factory import create_wizard_cards
+from src.game.wizard_game import WizardGame
+from tests.helpers import final_scores, play
+
+LINEUP = [WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot]
+
+
+@pytest.mark.parametrize('cls', [Deck, Round, Trick, Turn, WizardGame])
+def test_engine_objects_use_slots(cls):
+    assert '__slots__' in vars(cls)
+
+
+def test_deck_reset_restores_every_card():
+    deck = Deck(create_wizard_cards())
+    deck.draw(20)
+    deck.reset()
+
+    assert deck.remaining() == 60
+    assert sorted(map(str, deck.draw(60))) == sorted(map(str, create_wizard_cards()))
+
+
+def test_reset_game_plays_like_a_fresh_game():
+    game = play(*LINEUP, seed=1)
+    previous_round = game.current_round
+
+    # Resetting shuffles the deck, like creating a new game does
+    random.seed(2)
+    game.reset()
+    assert game.players == () and game.round_scores == {} and game.current_round is None
+    replayed = final_scores(play(*LINEUP, seed=None, game=game))
+
+    assert replayed == final_scores(play(*LINEUP, seed=2))
+    # The round object of the first game was reused
+    assert game.current_round is previous_round
+
+
+class TrickKeepingBot(WizardSimpleBot):
+    def play_card(self, state):
+        self.kept.append((state.current_trick, dict(state.current_trick.trick_cards)))
+        return super().play_card(state)
+
+
+def test_kept_tricks_are_not_overwritten():
+    bots = [TrickKeepingBot(f'bot_{i}') for i in range(3)]
+    kept = []
+    for bot in bots:
+        bot.kept = kept
+    play(*bots, seed=3)
+
+    tricks = {id(trick): trick for trick, _ in kept}
+    assert len(tricks) == sum(range(1, 21))
+    # A kept trick still holds the cards played before the decision, followed by the rest of its trick
+    for trick, cards_then in kept:
+        assert len(trick.trick_cards) == 3
+        assert list(trick.trick_cards.items())[:len(cards_then)] == list(cards_then.items())
+
+
+def test_evaluation_reuses_one_game_per_worker():
+    first = play_game_into(EvaluationRecords.empty(1, 3), 0, LINEUP, 5)
+    assert play_game_into(EvaluationRecords.empty(1, 3), 0, LINEUP, 6, game=first) is first
+    assert all(first.opponent_model[player].rounds == 20 for player in first.players)
+
+    # Reused games play like fresh ones, their opponent statistics start empty every game
+    reused = WizardEnvironment().simulate(LINEUP, range(4))
+    fresh = EvaluationRecords.empty(4, 3)
+    for index in range(4):
+        play_game_into(fresh, index, LINEUP, index)
+    np.testing.assert_array_equal(reused.scores, fresh.scores)
+    np.testing.assert_array_equal(reused.bets, fresh.bets)
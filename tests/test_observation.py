@@ -0,0 +1,96 @@
+from types import MappingProxyType
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.ai.observation import ObservationEncoder, SCORE_OFFSET
+from src.core.player import WizardBasePlayer
+from src.core.trick import Trick
+from src.game.game_state import GameState
+from src.game.wizard_card import WizardCard, CardType, CardSuit, card_to_id, NUM_CARD_IDS
+
+
+class DummyPlayer(WizardBasePlayer):
+    pass
+
+
+class TestObservationEncoder:
+    @pytest.fixture
+    def players(self):
+        return tuple(DummyPlayer(name) for name in ('A', 'B', 'C'))
+
+    @pytest.fixture
+    def state(self, players):
+        a, b, c = players
+        trick = Mock(spec=Trick)
+        trick.trick_cards = {c: WizardCard(CardType.WIZARD)}
+        return GameState(
+            players=players,
+            current_round_number=2,
+            current_scores=MappingProxyType({a: 30, b: -20, c: 0}),
+            current_bets=MappingProxyType({a: 1, b: 0, c: 2}),
+            trump_card=WizardCard(CardType.STANDARD, CardSuit.SPADES, 4),
+            trump_suit=CardSuit.SPADES,
+            current_trick=trick,
+            won_tricks=MappingProxyType({a: 0, b: 1, c: 0}),
+            hand=(WizardCard(CardType.STANDARD, CardSuit.HEARTS, 10), WizardCard(CardType.JESTER)),
+            played_cards=(WizardCard(CardType.JESTER), WizardCard(CardType.STANDARD, CardSuit.CLUBS, 2)),
+        )
+
+    def test_layout(self, state, players):
+        encoder = ObservationEncoder(3)
+        obs = encoder.encode(state, players[1])
+
+        assert obs.shape == (encoder.size,)
+        assert obs.dtype == np.float32
+
+        hand = obs[encoder.slices['hand']]
+        assert hand.sum() == 2
+        assert hand[card_to_id(WizardCard(CardType.JESTER))] == 1
+
+        # Observer is B, so C is relative seat 1
+        trick = obs[encoder.slices['trick']].reshape(3, NUM_CARD_IDS)
+        assert trick[1, card_to_id(WizardCard(CardType.WIZARD))] == 1
+        assert trick.sum() == 1
+
+        np.testing.assert_array_equal(obs[encoder.slices['bids']], [0, 2, 1])
+        np.testing.assert_array_equal(obs[encoder.slices['won_tricks']], [1, 0, 0])
+        np.testing.assert_array_equal(obs[encoder.slices['scores']], [-2, 0, 3])
+        np.testing.assert_array_equal(obs[encoder.slices['seat']], [0, 1, 0])
+        assert obs[encoder.slices['round']][0] == 2
+        assert obs[encoder.slices['played']].sum() == 2
+
+    def test_integer_dtype_offsets_scores(self, state, players):
+        encoder = ObservationEncoder(3, dtype=np.uint8)
+        obs = encoder.encode(state, players[0])
+
+        assert obs.dtype == np.uint8
+        np.testing.assert_array_equal(obs[encoder.slices['scores']], [SCORE_OFFSET + 3, SCORE_OFFSET - 2, SCORE_OFFSET])
+
+    def test_encode_batch_fills_buffer_in_place(self, state, players):
+        encoder = ObservationEncoder(3)
+        buffer = encoder.allocate(4)
+        buffer[:] = 7
+
+        result = encoder.encode_batch([state, state], players[:2], buffer)
+
+        assert result is buffer
+        np.testing.assert_array_equal(buffer[0], encoder.encode(state, players[0]))
+        np.testing.assert_array_equal(buffer[1], encoder.encode(state, players[1]))
+        assert (buffer[2:] == 7).all()
+
+    def test_rejects_wrong_player_count(self, state, players):
+        with pytest.raises(ValueError):
+            ObservationEncoder(4).encode(state, players[0])
+
+    def test_state_without_played_cards(self, state, players):
+        # Callers that build a GameState with the original fields only still work
+        minimal = GameState(**{name: getattr(state, name) for name in (
+            'players', 'current_round_number', 'current_scores', 'current_bets',
+            'trump_card', 'trump_suit', 'current_trick', 'won_tricks', 'hand'
+        )})
+
+        encoder = ObservationEncoder(3)
+        assert minimal.played_cards == ()
+        assert encoder.encode(minimal, players[0])[encoder.slices['played']].sum() == 0
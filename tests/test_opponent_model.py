@@ -0,0 +1,74 @@
+import pytest
+
+from src.ai.league import WizardLeague, play_league_game
+from src.ai.simple_agent import WizardSimpleBot
+from src.game.opponent_model import OpponentModel, OpponentStats
+from tests.helpers import play
+
+
+def test_stats_update():
+    stats = OpponentStats()
+    stats.update(bet=2, won=2, round_number=4)
+    stats.update(bet=1, won=3, round_number=4)
+
+    assert stats.rounds == 2
+    assert stats.accuracy == 0.5
+    assert stats.bias == 1.0
+    assert stats.mean_error == 1.0
+    assert stats.aggressiveness == 3 / 8
+
+
+def test_model_looks_players_up_by_name():
+    model = OpponentModel()
+    assert model['alice'].rounds == 0 and 'alice' not in model
+
+    model.record_rounds([(1, {'alice': (1, 0)}), (2, {'alice': (0, 0), 'bob': (2, 1)})])
+    assert model[WizardSimpleBot('alice')] is model['alice']
+    assert model['alice'].rounds == 2 and model['bob'].bias == -1.0
+    assert sorted(model) == ['alice', 'bob'] and len(model) == 2
+
+
+class ModelReadingBot(WizardSimpleBot):
+    def make_bid(self, state):
+        self.seen.append((state.current_round_number, state.opponent_model, state.opponent_model[self].rounds))
+        return super().make_bid(state)
+
+
+def test_game_updates_the_shared_model_every_round():
+    bots = [ModelReadingBot(f'bot_{i}') for i in range(3)]
+    for bot in bots:
+        bot.seen = []
+    game = play(*bots)
+
+    model = game.opponent_model
+    for bot in bots:
+        assert [rounds for _, _, rounds in bot.seen] == list(range(20))
+        assert all(seen_model is model for _, seen_model, _ in bot.seen)
+
+        stats = model[bot]
+        bets = [game.bets_history[r][bot] for r in range(1, 21)]
+        assert stats.rounds == 20
+        assert stats.diff_total == sum(b['diff'] for b in bets)
+        assert stats.exact == sum(b['diff'] == 0 for b in bets)
+
+    # The model outlives a reset and keeps counting
+    game.reset()
+    for bot in bots:
+        game.add_player(bot)
+    game.start_game()
+    assert model[bots[0]].rounds == 40
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_league_keeps_the_model_across_games(workers):
+    league = WizardLeague({'a': WizardSimpleBot, 'b': WizardSimpleBot, 'c': WizardSimpleBot}, table_sizes=(3,), seed=1)
+    league.run(3, workers=workers)
+
+    for name in 'abc':
+        assert league.opponent_model[name].rounds == 60
+
+
+def test_play_league_game_updates_a_given_model():
+    model = OpponentModel()
+    play_league_game([('a', WizardSimpleBot), ('b', WizardSimpleBot), ('c', WizardSimpleBot)], seed=1, opponent_model=model)
+    assert model['a'].rounds == 20
@@ -0,0 +1,106 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.evaluation_records import EvaluationRecords
+from src.ai.pipeline import RatingUpdater, RecordWriter, ResultConsumer, ResultPipeline
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.wizard_environment import WizardEnvironment
+
+LINEUP = [WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot]
+
+
+class Collector(ResultConsumer):
+    def __init__(self):
+        self.chunks = []
+        self.closed = False
+
+    def consume(self, records):
+        self.chunks.append(records.copy())
+
+    def close(self):
+        self.closed = True
+
+
+class Blocked(ResultConsumer):
+    def __init__(self):
+        self.release = threading.Event()
+
+    def consume(self, records):
+        self.release.wait()
+
+
+class Failing(ResultConsumer):
+    def consume(self, records):
+        raise KeyError('broken consumer')
+
+
+def chunk(num_games=2):
+    return EvaluationRecords.empty(num_games, 3)
+
+
+def test_consumers_must_implement_consume():
+    class Incomplete(ResultConsumer):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_full_queue_blocks_the_producer():
+    blocked = Blocked()
+    pipeline = ResultPipeline([blocked], queue_size=1)
+    pipeline.put(chunk())  # taken by the consumer
+    pipeline.put(chunk())  # fills the queue
+
+    producer = threading.Thread(target=pipeline.put, args=(chunk(),))
+    producer.start()
+    time.sleep(0.1)
+    assert producer.is_alive()
+
+    blocked.release.set()
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+    pipeline.close()
+
+
+def test_consumer_errors_are_raised_on_close():
+    collector = Collector()
+    pipeline = ResultPipeline([Failing(), collector], queue_size=1)
+    for _ in range(5):
+        pipeline.put(chunk())
+
+    with pytest.raises(KeyError):
+        pipeline.close()
+    assert len(collector.chunks) == 5 and collector.closed
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_evaluation_streams_every_game(tmp_path, workers):
+    collector = Collector()
+    writer = RecordWriter(str(tmp_path))
+    ratings = RatingUpdater()
+    env = WizardEnvironment()
+    env.stream_chunk_size = 4
+    stats = env.evaluate_players(LINEUP, num_games=11, seed=3, workers=workers, consumers=[collector, writer, ratings])
+
+    streamed = EvaluationRecords.concatenate(collector.chunks)
+    streamed = streamed[np.argsort(streamed.seeds)]
+    np.testing.assert_array_equal(streamed.scores, env.records.scores)
+    np.testing.assert_array_equal(streamed.bets, env.records.bets)
+    if workers == 0:
+        assert [len(c) for c in collector.chunks] == [4, 4, 3]
+
+    written = EvaluationRecords.concatenate([EvaluationRecords.load(path) for path in writer.paths])
+    assert sorted(written.seeds.tolist()) == list(range(3, 14))
+
+    assert [rating.games for rating in ratings.ratings] == [11, 11, 11]
+    assert stats['WizardDebugPlayer']['total_games'] == 11
+    # Per-game stats are in seed order whatever order the games finished in
+    debug_stats = stats['WizardDebugPlayer']
+    assert debug_stats['scores'] == env.records.scores[:, 1].tolist()
+    assert debug_stats['positions'] == env.records.positions[:, 1].tolist()
+    assert debug_stats['round_scores'][20] == env.records.round_scores[:, 1, 19].tolist()
@@ -0,0 +1,77 @@
+from concurrent.futures import Executor, Future
+from types import MappingProxyType
+
+from src.ai.adrian_agent import WizardAdrianPlayerV01
+from src.ai.pondering import HypotheticalTrick, after_move, next_player, pondering
+from src.ai.simple_agent import WizardSimpleBot
+from src.core.decision import DecisionKind
+from src.game.game_state import GameState
+from src.game.wizard_card import CardSuit, CardType, WizardCard
+from src.game.wizard_game import WizardGame
+from tests.helpers import final_scores, play
+
+PonderingAdrian = pondering(WizardAdrianPlayerV01)
+
+
+class BlockingBot(WizardSimpleBot):
+    blocking = True
+
+
+class InlineExecutor(Executor):
+    """Runs submitted calls right away, so pondering always finishes before the blocking player answers."""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def play_adrian(adrian_class, ponder, executor=None, seed=0):
+    # With seed 0 the shuffled seating puts the blocking bot right before Adrian
+    adrian = adrian_class('adrian')
+    start = (lambda game: game.start_game_pondering(executor)) if ponder else WizardGame.start_game
+    game = play(BlockingBot('human'), adrian, WizardSimpleBot('bot'), seed=seed, start=start)
+    return adrian, final_scores(game)
+
+
+def test_pondered_answers_match_direct_answers():
+    adrian, pondered_scores = play_adrian(PonderingAdrian, ponder=True, executor=InlineExecutor())
+    _, scores = play_adrian(WizardAdrianPlayerV01, ponder=False)
+
+    assert pondered_scores == scores
+    assert adrian.ponder_hits > 0
+
+
+def test_thread_pool_pondering_plays_the_same_game():
+    _, pondered_scores = play_adrian(PonderingAdrian, ponder=True, seed=8)
+    _, scores = play_adrian(WizardAdrianPlayerV01, ponder=False, seed=8)
+
+    assert pondered_scores == scores
+
+
+def test_no_pondering_without_a_blocking_player():
+    calls = []
+
+    class Recorder(WizardSimpleBot):
+        def ponder(self, state, player, kind, stop):
+            calls.append(player)
+
+    play(Recorder, Recorder, Recorder, start=WizardGame.start_game_pondering)
+    assert calls == []
+
+
+def test_hypothetical_card_sets_the_trick_suit():
+    a, b, c = (WizardSimpleBot(name) for name in 'abc')
+    trick = HypotheticalTrick(MappingProxyType({a: WizardCard(CardType.JESTER)}), None)
+    state = GameState(
+        players=(a, b, c), current_round_number=2, current_scores={}, current_bets={a: 0, b: 1, c: 1},
+        trump_card=None, trump_suit=None, current_trick=trick, won_tricks={}, hand=(), played_cards=(),
+    )
+
+    assert next_player(state, b, DecisionKind.PLAY_CARD) is c
+    assert next_player(state, c, DecisionKind.PLAY_CARD) is None
+
+    after = after_move(state, b, DecisionKind.PLAY_CARD, WizardCard(CardType.STANDARD, CardSuit.HEARTS, 3))
+    assert after.current_trick.trick_suit == CardSuit.HEARTS
+    assert list(after.current_trick.trick_cards) == [a, b]
+    assert list(trick.trick_cards) == [a]
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.result_cache import EvaluationCache, seed_ranges
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.wizard_environment import WizardEnvironment
+
+LINEUP = [WizardSimpleBot, WizardSimpleBot, WizardDebugPlayer]
+
+
+@pytest.fixture
+def simulated_seeds(monkeypatch):
+    """Record the seeds each evaluation actually simulates."""
+    calls = []
+    simulate = WizardEnvironment.simulate
+
+    def recording_simulate(self, player_classes, seeds, workers=0):
+        calls.append(list(seeds))
+        return simulate(self, player_classes, seeds, workers)
+
+    monkeypatch.setattr(WizardEnvironment, 'simulate', recording_simulate)
+    return calls
+
+
+class TestEvaluationCache:
+    def test_repeated_run_is_loaded(self, tmp_path, simulated_seeds):
+        first = WizardEnvironment()
+        first.evaluate_players(LINEUP, num_games=6, seed=100, cache_dir=str(tmp_path))
+        second = WizardEnvironment()
+        second.evaluate_players(LINEUP, num_games=6, seed=100, cache_dir=str(tmp_path))
+
+        assert simulated_seeds == [list(range(100, 106))]
+        np.testing.assert_array_equal(first.records.scores, second.records.scores)
+        assert first.stats['WizardSimpleBot']['scores'] == second.stats['WizardSimpleBot']['scores']
+
+    def test_larger_run_only_simulates_missing_seeds(self, tmp_path, simulated_seeds):
+        WizardEnvironment().evaluate_players(LINEUP, num_games=4, seed=10, cache_dir=str(tmp_path))
+        env = WizardEnvironment()
+        env.evaluate_players(LINEUP, num_games=8, seed=8, cache_dir=str(tmp_path))
+
+        assert simulated_seeds[1:] == [[8, 9], [14, 15]]
+        np.testing.assert_array_equal(env.records.seeds, np.arange(8, 16))
+        assert env.stats['WizardDebugPlayer']['total_games'] == 8
+        assert env.stats['WizardSimpleBot']['total_games'] == 16
+
+    def test_cached_results_match_fresh_simulation(self, tmp_path):
+        cached = WizardEnvironment()
+        cached.evaluate_players(LINEUP, num_games=3, seed=7, cache_dir=str(tmp_path))
+        cached.evaluate_players(LINEUP, num_games=3, seed=7, cache_dir=str(tmp_path))
+        fresh = WizardEnvironment()
+        fresh.evaluate_players(LINEUP, num_games=3, seed=7)
+
+        np.testing.assert_array_equal(cached.records.round_scores, fresh.records.round_scores)
+
+    def test_key_depends_on_lineup_order(self, tmp_path):
+        cache = EvaluationCache(str(tmp_path))
+
+        assert cache.key(LINEUP) != cache.key(LINEUP[::-1])
+        assert cache.key(LINEUP) == cache.key(list(LINEUP))
+
+    def test_cache_requires_seed(self, tmp_path):
+        with pytest.raises(ValueError):
+            WizardEnvironment().evaluate_players(LINEUP, num_games=1, cache_dir=str(tmp_path))
+
+
+def test_seed_ranges():
+    assert seed_ranges(np.array([1, 2, 3, 7, 9, 10])) == [range(1, 4), range(7, 8), range(9, 11)]
+    assert seed_ranges(np.array([], dtype=np.int64)) == []
@@ -107,10 +107,12 @@ class TestRound:
 
             # Verify Trick was created with the correct parameters
             MockTrick.assert_called_once_with(
-                round_instance._players.copy(),
+                round_instance._players,
                 round_instance._hands,
                 round_instance.trump_suit,
-                round_instance._game_state_callback
+                round_instance._game_state_callback,
+                0,
+                None
             )
 
             # Verify the trick was played
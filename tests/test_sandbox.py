@@ -0,0 +1,183 @@
+import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.ai import sandbox
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.league import WizardLeague
+from src.ai.result_cache import agent_source_hash
+from src.ai.sandbox import SandboxedPlayer, sandboxed, sandbox_stats, shutdown_sandboxes
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.wizard_environment import WizardEnvironment
+from src.game.game_state import GameState
+from tests.helpers import play
+
+
+class RaisingBot(WizardSimpleBot):
+    def play_card(self, state):
+        raise RuntimeError('broken bot')
+
+
+class RoundBidBot(WizardSimpleBot):
+    def make_bid(self, state):
+        return state.current_round_number
+
+
+class HangingBot(WizardSimpleBot):
+    def make_bid(self, state):
+        if state.current_round_number == 2:
+            time.sleep(60)
+        return super().make_bid(state)
+
+
+class CrashingBot(WizardSimpleBot):
+    def make_bid(self, state):
+        if state.current_round_number == 3:
+            os._exit(1)
+        return super().make_bid(state)
+
+
+@pytest.fixture(autouse=True)
+def fresh_sandboxes():
+    shutdown_sandboxes()
+    yield
+    shutdown_sandboxes()
+
+
+def test_sandboxed_agent_plays_like_in_process():
+    plain = WizardEnvironment().evaluate_players([WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot], 5, seed=3)
+    boxed = WizardEnvironment().evaluate_players(
+        [sandboxed(WizardSimpleBot), WizardDebugPlayer, sandboxed(WizardSimpleBot)], 5, seed=3
+    )
+
+    assert [s['total_score'] for s in plain.values()] == [s['total_score'] for s in boxed.values()]
+    # One worker for both seats, reused across all games
+    stats = sandbox_stats()
+    assert list(stats) == ['WizardSimpleBot']
+    assert stats['WizardSimpleBot'].decisions > 0
+    assert stats['WizardSimpleBot'].timeouts == stats['WizardSimpleBot'].crashes == 0
+
+
+def test_agent_exceptions_fall_back_to_a_legal_card():
+    play(sandboxed(RaisingBot), WizardDebugPlayer, WizardDebugPlayer)
+
+    assert sandbox_stats()['RaisingBot'].errors > 0
+
+
+def test_deadline_kills_and_restarts_the_worker():
+    game = play(sandboxed(HangingBot, decision_timeout=0.2), WizardDebugPlayer, WizardDebugPlayer)
+
+    stats = sandbox_stats()['HangingBot']
+    assert stats.timeouts == 1
+    assert sandbox._workers[HangingBot].generation == 2
+    assert game.current_round.round_number == 20
+
+
+def test_crashed_worker_is_restarted():
+    play(sandboxed(CrashingBot), WizardDebugPlayer, WizardDebugPlayer)
+
+    assert sandbox_stats()['CrashingBot'].crashes == 1
+
+
+def test_worker_replies_are_not_unpickled():
+    assert sandbox._decode_reply(sandbox._encode_reply(True, 7)) == (True, 7)
+    assert sandbox._decode_reply(sandbox._encode_reply(False, error="ValueError('ü')")) == (False, "ValueError('ü')")
+    # Anything but the fixed layout is rejected, a pickle is never loaded
+    assert sandbox._decode_reply(pickle.dumps((True, 7))) is None
+    assert sandbox._decode_reply(b'') is None
+
+
+def test_threads_sharing_a_worker_get_their_own_replies():
+    players = [sandboxed(RoundBidBot)(f'bot_{i}') for i in range(8)]
+
+    def bids(player, round_number):
+        state = GameState(
+            players=(player,), current_round_number=round_number, current_scores={}, current_bets={},
+            trump_card=None, trump_suit=None, current_trick=None, won_tricks={}, hand=(),
+        )
+        return [player.make_bid(state) for _ in range(50)]
+
+    with ThreadPoolExecutor(len(players)) as executor:
+        results = list(executor.map(bids, players, range(1, len(players) + 1)))
+
+    assert results == [[round_number] * 50 for round_number in range(1, len(players) + 1)]
+    assert sandbox_stats()['RoundBidBot'].crashes == 0
+
+
+class TunedBot(WizardSimpleBot):
+    bid_offset = 1
+
+
+def test_sandboxed_classes_pickle_by_their_arguments():
+    boxed = sandboxed(WizardSimpleBot, decision_timeout=0.5)
+
+    assert sandboxed(WizardSimpleBot, 0.5) is boxed
+    assert pickle.loads(pickle.dumps(boxed)) is boxed
+    assert pickle.loads(pickle.dumps(SandboxedPlayer)) is SandboxedPlayer
+
+
+def test_league_runs_sandboxed_agents_on_workers():
+    league = WizardLeague({
+        'boxed': sandboxed(WizardSimpleBot), 'simple': WizardSimpleBot, 'debug': WizardDebugPlayer
+    }, table_sizes=(3,), seed=0)
+    league.run(2, workers=1)
+
+    assert [rating.games for rating in league.ratings.values()] == [2, 2, 2]
+
+
+def test_source_hash_covers_the_hosted_agent():
+    assert agent_source_hash(sandboxed(WizardSimpleBot)) != agent_source_hash(sandboxed(WizardDebugPlayer))
+    assert agent_source_hash(sandboxed(WizardSimpleBot)) != agent_source_hash(sandboxed(TunedBot))
+
+
+def test_decoded_states_match_the_engine():
+    mismatches = []
+
+    class CheckedBot(WizardSimpleBot):
+        def __init__(self, name):
+            super().__init__(name)
+            self.encoder = sandbox._StateEncoder()
+            self.decoder = sandbox._StateDecoder(WizardSimpleBot(name))
+            self.decisions = 0
+
+        def check(self, state):
+            self.decisions += 1
+            # A restarted worker starts over in the middle of a round
+            if self.decisions % 50 == 0:
+                self.encoder.reset()
+                self.decoder = sandbox._StateDecoder(WizardSimpleBot(self.name))
+            decoded = self.decoder.decode(self.encoder.encode(state))
+
+            def names(mapping):
+                return {player.name: value for player, value in mapping.items()}
+
+            trick = state.current_trick
+            expected = (
+                state.current_round_number, state.trump_card, state.trump_suit, state.hand, state.played_cards,
+                [p.name for p in state.seen_cards.players], names(state.current_scores), names(state.current_bets),
+                names(state.won_tricks), names(trick.trick_cards) if trick else None, trick.trick_suit if trick else None
+            )
+            trick = decoded.current_trick
+            actual = (
+                decoded.current_round_number, decoded.trump_card, decoded.trump_suit, decoded.hand, decoded.played_cards,
+                [p.name for p in decoded.seen_cards.players], names(decoded.current_scores), names(decoded.current_bets),
+                names(decoded.won_tricks), names(trick.trick_cards) if trick else None, trick.trick_suit if trick else None
+            )
+            if actual != expected:
+                mismatches.append((expected, actual))
+
+        def make_bid(self, state):
+            self.check(state)
+            return super().make_bid(state)
+
+        def play_card(self, state):
+            self.check(state)
+            return super().play_card(state)
+
+    game = play(CheckedBot, CheckedBot, WizardDebugPlayer)
+
+    assert sum(player.decisions for player in game.players[:2]) == 2 * 230
+    assert mismatches == []
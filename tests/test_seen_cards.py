@@ -0,0 +1,92 @@
+import pickle
+
+from src.core.player import WizardBasePlayer
+from src.core.seen_cards import SeenCards
+from src.game.game_state import GameState
+from src.game.wizard_card import CARDS_BY_ID, CardSuit, CardType, WizardCard, card_to_id
+from src.game.wizard_card_factory import create_wizard_cards
+from src.ai.simple_agent import WizardSimpleBot
+from src.server.protocol import StateDeltaDecoder, StateDeltaEncoder
+from tests.helpers import play
+
+
+def test_cards_carry_their_id():
+    assert [card_to_id(card) for card in CARDS_BY_ID] == list(range(len(CARDS_BY_ID)))
+    for card in create_wizard_cards():
+        copy = WizardCard(card.card_type, card.card_suit, card.card_value)
+        assert copy == card and hash(copy) == hash(card) and copy.card_id == card.card_id
+        assert pickle.loads(pickle.dumps(card)).card_id == card.card_id
+    assert WizardCard(CardType.STANDARD, CardSuit.HEARTS, 7) != WizardCard(CardType.STANDARD, CardSuit.SPADES, 7)
+    assert WizardCard(CardType.WIZARD) != WizardCard(CardType.JESTER)
+
+
+def test_add_updates_mask_counts_and_players():
+    alice, bob = WizardBasePlayer('alice'), WizardBasePlayer('bob')
+    seven = WizardCard(CardType.STANDARD, CardSuit.HEARTS, 7)
+    wizard = WizardCard(CardType.WIZARD)
+    seen = SeenCards()
+
+    seen.add(seven, alice)
+    seen.add(wizard, bob)
+    seen.add(wizard, alice)
+
+    assert seven in seen and WizardCard(CardType.STANDARD, CardSuit.HEARTS, 8) not in seen
+    assert seen.mask == 1 << card_to_id(seven) | 1 << card_to_id(wizard)
+    assert seen.count(wizard) == seen.wizards == 2 and seen.jesters == 0
+    assert seen.suit_count(CardSuit.HEARTS) == 1 and seen.suit_count(CardSuit.CLUBS) == 0
+    assert seen.played_by(seven) == (alice,)
+    assert seen.played_by(wizard) == (bob, alice)
+    assert seen.cards == (seven, wizard, wizard) and len(seen) == 3
+    # The tuples are built once per change
+    assert seen.cards is seen.cards and seen.players is seen.players
+
+    seen.reset()
+    assert len(seen) == 0 and seen.mask == 0 and seen.played_by(seven) == ()
+    assert seen.cards == () and seen.players == ()
+
+
+class RecordingBot(WizardSimpleBot):
+    def play_card(self, state):
+        # The view is live, so snapshot what it holds at decision time
+        self.observed.append((
+            state.seen_cards,
+            state.played_cards,
+            tuple(zip(state.seen_cards.players, state.seen_cards.cards)),
+            tuple(state.current_trick.trick_cards.items())
+        ))
+        return super().play_card(state)
+
+
+def test_game_state_shares_the_round_tracker():
+    bots = [RecordingBot(f'bot_{i}') for i in range(3)]
+    for bot in bots:
+        bot.observed = []
+    game = play(*bots)
+
+    observed = [entry for bot in bots for entry in bot.observed]
+    assert observed
+    for seen, played_cards, plays, trick in observed:
+        assert seen is game.current_round.seen_cards
+        assert tuple(card for _, card in plays) == played_cards
+        # Cards of the current trick are seen as soon as they are played
+        assert plays[len(plays) - len(trick):] == trick
+
+
+def test_protocol_round_trips_seen_cards():
+    alice, bob = WizardBasePlayer('alice'), WizardBasePlayer('bob')
+    jester = WizardCard(CardType.JESTER)
+    two = WizardCard(CardType.STANDARD, CardSuit.SPADES, 2)
+    seen = SeenCards()
+    seen.add(jester, alice)
+    seen.add(two, bob)
+    state = GameState(
+        players=(alice, bob), current_round_number=1, current_scores={alice: 0, bob: 0}, current_bets={},
+        trump_card=None, trump_suit=None, current_trick=None, won_tricks={alice: 0, bob: 0}, hand=(),
+        played_cards=seen.cards, seen_cards=seen,
+    )
+
+    decoded = StateDeltaDecoder(bob).decode(StateDeltaEncoder().encode(state))
+
+    assert decoded.seen_cards.cards == (jester, two)
+    assert decoded.seen_cards.played_by(two) == (bob,)
+    assert [p.name for p in decoded.seen_cards.played_by(jester)] == ['alice']
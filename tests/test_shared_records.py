@@ -0,0 +1,55 @@
+import multiprocessing
+
+import numpy as np
+
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.shared_records import SharedEvaluationRecords
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.wizard_environment import WizardEnvironment
+
+LINEUP = [WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot, WizardDebugPlayer]
+
+
+def write_rows(spec, worker_index):
+    shared = SharedEvaluationRecords.attach(spec)
+    try:
+        shared.records.scores[worker_index] = worker_index + 1
+        shared.progress[worker_index] += 1
+    finally:
+        shared.close()
+
+
+class TestSharedEvaluationRecords:
+    def test_workers_write_in_place(self):
+        with SharedEvaluationRecords.create(num_games=3, num_seats=4, num_workers=3) as shared:
+            assert (shared.records.seeds == -1).all()
+            assert shared.records.bets.shape == (3, 4, 15)
+
+            processes = [multiprocessing.Process(target=write_rows, args=(shared.spec, i)) for i in range(3)]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+            np.testing.assert_array_equal(shared.records.scores[:, 0], [1, 2, 3])
+            np.testing.assert_array_equal(shared.progress, [1, 1, 1])
+            copy = shared.copy()
+
+        np.testing.assert_array_equal(copy.scores[:, 3], [1, 2, 3])
+
+    def test_worker_evaluation_matches_in_process(self):
+        in_process = WizardEnvironment()
+        in_process.evaluate_players(LINEUP, num_games=7, seed=21)
+        in_workers = WizardEnvironment()
+        in_workers.evaluate_players(LINEUP, num_games=7, seed=21, workers=3)
+
+        np.testing.assert_array_equal(in_process.records.scores, in_workers.records.scores)
+        np.testing.assert_array_equal(in_process.records.diffs, in_workers.records.diffs)
+        assert in_workers.stats['WizardDebugPlayer']['total_games'] == 14
+
+    def test_unseeded_workers_play_different_games(self):
+        env = WizardEnvironment()
+        env.evaluate_players(LINEUP, num_games=4, workers=2)
+
+        assert (env.records.seeds == -1).all()
+        assert len({tuple(row) for row in env.records.bets.reshape(4, -1)}) == 4
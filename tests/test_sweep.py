@@ -0,0 +1,65 @@
+import pytest
+
+from src.ai import sweep
+from src.ai.adrian_agent import WizardAdrianPlayerV01
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.evaluation_records import EvaluationRecords
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.sweep import HyperparameterSweep, configure, grid
+from src.ai.wizard_environment import WizardEnvironment
+
+OPPONENTS = [WizardSimpleBot, WizardDebugPlayer]
+
+
+def test_configure_overrides_class_constants():
+    tuned = configure(WizardAdrianPlayerV01, {'win_points': 40, 'high_card_value': 11})
+
+    assert issubclass(tuned, WizardAdrianPlayerV01)
+    assert tuned.win_points == 40 and tuned.high_card_value == 11
+    assert WizardAdrianPlayerV01.win_points == 30
+    assert tuned.__name__ != configure(WizardAdrianPlayerV01, {'win_points': 41}).__name__
+
+    with pytest.raises(ValueError):
+        configure(WizardAdrianPlayerV01, {'no_such_constant': 1})
+
+
+def test_default_config_matches_plain_agent(tmp_path):
+    stats = WizardEnvironment().evaluate_players([WizardAdrianPlayerV01, *OPPONENTS], 6, seed=10)
+    [result] = HyperparameterSweep(WizardAdrianPlayerV01, OPPONENTS, str(tmp_path), seed=10).evaluate([{}], 6)
+
+    assert result.mean_score == pytest.approx(stats['WizardAdrianPlayerV01']['average_score'])
+
+
+def test_interrupted_sweep_resumes_from_cache(tmp_path, monkeypatch):
+    space = {'bid_offset': [-1, 0, 1]}
+    first = HyperparameterSweep(WizardSimpleBot, OPPONENTS, str(tmp_path)).grid_search(space, 4)
+
+    def fail(*args):
+        raise AssertionError('cached games were played again')
+    monkeypatch.setattr(sweep, 'play_game_into', fail)
+
+    again = HyperparameterSweep(WizardSimpleBot, OPPONENTS, str(tmp_path)).grid_search(space, 4)
+    assert again == first
+
+
+def test_successive_halving_drops_configs(tmp_path):
+    space = {'min_trump_value': [0, 7], 'bid_offset': [-1, 0, 1]}
+    search = HyperparameterSweep(WizardSimpleBot, OPPONENTS, str(tmp_path), workers=2)
+
+    results = search.successive_halving(space, min_games=2, max_games=18, eta=3)
+
+    assert len(grid(space)) == 6
+    assert len(results) == 1
+    assert results[0].games == 18
+
+
+def test_tied_winner_counts_as_win(tmp_path, monkeypatch):
+    records = EvaluationRecords.empty(2, 3)
+    records.scores[:] = [[50, 50, 0], [0, 30, 10]]
+    # Positions break ties by sort order, so a tied winner can be ranked second
+    records.positions[:] = [[2, 1, 3], [3, 1, 2]]
+    monkeypatch.setattr(sweep, '_evaluate_config', lambda *args: records)
+
+    [result] = HyperparameterSweep(WizardSimpleBot, OPPONENTS, str(tmp_path)).evaluate([{}], 2)
+
+    assert result.win_rate == 0.5
@@ -0,0 +1,63 @@
+import json
+import urllib.request
+
+import pytest
+
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.telemetry import OPENMETRICS_CONTENT_TYPE, Telemetry
+from src.ai.wizard_environment import WizardEnvironment
+
+LINEUP = [WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot]
+# 20 rounds of 3 bids and 3 * round cards
+DECISIONS_PER_GAME = 3 * 20 + 3 * sum(range(1, 21))
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_counts_games_and_decisions_per_agent(workers):
+    with Telemetry(interval=60) as telemetry:
+        WizardEnvironment(telemetry).evaluate_players(LINEUP, 4, seed=0, workers=workers)
+        snapshot = telemetry.last
+
+    assert snapshot['games'] == 4
+    assert snapshot['decisions'] == 4 * DECISIONS_PER_GAME
+    assert set(snapshot['agents']) == {'WizardSimpleBot', 'WizardDebugPlayer'}
+    assert snapshot['agents']['WizardSimpleBot']['decisions'] == 2 * snapshot['agents']['WizardDebugPlayer']['decisions']
+    assert snapshot['agents']['WizardSimpleBot']['mean_latency_us'] > 0
+    assert snapshot['agents']['WizardSimpleBot']['exceptions'] == 0
+    assert len(snapshot['worker_utilization']) == max(workers, 1)
+    assert snapshot['rss_bytes'] > 0
+
+
+def test_results_do_not_change_with_telemetry():
+    plain = WizardEnvironment().evaluate_players(LINEUP, 3, seed=5)
+    with Telemetry(interval=60) as telemetry:
+        measured = WizardEnvironment(telemetry).evaluate_players(LINEUP, 3, seed=5)
+
+    for name in plain:
+        assert plain[name]['total_score'] == measured[name]['total_score']
+        assert plain[name]['wins'] == measured[name]['wins']
+
+
+def test_jsonl_file_rotates(tmp_path):
+    path = tmp_path / 'telemetry.jsonl'
+    with Telemetry(interval=60, jsonl_path=str(path), max_bytes=1, backups=2) as telemetry:
+        for seed in range(4):
+            WizardEnvironment(telemetry).evaluate_players(LINEUP, 1, seed=seed)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['telemetry.jsonl', 'telemetry.jsonl.1', 'telemetry.jsonl.2']
+    assert json.loads(path.read_text())['games'] == 1
+
+
+def test_openmetrics_endpoint():
+    with Telemetry(interval=60, http_address=('127.0.0.1', 0)) as telemetry:
+        WizardEnvironment(telemetry).evaluate_players(LINEUP, 2, seed=0)
+        host, port = telemetry.http_address
+        with urllib.request.urlopen(f'http://{host}:{port}/metrics') as response:
+            content_type = response.headers['Content-Type']
+            body = response.read().decode()
+
+    assert content_type == OPENMETRICS_CONTENT_TYPE
+    assert 'wizard_games_total 2' in body
+    assert f'wizard_decisions_total{{agent="WizardDebugPlayer"}} {2 * DECISIONS_PER_GAME // 3}' in body
+    assert body.endswith('# EOF\n')
@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pytest
+
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.simple_agent import WizardSimpleBot
+from src.core.tracing import Tracer, tracing
+from src.core.trick import Trick
+from src.game.game_state import GameState
+from src.game.wizard_game import play_games_async
+from tests.helpers import final_scores, make_game, play
+
+
+LINEUP = [WizardSimpleBot, WizardDebugPlayer, WizardSimpleBot]
+
+
+def test_traced_functions_are_only_wrapped_while_tracing():
+    determine_winner = Trick.determine_winner
+    from_game = GameState.__dict__['from_game']
+
+    with tracing(Tracer()):
+        assert Trick.determine_winner is not determine_winner
+        with pytest.raises(RuntimeError):
+            with tracing(Tracer()):
+                pass
+
+    assert Trick.determine_winner is determine_winner
+    assert GameState.__dict__['from_game'] is from_game
+
+
+def test_sampled_game_records_every_phase(tmp_path):
+    with tracing(Tracer()) as tracer:
+        scores = final_scores(play(*LINEUP, seed=1))
+
+    names = [event[0] for event in tracer.events]
+    assert names.count('game') == 1
+    assert names.count('round') == 20
+    assert names.count('bidding') == 20
+    assert names.count('trick') == names.count('trick.determine_winner') == sum(range(1, 21))
+    assert names.count('agent') == 3 * 20 + 3 * sum(range(1, 21))
+    assert names.count('game_state.from_game') == names.count('agent')
+    assert 'deck.shuffle' in names and 'deck.deal' in names
+
+    # Spans nest inside the game span
+    game = next(event for event in tracer.events if event[0] == 'game')
+    assert all(game[1] <= start and end <= game[2] for _, start, end, _, _ in tracer.events)
+
+    # Tracing does not touch the game's random state
+    assert scores == final_scores(play(*LINEUP, seed=1))
+
+    path = tmp_path / 'trace.json'
+    tracer.save_chrome_trace(str(path))
+    trace = json.loads(path.read_text())
+    agent = next(event for event in trace['traceEvents'] if event['name'] == 'agent')
+    assert agent['ph'] == 'X' and agent['dur'] >= 0
+    assert agent['args']['kind'] in ('bid', 'play_card')
+
+
+def test_sampling_rate_and_event_limit():
+    with tracing(Tracer(sample_rate=0.0)) as tracer:
+        play(*LINEUP, seed=2)
+    assert tracer.events == [] and tracer.sampled_games == 0
+
+    with tracing(Tracer(max_events=50)) as tracer:
+        play(*LINEUP, seed=3)
+        play(*LINEUP, seed=4)
+    assert len(tracer.events) == 50
+    assert tracer.sampled_games == 1
+
+
+class AsyncBot(WizardSimpleBot):
+    """Simple bot yielding to the event loop before every decision."""
+
+    async def make_bid(self, state) -> int:
+        await asyncio.sleep(0)
+        return super().make_bid(state)
+
+    async def play_card(self, state):
+        await asyncio.sleep(0)
+        return super().play_card(state)
+
+
+def test_concurrent_games_keep_their_sampling_decision():
+    games = [make_game(AsyncBot, AsyncBot, AsyncBot) for _ in range(8)]
+
+    with tracing(Tracer(sample_rate=0.5, seed=0)) as tracer:
+        asyncio.run(play_games_async(games))
+
+    names = [event[0] for event in tracer.events]
+    assert 0 < tracer.sampled_games < len(games)
+    # Interleaved games record the spans of the sampled games only, all of them
+    assert names.count('game') == tracer.sampled_games
+    assert names.count('round') == 20 * tracer.sampled_games
+    assert names.count('agent') == tracer.sampled_games * (3 * 20 + 3 * sum(range(1, 21)))
@@ -0,0 +1,88 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.ai.simple_agent import WizardSimpleBot
+from src.core.trick_history import NO_TRICK
+from src.core.trick_kernel import NO_TRUMP, trick_winners
+from src.game.wizard_card import SUIT_INDEX
+from tests.helpers import play
+
+
+class TrumpRecordingBot(WizardSimpleBot):
+    def play_card(self, state):
+        self.trumps[state.current_round_number] = state.trump_suit
+        self.histories.add(id(state.trick_history))
+        return super().play_card(state)
+
+
+def recording_bots(num_players):
+    trumps, histories = {}, set()
+    bots = [TrumpRecordingBot(f'bot_{i}') for i in range(num_players)]
+    for bot in bots:
+        bot.trumps, bot.histories = trumps, histories
+    return bots, trumps, histories
+
+
+def test_history_records_every_trick():
+    bots, trumps, histories = recording_bots(4)
+    game = play(*bots)
+    history = game.trick_history
+
+    assert histories == {id(history)}
+    assert history.num_seats == 4 and len(history.num_tricks) == 15
+    np.testing.assert_array_equal(history.num_tricks, np.arange(1, 16))
+    for round_number in range(1, 16):
+        tricks = history.round(round_number)
+        assert tricks.cards.shape == (round_number, 4)
+        assert (history.cards[round_number - 1, round_number:] == NO_TRICK).all()
+
+        # Winners agree with the batched trick resolution
+        trump = SUIT_INDEX[trumps[round_number]] if trumps[round_number] else NO_TRUMP
+        seat_cards = np.empty_like(tricks.cards)
+        for offset in range(4):
+            seat_cards[np.arange(round_number), (tricks.leads + offset) % 4] = tricks.cards[:, offset]
+        np.testing.assert_array_equal(trick_winners(seat_cards, trump, tricks.leads), tricks.winners)
+
+        # Every trick after the first is led by the winner of the previous one
+        np.testing.assert_array_equal(tricks.leads[1:], tricks.winners[:-1])
+
+
+def test_history_matches_won_tricks():
+    game = play(*[WizardSimpleBot] * 3, seed=3)
+    history = game.trick_history
+    last_round = history.round(20)
+
+    for player, won in game.current_round.won_tricks.items():
+        assert (last_round.winners == history.seat(player)).sum() == won
+
+
+def test_history_is_read_only_and_survives_reset():
+    game = play(*[WizardSimpleBot] * 4)
+    history = game.trick_history
+    with pytest.raises(ValueError):
+        history.cards[0, 0, 0] = 0
+
+    cards = history.cards.copy()
+    game.reset()
+    assert game.trick_history is None
+    np.testing.assert_array_equal(history.cards, cards)
+
+
+def test_engine_does_not_import_numpy():
+    code = (
+        'import sys\n'
+        'from src.ai.simple_agent import WizardSimpleBot\n'
+        'from tests.helpers import play\n'
+        'game = play(WizardSimpleBot, WizardSimpleBot, WizardSimpleBot)\n'
+        'print("numpy" in sys.modules)\n'
+        'print(game.trick_history.num_tricks.sum(), "numpy" in sys.modules)'
+    )
+    # The history is written without NumPy, reading the arrays imports it
+    output = subprocess.run(
+        [sys.executable, '-c', code], cwd=Path(__file__).parents[1], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.split() == ['False', '210', 'True']
@@ -0,0 +1,67 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.core.player import WizardBasePlayer
+from src.core.trick import Trick
+from src.core.trick_kernel import NO_TRUMP, trick_winners
+from src.game.wizard_card import JESTER_ID, SUIT_INDEX, WIZARD_ID, CardSuit, card_from_id, card_to_id
+from src.game.wizard_card_factory import create_wizard_cards
+
+
+class DummyPlayer(WizardBasePlayer):
+    pass
+
+
+def reference_winner(cards_in_seat_order, trump_suit, lead):
+    """Seat winning the trick according to Trick.determine_winner."""
+    num_seats = len(cards_in_seat_order)
+    players = [DummyPlayer(f'p{seat}') for seat in range(num_seats)]
+    order = [(lead + i) % num_seats for i in range(num_seats)]
+
+    trick = Trick([players[seat] for seat in order], {}, trump_suit, lambda player: None)
+    for seat in order:
+        trick.trick_cards[players[seat]] = card_from_id(cards_in_seat_order[seat])
+    return players.index(trick.determine_winner())
+
+
+@pytest.mark.parametrize('num_seats', [3, 4, 5, 6])
+def test_matches_determine_winner_on_random_tricks(num_seats):
+    rng = random.Random(num_seats)
+    deck = [card_to_id(card) for card in create_wizard_cards()]
+    suits = [None] + list(CardSuit)
+
+    cards, trumps, leads, expected = [], [], [], []
+    for _ in range(3000):
+        trick = rng.sample(deck, num_seats)
+        trump_suit = rng.choice(suits)
+        lead = rng.randrange(num_seats)
+
+        cards.append(trick)
+        trumps.append(SUIT_INDEX[trump_suit] if trump_suit else NO_TRUMP)
+        leads.append(lead)
+        expected.append(reference_winner(trick, trump_suit, lead))
+
+    winners = trick_winners(np.array(cards), np.array(trumps), np.array(leads))
+    np.testing.assert_array_equal(winners, expected)
+
+
+def test_special_cases():
+    hearts = SUIT_INDEX[CardSuit.HEARTS] * 13
+    spades = SUIT_INDEX[CardSuit.SPADES] * 13
+    cards = np.array([
+        [JESTER_ID, JESTER_ID, JESTER_ID],       # only Jesters: leader wins
+        [hearts + 3, WIZARD_ID, WIZARD_ID],      # first Wizard in play order (seat 2 leads) wins
+        [JESTER_ID, spades + 1, hearts + 12],    # suit set by the first standard card
+        [hearts + 12, spades + 0, hearts + 5],   # lowest trump beats the trick suit
+    ])
+    trump = np.array([NO_TRUMP, NO_TRUMP, NO_TRUMP, SUIT_INDEX[CardSuit.SPADES]])
+    lead = np.array([1, 2, 0, 0])
+
+    np.testing.assert_array_equal(trick_winners(cards, trump, lead), [1, 2, 1, 1])
+
+
+def test_scalar_trump_and_lead():
+    cards = np.array([[0, 1, 2], [5, 4, 3]])
+    np.testing.assert_array_equal(trick_winners(cards, NO_TRUMP, 0), [2, 0])
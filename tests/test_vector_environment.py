@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from src.ai.simple_agent import WizardSimpleBot
+from src.ai.vector_environment import WizardVectorEnv, ACTION_SIZE, CARD_ACTION_OFFSET
+
+
+def random_actions(step, rng):
+    return np.array([rng.choice(np.flatnonzero(mask)) for mask in step.action_masks])
+
+
+def play_until_done(env, rng):
+    step = env.reset()
+    total_rewards = np.zeros((env.num_envs, env.num_players))
+    finished = np.zeros(env.num_envs, dtype=bool)
+    final_scores = np.zeros((env.num_envs, env.num_players))
+
+    while not finished.all():
+        step = env.step(random_actions(step, rng))
+        total_rewards[~finished] += step.rewards[~finished]
+        final_scores[step.dones & ~finished] = step.final_scores[step.dones & ~finished]
+        finished |= step.dones
+
+    return total_rewards, final_scores
+
+
+class TestWizardVectorEnv:
+    def test_reset_shapes(self):
+        env = WizardVectorEnv(4, num_players=3, opponents=[WizardSimpleBot], seed=0)
+        step = env.reset()
+
+        assert step.observations.shape == (4, env.observation_size)
+        assert step.action_masks.shape == (4, ACTION_SIZE)
+        assert step.rewards.shape == (4, 3)
+        assert not step.dones.any()
+        # The first decision of every game is a round 1 bid: 0 or 1
+        assert step.action_masks[:, :2].all()
+        assert not step.action_masks[:, 2:].any()
+        # Only policy seats are asked
+        assert set(step.seats) <= {0, 1}
+
+    def test_rewards_add_up_to_final_scores(self):
+        env = WizardVectorEnv(3, num_players=3, opponents=[WizardSimpleBot, WizardSimpleBot], seed=1)
+        total_rewards, final_scores = play_until_done(env, np.random.default_rng(1))
+
+        np.testing.assert_array_equal(total_rewards, final_scores)
+
+    def test_card_actions_are_legal_cards(self):
+        env = WizardVectorEnv(2, num_players=4, seed=2)
+        step = env.reset()
+        rng = np.random.default_rng(2)
+
+        while not step.action_masks[:, CARD_ACTION_OFFSET:].any():
+            step = env.step(random_actions(step, rng))
+
+        # Tables are in lockstep with all policy seats, so all are playing cards now
+        assert not step.action_masks[:, :CARD_ACTION_OFFSET].any()
+
+    def test_invalid_action_raises(self):
+        env = WizardVectorEnv(1, num_players=3, seed=3)
+        env.reset()
+
+        with pytest.raises(ValueError):
+            env.step(np.array([5]))
+
+    @pytest.mark.parametrize('num_workers', [0, 2])
+    def test_invalid_action_leaves_every_table_untouched(self, num_workers):
+        with WizardVectorEnv(4, num_players=3, num_workers=num_workers, seed=5) as env:
+            actions = random_actions(env.reset(), np.random.default_rng(5))
+            bad_actions = actions.copy()
+            bad_actions[-1] = 5
+
+            with pytest.raises(ValueError):
+                env.step(bad_actions)
+            step = env.step(actions)
+
+        with WizardVectorEnv(4, num_players=3, num_workers=num_workers, seed=5) as reference:
+            reference.reset()
+            expected = reference.step(actions)
+
+        np.testing.assert_array_equal(step.observations, expected.observations)
+        np.testing.assert_array_equal(step.seats, expected.seats)
+
+    def test_requires_policy_seat(self):
+        with pytest.raises(ValueError):
+            WizardVectorEnv(1, num_players=3, opponents=[WizardSimpleBot] * 3)
+
+    def test_subprocess_workers(self):
+        with WizardVectorEnv(4, num_players=3, opponents=[WizardSimpleBot], num_workers=2, seed=4) as env:
+            total_rewards, final_scores = play_until_done(env, np.random.default_rng(4))
+
+        np.testing.assert_array_equal(total_rewards, final_scores)
@@ -0,0 +1,127 @@
+from math import comb
+from types import MappingProxyType
+
+import numpy as np
+import pytest
+
+from src.ai.adrian_agent import WizardAdrianPlayerV01
+from src.ai.debug_agent import WizardDebugPlayer
+from src.ai.win_probability import (
+    DECK_SIZE, card_win_probability, card_win_probability_batch, no_threat_probability, no_threat_probability_batch,
+    seen_card_counts
+)
+from src.core.trick_kernel import NO_TRUMP, trick_winners
+from src.game.game_state import GameState
+from src.game.wizard_card import (
+    CardSuit, CardType, JESTER_ID, SUIT_INDEX, WIZARD_ID, WizardCard, card_from_id, card_to_id
+)
+from src.game.wizard_card_factory import create_wizard_cards
+
+
+def test_matches_sequential_product():
+    for unknown, threats, opponents in [(58, 17, 2), (58, 4, 5), (40, 0, 3), (10, 10, 1), (3, 1, 3)]:
+        expected = 1.0
+        for i in range(opponents):
+            expected *= (unknown - threats - i) / (unknown - i)
+        assert no_threat_probability(unknown, threats, opponents) == pytest.approx(max(expected, 0.0), abs=1e-15)
+        assert no_threat_probability(unknown, threats, opponents) == comb(unknown - threats, opponents) / comb(unknown, opponents)
+
+
+def test_batch_matches_scalar():
+    unknown, threats, opponents = np.meshgrid(np.arange(1, DECK_SIZE + 1), np.arange(0, 20), np.arange(0, 6), indexing='ij')
+    unknown, threats, opponents = unknown.ravel(), threats.ravel(), opponents.ravel()
+    keep = threats <= unknown
+    unknown, threats, opponents = unknown[keep], threats[keep], opponents[keep]
+
+    batch = no_threat_probability_batch(unknown, threats, opponents)
+    scalar = [no_threat_probability(int(u), int(t), int(o)) for u, t, o in zip(unknown, threats, opponents)]
+    np.testing.assert_allclose(batch, scalar, rtol=1e-12)
+
+
+def first_round_state(agent, seat, num_players, card, trump_card):
+    players = [WizardDebugPlayer(f'p{i}') for i in range(num_players)]
+    players[seat] = agent
+    empty = MappingProxyType({})
+    return GameState(
+        players=tuple(players),
+        current_round_number=1,
+        current_scores=MappingProxyType({p: 0 for p in players}),
+        current_bets=empty,
+        trump_card=trump_card,
+        trump_suit=trump_card.card_suit,
+        current_trick=None,
+        won_tricks=MappingProxyType({p: 0 for p in players}),
+        hand=(card,),
+        played_cards=(),
+    )
+
+
+def simulated_win_rate(card, trump_card, seat, num_players, samples=40000):
+    """Deal the unseen cards to the opponents at random and resolve the first trick with the kernel."""
+    rng = np.random.default_rng(0)
+    deck = [card_to_id(c) for c in create_wizard_cards()]
+    deck.remove(card_to_id(card))
+    deck.remove(card_to_id(trump_card))
+    deck = np.array(deck)
+
+    opponents = np.argsort(rng.random((samples, len(deck))), axis=1)[:, :num_players - 1]
+    cards = np.empty((samples, num_players), dtype=np.int64)
+    cards[:, [s for s in range(num_players) if s != seat]] = deck[opponents]
+    cards[:, seat] = card_to_id(card)
+
+    trump = SUIT_INDEX[trump_card.card_suit] if trump_card.card_suit else NO_TRUMP
+    return (trick_winners(cards, trump, 0) == seat).mean()
+
+
+HEARTS_5 = WizardCard(CardType.STANDARD, CardSuit.HEARTS, 5)
+SPADES_7 = WizardCard(CardType.STANDARD, CardSuit.SPADES, 7)
+
+
+@pytest.mark.parametrize('card, trump_card, seat, num_players', [
+    (WizardCard(CardType.STANDARD, CardSuit.HEARTS, 11), SPADES_7, 0, 4),
+    (WizardCard(CardType.STANDARD, CardSuit.HEARTS, 12), SPADES_7, 2, 3),
+    (WizardCard(CardType.STANDARD, CardSuit.SPADES, 9), SPADES_7, 1, 5),
+    (WizardCard(CardType.WIZARD), HEARTS_5, 3, 6),
+    (WizardCard(CardType.JESTER), HEARTS_5, 0, 3),
+    (WizardCard(CardType.STANDARD, CardSuit.CLUBS, 13), WizardCard(CardType.JESTER), 1, 4),
+])
+def test_first_round_win_probability_matches_simulation(card, trump_card, seat, num_players):
+    probability = card_win_probability(card, [card], trump_card, [], seat, num_players)
+
+    assert probability == pytest.approx(simulated_win_rate(card, trump_card, seat, num_players), abs=0.01)
+
+
+def test_batch_win_probability_matches_scalar():
+    rng = np.random.default_rng(0)
+    deck = create_wizard_cards()
+    cards, seen, trumps, seats, num_players, expected = [], [], [], [], [], []
+    for _ in range(300):
+        players = int(rng.integers(3, 7))
+        order = rng.permutation(len(deck))
+        hand = [deck[i] for i in order[:int(rng.integers(1, 8))]]
+        played = [deck[i] for i in order[10:10 + int(rng.integers(0, 20))]]
+        trump_card = deck[order[-1]] if rng.random() < 0.9 else None
+        trump_suit = trump_card.card_suit if trump_card is not None else None
+        seat = int(rng.integers(0, players))
+
+        card = hand[0]
+        cards.append(card_to_id(card))
+        seen.append(seen_card_counts(hand, trump_card, played))
+        trumps.append(SUIT_INDEX[trump_suit] if trump_suit else NO_TRUMP)
+        seats.append(seat)
+        num_players.append(players)
+        expected.append(card_win_probability(card, hand, trump_card, played, seat, players))
+
+    batch = card_win_probability_batch(np.array(cards), np.array(seen), np.array(trumps), np.array(seats), np.array(num_players))
+    np.testing.assert_allclose(batch, expected, rtol=1e-12, atol=1e-15)
+
+
+def test_expected_value_in_later_rounds():
+    agent = WizardAdrianPlayerV01('adrian')
+    state = first_round_state(agent, 1, 4, HEARTS_5, SPADES_7)
+    hand = tuple(card_from_id(i) for i in (0, 14, 30, WIZARD_ID, JESTER_ID))
+    state = GameState(**{**state.__dict__, 'current_round_number': 5, 'hand': hand})
+
+    for card in hand:
+        assert agent.lose_points <= agent.expected_value(state, card) <= agent.win_points
+    assert agent.expected_value(state, hand[3]) > agent.expected_value(state, hand[4])